@@ -1,13 +1,312 @@
+import argparse
 import os
+import subprocess
+import sys
+import threading
 import time
 
-def auto_push():
+try:
+    # 있으면 OS 파일 변경 알림(inotify/FSEvents/ReadDirectoryChangesW) 사용, 없으면 폴링
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+# gitcontrol 의 Git 작업/백엔드 모듈 위치
+GITCONTROL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gitcontrol')
+
+
+def git(repo_path, *args):
+    return subprocess.run(['git', *args], cwd=repo_path, capture_output=True, text=True)
+
+
+class ShellBackend:
+    """git 명령을 매번 실행하는 백엔드 (GitPython 이 없을 때)"""
+
+    def __init__(self, repo_path):
+        self.repo_path = repo_path
+
+    def commit(self, message):
+        # 바뀐 내용이 있을 때만 커밋 (빈 커밋/“nothing to commit” 오류 없음). 커밋했으면 True
+        git(self.repo_path, 'add', '-A')
+        if git(self.repo_path, 'diff', '--cached', '--quiet').returncode == 0:
+            return False
+        result = git(self.repo_path, 'commit', '-m', message)
+        if result.returncode != 0:
+            print(f"커밋 실패: {result.stderr.strip()}")
+            return False
+        return True
+
+    def push(self, remote, branch):
+        result = git(self.repo_path, 'push', remote, branch)
+        if result.returncode != 0:
+            print(f"푸시 실패: {result.stderr.strip()}")
+        return result.returncode == 0
+
+
+def make_backend(repo_path, name='gitpython'):
+    # 기본은 저장소를 열어 두고 프로세스 안에서 처리하는 GitPython 백엔드. 불러올 수 없으면 셸 백엔드
+    if name == 'shell':
+        return ShellBackend(repo_path)
+    sys.path.insert(0, GITCONTROL_DIR)
+    try:
+        from commit_backend import BACKENDS
+        return BACKENDS[name](repo_path)
+    except ImportError as e:
+        print(f"{name} 백엔드를 쓸 수 없어 git 명령으로 실행합니다. ({e})")
+        return ShellBackend(repo_path)
+
+
+class ChangeWatcher:
+    """작업 폴더(.git 제외)의 변경을 감지해서 알려주는 감시기 (watchdog 없으면 무시되지 않은 파일만 stat 폴링)"""
+
+    def __init__(self, repo_path, poll_interval=2.0):
+        self.repo_path = os.path.abspath(repo_path)
+        self.poll_interval = poll_interval
+        self._event = threading.Event()
+        self._stop = threading.Event()
+        self._observer = None
+        self._thread = None
+
+    def start(self):
+        if Observer is not None:
+            watcher = self
+
+            class Handler(FileSystemEventHandler):
+                def on_any_event(self, event):
+                    watcher._on_path_changed(event.src_path)
+                    watcher._on_path_changed(getattr(event, 'dest_path', '') or '')
+
+            self._observer = Observer()
+            self._observer.schedule(Handler(), self.repo_path, recursive=True)
+            self._observer.start()
+        else:
+            self._thread = threading.Thread(target=self._poll, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+
+    def wait(self, timeout=None):
+        # 변경이 있으면 True, timeout 동안 없으면 False
+        fired = self._event.wait(timeout)
+        self._event.clear()
+        return fired
+
+    def _on_path_changed(self, path):
+        if not path:
+            return
+        rel_path = os.path.relpath(path, self.repo_path)
+        if rel_path.split(os.sep, 1)[0] != '.git':
+            self._event.set()
+
+    def _snapshot(self):
+        # 파일별 (경로, 수정 시각, 크기)를 순서와 무관하게 합친 값 (전체 목록을 메모리에 들고 있지 않음)
+        # .gitignore 에 걸리는 폴더(node_modules 등)는 들어가지 않음. 규칙은 매번 새로 읽어서 .gitignore 변경도 반영
+        # (폴링 한 번의 비용은 무시되지 않은 파일 수에 비례하므로 큰 저장소는 watchdog 을 설치해서 쓸 것)
+        ignore = make_ignore_rules(self.repo_path)
+        total = 0
+        stack = ['']
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                with os.scandir(os.path.join(self.repo_path, rel_dir)) as entries:
+                    entries = list(entries)
+            except OSError:
+                continue
+            if ignore is not None:
+                ignore.load_dir(rel_dir, any(entry.name == '.gitignore' for entry in entries))
+            for entry in entries:
+                rel_path = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != '.git' and (ignore is None or not ignore.matches(rel_path, True)):
+                            stack.append(rel_path)
+                        continue
+                    if ignore is not None and ignore.matches(rel_path, False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                total = (total + hash((rel_path, st.st_mtime_ns, st.st_size))) & 0xFFFFFFFFFFFFFFFF
+        return total
+
+    def _poll(self):
+        last = self._snapshot()
+        while not self._stop.wait(self.poll_interval):
+            current = self._snapshot()
+            if current != last:
+                last = current
+                self._event.set()
+
+
+def make_ignore_rules(repo_path):
+    # 폴링 감시기가 무시된 폴더를 건너뛰도록 gitcontrol 의 .gitignore 해석기 사용 (불러올 수 없으면 None: 전부 훑음)
+    # 폴링마다 불리므로 sys.path 에는 한 번만 추가
+    if GITCONTROL_DIR not in sys.path:
+        sys.path.insert(0, GITCONTROL_DIR)
+    try:
+        from gitignore import IgnoreRules
+    except ImportError:
+        return None
+    return IgnoreRules(repo_path)
+
+
+def build_images(repo_path):
+    # 커밋 전에 images/ 파생 이미지를 갱신 (캐시에 없는 원본만 변환)
+    sys.path.insert(0, GITCONTROL_DIR)
+    try:
+        from image_build import build
+        result = build(repo_path)
+    except Exception as e:
+        print(f"이미지 변환 실패: {e}")
+        return
+    if result['processed'] or result['removed']:
+        print(f"이미지 변환: 새로 변환 {result['processed']}개, 삭제 {result['removed']}개")
+
+
+def make_prefetcher(repo_path, remote='origin'):
+    # 쉬는 동안 원격 브랜치를 refs/prefetch/ 아래로 미리 받아 둠 (막 받아 두었으면 GUI/명령줄의 다운로드가 네트워크 없이 끝남)
+    sys.path.insert(0, GITCONTROL_DIR)
+    try:
+        from prefetch import Prefetcher
+    except ImportError as e:
+        print(f"미리 받기를 쓸 수 없습니다. ({e})")
+        return None
+    return Prefetcher(repo_path, remote)
+
+
+def wait_until_quiet(watcher, debounce, max_delay):
+    # 연달아 저장되는 변경을 한 번으로 묶음: debounce 초 동안 조용하거나 max_delay 초가 지나면 반환
+    deadline = time.monotonic() + max_delay
+    while time.monotonic() < deadline:
+        if not watcher.wait(min(debounce, max(0, deadline - time.monotonic()))):
+            return
+
+
+def run_daemon(repo_path='.', remote='origin', branch='main', message='자동 커밋',
+               debounce=2.0, max_delay=30.0, poll_interval=2.0, retry_delay=5.0, max_backoff=600.0,
+               backend='gitpython', images=False, prefetch=False):
+    # 변경이 생길 때만 커밋/푸시하는 상주 모드. 변경이 없으면 대기만 함 (prefetch: 그동안 원격을 미리 받음)
+    backend = make_backend(repo_path, backend)
+    prefetcher = make_prefetcher(repo_path, remote) if prefetch else None
+    watcher = ChangeWatcher(repo_path, poll_interval)
+    watcher.start()
+    mode = 'watchdog' if Observer is not None else f'{poll_interval}초 폴링, watchdog 을 설치하면 폴링 없이 감시'
+    print(f"자동 푸시 대기 중 ({mode}, 변경 후 {debounce}초 뒤 커밋)")
+    # 시작할 때 남아 있는 변경과 지난번에 실패한 푸시도 처리
+    dirty = True
+    push_pending = True
+    retry_at = 0.0
+    backoff = 0.0
+    try:
+        while True:
+            if dirty:
+                wait_until_quiet(watcher, debounce, max_delay)
+                if images:
+                    build_images(repo_path)
+                if backend.commit(message):
+                    push_pending = True
+                    retry_at = 0.0
+            if push_pending and time.monotonic() >= retry_at:
+                if backend.push(remote, branch):
+                    push_pending = False
+                    backoff = 0.0
+                    print("자동 푸시 완료!")
+                else:
+                    # 푸시 실패: 재시도 간격을 두 배씩 늘림 (최대 max_backoff 초)
+                    backoff = min(max_backoff, backoff * 2 if backoff else retry_delay)
+                    retry_at = time.monotonic() + backoff
+                    print(f"{backoff:.0f}초 후 다시 푸시합니다.")
+            if prefetcher is not None and not dirty and prefetcher.due():
+                error = prefetcher.error
+                prefetcher.run()
+                if prefetcher.error and prefetcher.error != error:
+                    print(f"미리 받기 실패: {prefetcher.error}")
+            timeout = max(0.0, retry_at - time.monotonic()) if push_pending else None
+            if prefetcher is not None:
+                timeout = prefetcher.delay() if timeout is None else min(timeout, prefetcher.delay())
+            dirty = watcher.wait(timeout)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stop()
+
+
+def auto_push(repo_path='.', remote='origin', branch='main', message='자동 커밋', interval=600,
+              backend='gitpython', images=False):
+    # 저장소는 한 번만 열고, 변경이 없는 주기에는 git 프로세스를 띄우지 않음
+    backend = make_backend(repo_path, backend)
     while True:
-        os.system('git add .')
-        os.system('git commit -m "자동 커밋"')
-        os.system('git push origin main')
-        print("자동 푸시 완료! 10분 후 다시 실행됩니다.")
-        time.sleep(600)  # 10분(600초)마다 반복
+        if images:
+            build_images(repo_path)
+        if backend.commit(message) and backend.push(remote, branch):
+            print(f"자동 푸시 완료! {interval // 60}분 후 다시 실행됩니다.")
+        time.sleep(interval)  # 기본 10분(600초)마다 반복
+
+
+def run_batch(repo_paths, operation='upload', message='자동 커밋', interval=600, workers=4, max_backoff=3600.0):
+    # 여러 저장소를 한 프로세스에서 동기화 (gitcontrol 의 Git 작업을 그대로 사용)
+    sys.path.insert(0, GITCONTROL_DIR)
+    from batch_sync import run_forever
+    kwargs = {'message': message} if operation in ('upload', 'sync_local_to_git') else {}
+    try:
+        run_forever(repo_paths, operation, interval, workers, max_backoff, **kwargs)
+    except KeyboardInterrupt:
+        pass
+
+
+def read_repo_list(path):
+    # 한 줄에 저장소 경로 하나 ('#' 으로 시작하는 줄과 빈 줄은 무시)
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='작업 폴더 변경을 자동으로 커밋/푸시')
+    parser.add_argument('repo_path', nargs='?', default='.')
+    parser.add_argument('--daemon', action='store_true', help='변경이 생길 때만 커밋/푸시하는 상주 모드')
+    parser.add_argument('--remote', default='origin')
+    parser.add_argument('--branch', default='main')
+    parser.add_argument('--message', default='자동 커밋')
+    parser.add_argument('--interval', type=int, default=600, help='고정 주기 모드의 반복 간격(초)')
+    parser.add_argument('--debounce', type=float, default=2.0, help='마지막 변경 후 커밋까지 기다리는 시간(초)')
+    parser.add_argument('--max-delay', type=float, default=30.0, help='변경이 계속될 때 최대 대기 시간(초)')
+    parser.add_argument('--poll', type=float, default=2.0,
+                        help='watchdog 이 없을 때 폴링 간격(초). 폴링마다 무시되지 않은 파일을 모두 stat 하므로 '
+                             '큰 저장소는 watchdog 설치를 권장')
+    parser.add_argument('--max-backoff', type=float, default=600.0, help='푸시 실패 시 최대 재시도 간격(초)')
+    parser.add_argument('--backend', default='gitpython', choices=['gitpython', 'dulwich', 'shell'],
+                        help='커밋 방식 (gitpython/dulwich: 프로세스 안에서 처리, shell: git 명령 실행)')
+    parser.add_argument('--build-images', action='store_true',
+                        help='커밋 전에 images/ 의 크기별 WebP/JPEG 파일을 갱신 (Pillow 필요)')
+    parser.add_argument('--prefetch', action='store_true',
+                        help='상주 모드에서 변경이 없는 동안 원격의 새 커밋을 미리 받아 둠 (작업 폴더는 바꾸지 않음)')
+    parser.add_argument('--repos', nargs='+', default=[], help='여러 저장소를 한 프로세스에서 동기화')
+    parser.add_argument('--repos-file', help='동기화할 저장소 목록 파일 (한 줄에 경로 하나)')
+    parser.add_argument('--operation', default='upload',
+                        choices=['upload', 'download', 'sync_local_to_git', 'sync_git_to_local', 'fetch',
+                                 'build_images'],
+                        help='실행할 작업 (upload 가 아니면 저장소 하나도 gitcontrol 의 Git 작업으로 실행)')
+    parser.add_argument('--workers', type=int, default=4, help='여러 저장소 모드에서 동시에 처리할 저장소 수')
+    args = parser.parse_args()
+    repo_paths = args.repos + (read_repo_list(args.repos_file) if args.repos_file else [])
+    if not repo_paths and args.operation != 'upload':
+        # 저장소 하나에 업로드 말고 다른 작업: gitcontrol 의 Git 작업을 주기마다 실행
+        repo_paths = [args.repo_path]
+    if repo_paths:
+        run_batch(repo_paths, args.operation, args.message, args.interval, args.workers, args.max_backoff)
+    elif args.daemon:
+        run_daemon(args.repo_path, args.remote, args.branch, args.message,
+                   args.debounce, args.max_delay, args.poll, max_backoff=args.max_backoff, backend=args.backend,
+                   images=args.build_images, prefetch=args.prefetch)
+    else:
+        auto_push(args.repo_path, args.remote, args.branch, args.message, args.interval, args.backend,
+                  args.build_images)
+
 
 if __name__ == "__main__":
-    auto_push() 
\ No newline at end of file
+    main()
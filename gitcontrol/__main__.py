@@ -0,0 +1,9 @@
+import os
+import sys
+
+# python -m gitcontrol: Qt 없이 Git 작업 실행 (cli.py). 모듈들은 이 폴더에서 바로 불러옴
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cli import main
+
+sys.exit(main())
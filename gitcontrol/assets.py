@@ -0,0 +1,417 @@
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# 큰 바이너리 파일(이미지 등) 처리 (Qt 비의존)
+# - 내용 앞부분으로 바이너리/이미지 판별 (확장자 없는 images/ 파일도 구분)
+# - stat(크기, 수정 시각, inode) → sha256 캐시: 바뀌지 않은 파일은 다시 읽지 않음
+# - 선택 사항: LFS 방식 포인터 + 로컬 폴더 객체 저장소. 저장소에는 작은 포인터만 커밋되어
+#   이미지가 늘어나도 push 크기와 커밋 시간이 거의 일정함
+#   git add(git 필터 프로세스)와 auto_push 의 GitPython 백엔드(clean_file)가 같은 포인터를 만듦
+
+FILTER_NAME = 'gitcontrol-assets'
+CONFIG_SECTION = 'gitcontrol'
+# 이 크기 이상인 바이너리 파일을 포인터로 바꿈
+LARGE_THRESHOLD = 64 * 1024
+# git 과 같은 기준: 앞 8000바이트에 NUL 이 있으면 바이너리
+SNIFF_SIZE = 8000
+POINTER_HEADER = b'version https://git-lfs.github.com/spec/v1\n'
+POINTER_MAX_SIZE = 200
+# 필터가 받은 내용을 이 크기까지는 메모리에, 넘으면 임시 파일에 보관
+SPOOL_SIZE = 16 * 1024 * 1024
+# 방금 수정된 파일은 같은 수정 시각 안에 다시 바뀔 수 있으므로 캐시하지 않음 (초)
+RACY_SECONDS = 2
+
+MAGIC_NUMBERS = [
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+    (b'%PDF-', 'application/pdf'),
+    (b'PK\x03\x04', 'application/zip'),
+]
+
+
+def sniff(head):
+    # 파일 앞부분 → 형식 ('image/png' 등). 텍스트면 None
+    for magic, mime in MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return mime
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    if head[4:8] == b'ftyp':
+        return 'image/avif' if head[8:12] in (b'avif', b'avis') else 'video/mp4'
+    if b'\0' in head[:SNIFF_SIZE]:
+        return 'application/octet-stream'
+    return None
+
+
+def is_large_binary(head, size, threshold=LARGE_THRESHOLD):
+    return size >= threshold and sniff(head) is not None
+
+
+def make_pointer(oid, size):
+    return POINTER_HEADER + f'oid sha256:{oid}\nsize {size}\n'.encode('ascii')
+
+
+def parse_pointer(data):
+    # 포인터 내용 → (oid, 크기). 포인터가 아니면 None
+    if len(data) > POINTER_MAX_SIZE or not data.startswith(POINTER_HEADER):
+        return None
+    fields = dict(line.split(' ', 1) for line in data[len(POINTER_HEADER):].decode('ascii', 'replace').splitlines()
+                  if ' ' in line)
+    oid = fields.get('oid', '')
+    if not oid.startswith('sha256:') or not fields.get('size', '').isdigit():
+        return None
+    return oid[len('sha256:'):], int(fields['size'])
+
+
+class HashCache:
+    """파일 stat → sha256 캐시 (.git/gitcontrol/assets-cache.json)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._dirty = False
+        try:
+            with open(path, encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    @staticmethod
+    def _key(st):
+        return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+    def get(self, rel_path, st):
+        entry = self._entries.get(rel_path)
+        if entry is not None and entry[:3] == self._key(st):
+            return entry[3]
+        return None
+
+    def put(self, rel_path, st, oid):
+        if st.st_mtime_ns >= (time.time() - RACY_SECONDS) * 1e9:
+            return
+        self._entries[rel_path] = self._key(st) + [oid]
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+class AssetStore:
+    """LFS 방식 로컬 객체 저장소 (sha256 → 원본 파일, 폴더는 oid 앞 4글자로 나눔)"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def object_path(self, oid):
+        return os.path.join(self.root, oid[:2], oid[2:4], oid)
+
+    def has(self, oid):
+        return os.path.exists(self.object_path(oid))
+
+    def put_stream(self, stream):
+        # 해시를 계산하면서 임시 파일에 복사하고, 처음 보는 내용일 때만 저장소에 넣음 → (oid, 크기)
+        os.makedirs(self.root, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix='incoming-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in iter(lambda: stream.read(1 << 20), b''):
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            oid = digest.hexdigest()
+            path = self.object_path(oid)
+            if os.path.exists(path):
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return oid, size
+
+
+class AssetConfig:
+    """저장소별 큰 파일 설정 (로컬 git 설정 + .git/info/attributes, 커밋되지 않음)"""
+
+    def __init__(self, git_dir, store_dir, patterns, threshold=LARGE_THRESHOLD):
+        self.store = AssetStore(store_dir)
+        self.cache = HashCache(os.path.join(git_dir, 'gitcontrol', 'assets-cache.json'))
+        self.patterns = patterns
+        self.threshold = threshold
+
+    @classmethod
+    def load(cls, repo):
+        # GitPython Repo 에서 설정을 읽음 (프로세스 실행 없음). 설정이 없으면 None
+        reader = repo.config_reader()
+        store_dir = reader.get_value(CONFIG_SECTION, 'assetstore', '')
+        if not store_dir:
+            return None
+        threshold = int(reader.get_value(CONFIG_SECTION, 'assetthreshold', LARGE_THRESHOLD))
+        return cls(repo.git_dir, store_dir, read_patterns(repo.git_dir), threshold)
+
+    def matches(self, rel_path):
+        # gitattributes 패턴과 같은 규칙: '/' 가 없는 패턴은 파일 이름과 비교
+        name = rel_path.rpartition('/')[2]
+        return any(fnmatch.fnmatchcase(rel_path if '/' in pattern else name, pattern.lstrip('/'))
+                   for pattern in self.patterns)
+
+    def clean(self, rel_path, stream, size, st=None):
+        # 작업 폴더 내용 → 저장소에 넣을 포인터. 큰 바이너리면 객체 저장소에 넣고 포인터 반환, 아니면 None
+        # st(작업 폴더 파일의 stat)가 캐시와 같으면 내용을 읽지 않음
+        if st is not None and st.st_size == size:
+            oid = self.cache.get(rel_path, st)
+            if oid is not None and self.store.has(oid):
+                return make_pointer(oid, size)
+        head = stream.read(SNIFF_SIZE)
+        if parse_pointer(head) is not None or not is_large_binary(head, size, self.threshold):
+            return None
+        oid, size = self.store.put_stream(_Prefixed(head, stream))
+        if st is not None and st.st_size == size:
+            self.cache.put(rel_path, st, oid)
+        return make_pointer(oid, size)
+
+    def clean_file(self, root, rel_path):
+        # 작업 폴더 파일 하나 → 포인터 (포인터로 바꾸지 않을 파일이면 None)
+        if not self.matches(rel_path):
+            return None
+        with open(os.path.join(root, rel_path), 'rb') as f:
+            st = os.fstat(f.fileno())
+            return self.clean(rel_path, f, st.st_size, st)
+
+
+class _Prefixed:
+    """이미 읽은 앞부분 + 나머지 스트림을 하나로 읽는 래퍼"""
+
+    def __init__(self, head, stream):
+        self._head = head
+        self._stream = stream
+
+    def read(self, size=-1):
+        if self._head:
+            data, self._head = self._head, b''
+            return data
+        return self._stream.read(size)
+
+
+def read_patterns(git_dir):
+    # .git/info/attributes 에서 이 필터를 쓰는 패턴 목록
+    patterns = []
+    try:
+        with open(os.path.join(git_dir, 'info', 'attributes'), encoding='utf-8') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) > 1 and f'filter={FILTER_NAME}' in parts[1:]:
+                    patterns.append(parts[0])
+    except OSError:
+        pass
+    return patterns
+
+
+# ---- git 장기 실행 필터 프로세스 (gitprotocol-long-running-process, pkt-line) ----
+PKT_MAX = 65516
+
+
+def read_pkt(stream):
+    # pkt-line 하나. flush(0000)면 None
+    header = stream.read(4)
+    if len(header) < 4:
+        raise EOFError()
+    length = int(header, 16)
+    if length == 0:
+        return None
+    return stream.read(length - 4)
+
+
+def write_pkt(stream, data):
+    stream.write(f'{len(data) + 4:04x}'.encode('ascii') + data)
+
+
+def write_flush(stream):
+    stream.write(b'0000')
+
+
+def read_text_list(stream):
+    items = []
+    while True:
+        pkt = read_pkt(stream)
+        if pkt is None:
+            return items
+        items.append(pkt.decode('utf-8', 'surrogateescape').rstrip('\n'))
+
+
+def write_content(stream, data):
+    for start in range(0, len(data), PKT_MAX):
+        write_pkt(stream, data[start:start + PKT_MAX])
+    write_flush(stream)
+
+
+class _PacketReader:
+    """flush 까지의 pkt-line 내용을 파일처럼 읽는 래퍼"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._buffer = b''
+        self._done = False
+
+    def read(self, size=-1):
+        while not self._done and (size < 0 or len(self._buffer) < size):
+            pkt = read_pkt(self._stream)
+            if pkt is None:
+                self._done = True
+            else:
+                self._buffer += pkt
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def drain(self):
+        while not self._done:
+            self.read(PKT_MAX)
+            self._buffer = b''
+
+
+def filter_process(config, stdin=None, stdout=None):
+    # git 이 명령마다 한 번 띄우는 필터 프로세스: clean(작업 폴더 → 저장소), smudge(저장소 → 작업 폴더)
+    stdin = stdin or sys.stdin.buffer
+    stdout = stdout or sys.stdout.buffer
+    if read_text_list(stdin) != ['git-filter-client', 'version=2']:
+        raise SystemExit('알 수 없는 필터 프로토콜')
+    for line in ('git-filter-server\n', 'version=2\n'):
+        write_pkt(stdout, line.encode())
+    write_flush(stdout)
+    capabilities = read_text_list(stdin)
+    for name in ('clean', 'smudge'):
+        if f'capability={name}' in capabilities:
+            write_pkt(stdout, f'capability={name}\n'.encode())
+    write_flush(stdout)
+    stdout.flush()
+    try:
+        while True:
+            headers = dict(item.split('=', 1) for item in read_text_list(stdin))
+            reader = _PacketReader(stdin)
+            rel_path = headers.get('pathname', '')
+            try:
+                if headers.get('command') == 'clean':
+                    # 내용은 git 이 보내 주므로 받아 두고, stat 이 캐시와 같으면 해시 계산 없이 포인터 반환
+                    content = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+                    for chunk in iter(lambda: reader.read(PKT_MAX), b''):
+                        content.write(chunk)
+                    size = content.tell()
+                    content.seek(0)
+                    try:
+                        st = os.stat(rel_path)
+                    except OSError:
+                        st = None
+                    data = config.clean(rel_path, content, size, st)
+                    if data is None:
+                        content.seek(0)
+                        data = content.read()
+                else:
+                    data = reader.read()
+                    pointer = parse_pointer(data)
+                    if pointer is not None and config.store.has(pointer[0]):
+                        with open(config.store.object_path(pointer[0]), 'rb') as f:
+                            data = f.read()
+            except OSError:
+                reader.drain()
+                write_pkt(stdout, b'status=error\n')
+                write_flush(stdout)
+                stdout.flush()
+                continue
+            write_pkt(stdout, b'status=success\n')
+            write_flush(stdout)
+            write_content(stdout, data)
+            # 내용 뒤의 상태 목록이 비어 있으면 success 유지
+            write_flush(stdout)
+            stdout.flush()
+    except EOFError:
+        pass
+    finally:
+        config.cache.save()
+
+
+def install(repo_path, store_dir, patterns=('images/**',), threshold=LARGE_THRESHOLD):
+    # 이 저장소에서만 필터를 켬 (로컬 설정과 .git/info/attributes 만 바꾸고 커밋되는 파일은 건드리지 않음)
+    def git_config(*args):
+        subprocess.run(['git', 'config', *args], cwd=repo_path, check=True)
+
+    git_dir = subprocess.run(['git', 'rev-parse', '--absolute-git-dir'], cwd=repo_path, check=True,
+                             capture_output=True, text=True).stdout.strip()
+    store_dir = os.path.abspath(store_dir)
+    script = os.path.abspath(__file__)
+    git_config(f'filter.{FILTER_NAME}.process', f'"{sys.executable}" "{script}" filter-process')
+    git_config(f'filter.{FILTER_NAME}.required', 'true')
+    git_config(f'{CONFIG_SECTION}.assetstore', store_dir)
+    git_config(f'{CONFIG_SECTION}.assetthreshold', str(threshold))
+    attributes = os.path.join(git_dir, 'info', 'attributes')
+    os.makedirs(os.path.dirname(attributes), exist_ok=True)
+    existing = read_patterns(git_dir)
+    with open(attributes, 'a', encoding='utf-8') as f:
+        for pattern in patterns:
+            if pattern not in existing:
+                f.write(f'{pattern} filter={FILTER_NAME} -diff -merge -text\n')
+
+
+def uninstall(repo_path):
+    git_dir = subprocess.run(['git', 'rev-parse', '--absolute-git-dir'], cwd=repo_path, check=True,
+                             capture_output=True, text=True).stdout.strip()
+    subprocess.run(['git', 'config', '--remove-section', f'filter.{FILTER_NAME}'], cwd=repo_path)
+    for key in ('assetstore', 'assetthreshold'):
+        subprocess.run(['git', 'config', '--unset', f'{CONFIG_SECTION}.{key}'], cwd=repo_path)
+    attributes = os.path.join(git_dir, 'info', 'attributes')
+    try:
+        with open(attributes, encoding='utf-8') as f:
+            lines = [line for line in f if f'filter={FILTER_NAME}' not in line.split()[1:]]
+    except OSError:
+        return
+    with open(attributes, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='큰 바이너리 파일을 로컬 객체 저장소 + 포인터로 관리')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('install', help='저장소에 필터 설정')
+    p.add_argument('repo_path')
+    p.add_argument('--store', required=True, help='객체 저장소 폴더')
+    p.add_argument('--pattern', action='append', help="대상 경로 패턴 (기본: 'images/**')")
+    p.add_argument('--threshold', type=int, default=LARGE_THRESHOLD, help='포인터로 바꿀 최소 크기(바이트)')
+    p = sub.add_parser('uninstall', help='필터 설정 제거')
+    p.add_argument('repo_path')
+    sub.add_parser('filter-process', help='git 이 실행하는 필터 프로세스')
+    args = parser.parse_args()
+    if args.command == 'install':
+        install(args.repo_path, args.store, args.pattern or ['images/**'], args.threshold)
+    elif args.command == 'uninstall':
+        uninstall(args.repo_path)
+    else:
+        # git 은 필터를 작업 폴더 최상위에서 실행함
+        from git import Repo
+        config = AssetConfig.load(Repo('.'))
+        if config is None:
+            raise SystemExit('gitcontrol.assetstore 설정이 없습니다.')
+        filter_process(config)
+
+
+if __name__ == '__main__':
+    main()
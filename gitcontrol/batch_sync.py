@@ -0,0 +1,91 @@
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from git import Repo, GitCommandError
+
+from git_ops import RemoteRunner, run_operation
+
+# 여러 저장소를 한 프로세스에서 주기적으로 동기화 (저장소마다 auto_push 를 따로 띄우지 않음). Qt 비의존
+
+
+def ssh_multiplex_env():
+    # 같은 원격 호스트로 가는 ssh 연결을 저장소들끼리 재사용 (OpenSSH ControlMaster)
+    # Windows OpenSSH 는 ControlMaster 를 지원하지 않고, 사용자가 ssh 명령을 정해 두었으면 건드리지 않음
+    if os.name == 'nt' or 'GIT_SSH_COMMAND' in os.environ or 'GIT_SSH' in os.environ:
+        return {}
+    control_dir = os.path.join(tempfile.gettempdir(), f'gitcontrol-ssh-{os.getuid()}')
+    os.makedirs(control_dir, mode=0o700, exist_ok=True)
+    return {'GIT_SSH_COMMAND': f'ssh -o ControlMaster=auto -o ControlPersist=300 -o ControlPath={control_dir}/%C'}
+
+
+class RepoState:
+    """일괄 동기화 중인 저장소 하나의 상태 (열어 둔 Repo, 마지막 결과, 연속 실패 횟수, 다음 실행 시각)"""
+
+    def __init__(self, path, env=None):
+        self.path = path
+        self.env = env or {}
+        self.repo = None
+        self.message = None
+        self.error = None
+        self.failures = 0
+        self.next_run = 0.0
+        self.elapsed = 0.0
+
+    def open(self):
+        # 저장소는 처음 한 번만 열고 주기마다 재사용
+        if self.repo is None:
+            self.repo = Repo(self.path)
+            if self.env:
+                self.repo.git.update_environment(**self.env)
+        return self.repo
+
+
+def sync_once(state, operation, interval=600, max_backoff=3600, **kwargs):
+    # 저장소 하나에 작업 한 번 실행. 실패하면 다음 실행까지 간격을 두 배씩 늘림 (최대 max_backoff 초)
+    start = time.monotonic()
+    try:
+        # GUI 트리가 없으므로 tracked 파일 비교는 하지 않음
+        state.message, _added, _removed = run_operation(state.open(), operation, RemoteRunner(),
+                                                        track_changes=False, **kwargs)
+        state.error = None
+        state.failures = 0
+        delay = interval
+    except GitCommandError as e:
+        state.error = f'Git 오류: {str(e)}'
+        state.failures += 1
+        delay = min(max_backoff, interval * 2 ** (state.failures - 1))
+    except Exception as e:
+        state.error = f'오류 발생: {str(e)}'
+        state.failures += 1
+        delay = min(max_backoff, interval * 2 ** (state.failures - 1))
+    state.elapsed = time.monotonic() - start
+    state.next_run = time.monotonic() + delay
+    return state
+
+
+def sync_repos(states, operation, max_workers=4, **kwargs):
+    # 실행할 때가 된 저장소들을 정해진 개수의 스레드로 나눠서 실행
+    due = [state for state in states if state.next_run <= time.monotonic()]
+    if not due:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(due))) as pool:
+        return list(pool.map(lambda state: sync_once(state, operation, **kwargs), due))
+
+
+def run_forever(repo_paths, operation='upload', interval=600, max_workers=4, max_backoff=3600,
+                once=False, report=print, **kwargs):
+    # 여러 저장소를 주기적으로 동기화. once 면 한 번만 실행하고 상태 목록 반환
+    env = ssh_multiplex_env()
+    states = [RepoState(path, env) for path in repo_paths]
+    while True:
+        for state in sync_repos(states, operation, max_workers,
+                                interval=interval, max_backoff=max_backoff, **kwargs):
+            if state.error:
+                report(f'[{state.path}] {state.error} ({state.failures}회 연속 실패)')
+            else:
+                report(f'[{state.path}] {state.message} ({state.elapsed:.1f}초)')
+        if once:
+            return states
+        time.sleep(max(0.0, min(state.next_run for state in states) - time.monotonic()))
@@ -0,0 +1,118 @@
+"""여러 저장소 동기화 벤치마크: 저장소마다 auto_push 를 따로 실행 vs 한 프로세스 일괄 동기화
+
+로컬 bare 저장소를 원격(origin)으로 쓰는 저장소 N개를 만들고, 한 주기(add/commit/push)를 끝내는 데 걸린 시간과
+CPU 시간(자식 프로세스 포함)을 비교
+- 모두 변경: 매 회차 모든 저장소에 파일을 바꿈 (일괄 동기화도 저장소마다 push 하므로 차이가 작음)
+- 변경 없음: 아무것도 바꾸지 않음 (일괄 동기화는 올릴 커밋이 없는 저장소에 접속하지 않음)
+로컬 원격이라 네트워크 왕복과 SSH 연결 재사용(ControlMaster)의 효과는 나타나지 않음
+
+실행: python gitcontrol/benchmarks/bench_batch_sync.py [저장소 수] [회차]
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_sync import RepoState, sync_repos
+
+# 예전 auto_push.py 한 주기 (저장소마다 파이썬 프로세스 하나 + 셸 세 번)
+LEGACY_CYCLE = '''
+import os
+os.system('git add .')
+os.system('git commit -q -m "자동 커밋"')
+os.system('git push -q origin main')
+'''
+
+
+def git(cwd, *args):
+    subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True)
+
+
+def make_repos(base, count, files=50):
+    paths = []
+    for i in range(count):
+        origin = os.path.join(base, f'origin{i}.git')
+        path = os.path.join(base, f'site{i}')
+        git(base, 'init', '-q', '--bare', origin)
+        git(base, 'init', '-q', '-b', 'main', path)
+        git(path, 'config', 'user.email', 'bench@example.com')
+        git(path, 'config', 'user.name', 'bench')
+        for j in range(files):
+            with open(os.path.join(path, f'page{j}.html'), 'w') as f:
+                f.write(f'<p>{j}</p>\n')
+        git(path, 'add', '-A')
+        git(path, 'commit', '-q', '-m', 'init')
+        git(path, 'remote', 'add', 'origin', origin)
+        git(path, 'push', '-q', '-u', 'origin', 'main')
+        paths.append(path)
+    return paths
+
+
+def touch_none(paths, round_no):
+    pass
+
+
+def touch_all(paths, round_no):
+    for path in paths:
+        with open(os.path.join(path, 'page0.html'), 'w') as f:
+            f.write(f'<p>round {round_no}</p>\n')
+
+
+def cpu_seconds():
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def bench_independent(paths):
+    # 저장소마다 따로 떠 있는 auto_push 가 동시에 한 주기를 도는 상황
+    procs = [subprocess.Popen([sys.executable, '-c', LEGACY_CYCLE], cwd=path,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) for path in paths]
+    for proc in procs:
+        proc.wait()
+
+
+def bench_batch(states, workers):
+    for state in states:
+        state.next_run = 0.0
+    for state in sync_repos(states, 'upload', workers, message='자동 커밋'):
+        if state.error:
+            raise RuntimeError(state.error)
+
+
+def measure(func, *args):
+    cpu = cpu_seconds()
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start, cpu_seconds() - cpu
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    with tempfile.TemporaryDirectory() as base:
+        paths = make_repos(base, count)
+        states = [RepoState(path) for path in paths]
+        print(f'{count}개 저장소, {rounds}회차 평균')
+        print(f'{"mode":<34} {"wall(s)":>8} {"cpu(s)":>8}')
+        round_no = 0
+        for label, touch in (('all changed', touch_all), ('idle', touch_none)):
+            for name, func, args in [('independent x N', bench_independent, (paths,)),
+                                     ('batch workers=4', bench_batch, (states, 4)),
+                                     ('batch workers=8', bench_batch, (states, 8))]:
+                wall = cpu = 0.0
+                for _ in range(rounds):
+                    round_no += 1
+                    touch(paths, round_no)
+                    w, c = measure(func, *args)
+                    wall += w
+                    cpu += c
+                print(f'{f"{name} ({label})":<34} {wall / rounds:>8.3f} {cpu / rounds:>8.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""일괄 파일 작업 벤치마크: 파일 N개 삭제/이동 시간
+
+- 항목마다 명령: 파일마다 rm / git rm 프로세스 (셸 명령을 항목마다 실행하던 방식)
+- 명령 한 번: 모든 경로를 인자로 붙인 git rm / git mv 프로세스 한 번 (GitPython index.remove/move 와 같음)
+- 일괄: bulk_ops (스레드 풀에서 이동, 인덱스는 프로세스 안에서 한 번 읽고 한 번 씀)
+항목마다 명령은 앞의 200개만 재서 N개로 환산함
+
+실행: python gitcontrol/benchmarks/bench_bulk.py [파일 수]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from git import Repo
+
+import bulk_ops
+
+SAMPLE = 200
+
+
+def make_repo(root, count):
+    subprocess.run(['git', 'init', '-q', root], check=True)
+    paths = []
+    for i in range(count):
+        rel_path = f'd{i % 20}/f{i}.txt'
+        os.makedirs(os.path.join(root, f'd{i % 20}'), exist_ok=True)
+        with open(os.path.join(root, rel_path), 'w') as f:
+            f.write(f'{i}\n')
+        paths.append(rel_path)
+    subprocess.run(['git', 'add', '.'], cwd=root, check=True)
+    subprocess.run(['git', '-c', 'user.name=bench', '-c', 'user.email=bench@example.com',
+                    'commit', '-q', '-m', 'init'], cwd=root, check=True)
+    return paths
+
+
+def reset(root):
+    subprocess.run(['git', 'reset', '-q', '--hard'], cwd=root, check=True)
+    subprocess.run(['git', 'clean', '-q', '-fd'], cwd=root, check=True)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def per_item(root, command, paths):
+    # 앞의 SAMPLE 개만 실행하고 전체 개수로 환산
+    sample = paths[:SAMPLE]
+    elapsed = timed(lambda: [subprocess.run(command + [p], cwd=root, check=True) for p in sample])
+    return elapsed * len(paths) / len(sample)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    with tempfile.TemporaryDirectory() as root:
+        paths = make_repo(root, count)
+        rows = []
+        rows.append(('delete', 'per-item rm', per_item(root, ['rm'], paths)))
+        reset(root)
+        rows.append(('delete', 'bulk', timed(bulk_ops.delete_paths, root, paths)))
+        reset(root)
+        rows.append(('git rm', 'per-item', per_item(root, ['git', 'rm', '-q'], paths)))
+        reset(root)
+        rows.append(('git rm', 'one process', timed(lambda: subprocess.run(
+            ['git', 'rm', '-q', '--pathspec-from-file=-'], cwd=root, check=True, input='\n'.join(paths).encode()))))
+        reset(root)
+        rows.append(('git rm', 'bulk', timed(bulk_ops.git_remove, Repo(root), paths)))
+        reset(root)
+        # 폴더 통째로 옮기기 / 파일을 하나씩 옮기기
+        folders = [f'd{i}' for i in range(20)]
+        for label, sources in (('git mv dir', folders), ('git mv', paths)):
+            os.makedirs(os.path.join(root, 'moved'))
+            rows.append((label, 'one process', timed(lambda: subprocess.run(
+                ['git', 'mv'] + sources + ['moved'], cwd=root, check=True))))
+            reset(root)
+            moves = [(p, 'moved/' + p.rpartition('/')[2]) for p in sources]
+            rows.append((label, 'bulk', timed(bulk_ops.git_move, Repo(root), moves)))
+            reset(root)
+    print(f'파일 {count}개')
+    print(f'{"operation":<12} {"method":<12} {"time(ms)":>10}')
+    for operation, method, elapsed in rows:
+        print(f'{operation:<12} {method:<12} {elapsed * 1000:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
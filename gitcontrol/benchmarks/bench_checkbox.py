@@ -0,0 +1,81 @@
+"""체크박스 선택 벤치마크: 폴더 하나의 파일 N개를 모두 체크하는 데 걸린 시간
+
+예전 방식은 파일마다 체크할 때마다 전체 트리를 다시 훑어서 체크 목록을 만들었음 (O(n²)).
+지금은 폴더를 한 번 체크하면 하위 전체와 상위 폴더 상태가 한 번에 갱신되고, 알림은 한 번만 나감
+
+실행: QT_QPA_PLATFORM=offscreen python gitcontrol/benchmarks/bench_checkbox.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+from path_tree import PathTree
+from tree_model import PathTreeModel
+
+
+def make_tree(count, per_dir=500):
+    tree = PathTree()
+    for i in range(count):
+        tree.add_file(f'site/dir{i // per_dir}/file{i}.txt')
+    tree.finish_build()
+    return tree
+
+
+def full_scan(tree, node=0, prefix=''):
+    # 예전 _get_checked_items: 트리 전체를 재귀로 훑으며 경로 문자열을 만듦 (비교용)
+    result = []
+    for child in tree.children(node):
+        path = f'{prefix}/{tree.name(child)}' if prefix else tree.name(child)
+        if tree.is_dir(child):
+            result.extend(full_scan(tree, child, path))
+        elif tree.is_checked(child):
+            result.append(path)
+    return result
+
+
+def bench_per_item(count):
+    # 파일 하나씩 체크 + 체크할 때마다 전체 목록 재계산
+    tree = make_tree(count)
+    folder = tree.find('site/dir0')
+    start = time.perf_counter()
+    for node in tree.children(folder):
+        tree.set_checked(node, True)
+        full_scan(tree)
+    return time.perf_counter() - start
+
+
+def bench_folder(app, count):
+    # site 아래 폴더를 차례로 체크해서 파일 전체를 선택 (모델 경유, 화면 갱신 알림 포함)
+    # 알림은 이벤트 루프에서 한 번으로 합쳐지고, 통째로 체크된 site 하나가 목록으로 나옴
+    model = PathTreeModel()
+    model.set_tree(make_tree(count))
+    signals = []
+    model.checked_changed.connect(lambda: signals.append(model.checked_paths()))
+    site = model.index(0, 0)
+    start = time.perf_counter()
+    for row in range(model.rowCount(site)):
+        model.setData(model.index(row, 0, site), Qt.Checked, Qt.CheckStateRole)
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    assert len(signals) == 1 and signals[0] == ['site']
+    return elapsed
+
+
+def main():
+    app = QApplication(sys.argv)
+    print(f'{"files":>8} {"per-item(s)":>12} {"folder(s)":>10}')
+    for count in (2000, 20000, 200000):
+        # 예전 방식은 폴더 하나(500개)만 체크해도 전체 파일 수에 비례해서 느려짐
+        per_item = bench_per_item(count) if count <= 20000 else float('nan')
+        folder = bench_folder(app, count)
+        print(f'{count:>8} {per_item:>12.3f} {folder:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
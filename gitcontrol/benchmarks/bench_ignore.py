@@ -0,0 +1,137 @@
+"""무시 규칙 판별 벤치마크: 경로 N개가 .gitignore 에 걸리는지 판별하는 시간
+
+- 합친 정규식: IgnoreRules.filter_paths (규칙 파일마다 합친 정규식, 폴더별 결과 기억)
+- 규칙별: 규칙마다 정규식을 따로 맞춰 보는 방식 (폴더 결과도 기억하지 않음)
+- git: git check-ignore --stdin --no-index 프로세스 한 번
+두 내장 방식의 결과가 git 과 같은지도 확인함
+
+실행: python gitcontrol/benchmarks/bench_ignore.py [경로 수]
+"""
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gitignore import IgnoreRules, parse
+
+WORDS = ['src', 'lib', 'components', 'images', 'docs', 'test', 'util', 'core', 'assets', 'build',
+         'dist', 'node_modules', 'cache', 'tmp', 'vendor', 'out', 'logs', 'api', 'model', 'page']
+EXTENSIONS = ['html', 'css', 'js', 'png', 'md', 'py', 'pyc', 'log', 'o', 'map', 'tmp', 'bak']
+# 흔한 웹/파이썬 프로젝트의 .gitignore 비슷하게
+ROOT_RULES = '''
+node_modules/
+/dist
+build/
+out/
+*.pyc
+__pycache__/
+*.log
+!important.log
+*.o
+*.map
+*.tmp
+*.bak
+!keep_*.bak
+.cache/
+**/cache/**
+coverage/
+*.swp
+.DS_Store
+Thumbs.db
+.env
+.env.*
+*.egg-info/
+vendor/**/test/
+docs/_build/
+logs/
+!logs/.keep
+tmp
+'''
+NESTED_RULES = {
+    'src': '*.png\n!icons/*.png\ngenerated/\n',
+    'docs': '*.html\n!index.html\n',
+    'lib/core': '!*.log\ntest/\n',
+}
+
+
+def make_paths(count):
+    random.seed(0)
+    paths = []
+    for i in range(count):
+        folder = '/'.join(random.choice(WORDS) for _ in range(random.randint(1, 5)))
+        paths.append(f'{folder}/{random.choice(WORDS)}_{i % 1000}.{random.choice(EXTENSIONS)}')
+    return paths
+
+
+def make_repo(root):
+    subprocess.run(['git', 'init', '-q', root], check=True)
+    with open(os.path.join(root, '.gitignore'), 'w') as f:
+        f.write(ROOT_RULES)
+    for rel_dir, text in NESTED_RULES.items():
+        os.makedirs(os.path.join(root, rel_dir), exist_ok=True)
+        with open(os.path.join(root, rel_dir, '.gitignore'), 'w') as f:
+            f.write(text)
+
+
+def per_rule(root, paths):
+    # 규칙마다 정규식 하나, 경로마다 상위 폴더를 처음부터 다시 확인
+    rule_sets = {}
+    for rel_dir in [''] + list(NESTED_RULES):
+        with open(os.path.join(root, rel_dir, '.gitignore')) as f:
+            rule_sets[rel_dir] = [(re.compile(regex if anchored else '(?:.*/)?' + regex, re.S), negate, dir_only)
+                                  for regex, negate, dir_only, anchored in parse(f.read())]
+
+    def matches(rel_path, is_dir):
+        parts = rel_path.split('/')
+        for depth in range(len(parts) - 1, -1, -1):
+            rules = rule_sets.get('/'.join(parts[:depth]))
+            if rules:
+                rest = '/'.join(parts[depth:])
+                for regex, negate, dir_only in reversed(rules):
+                    if (is_dir or not dir_only) and regex.match(rest):
+                        return not negate
+        return False
+
+    def ignored(rel_path):
+        parts = rel_path.split('/')
+        return any(matches('/'.join(parts[:depth]), True) for depth in range(1, len(parts))) or matches(rel_path, False)
+
+    return [path for path in paths if not ignored(path)]
+
+
+def git_check_ignore(root, paths):
+    result = subprocess.run(['git', 'check-ignore', '-z', '--stdin', '--no-index'], cwd=root, capture_output=True,
+                            input='\0'.join(paths).encode('utf-8', 'surrogateescape'))
+    ignored = {p.decode('utf-8', 'surrogateescape') for p in result.stdout.split(b'\0') if p}
+    return [path for path in paths if path not in ignored]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    paths = make_paths(count)
+    with tempfile.TemporaryDirectory() as root:
+        make_repo(root)
+        combined_time, combined = timed(lambda: IgnoreRules(root).filter_paths(paths))
+        per_rule_time, per_rule_result = timed(per_rule, root, paths)
+        git_time, git_result = timed(git_check_ignore, root, paths)
+    ignored = count - len(git_result)
+    print(f'경로 {count}개, 무시 {ignored}개')
+    print(f'{"method":<12} {"time(ms)":>10} {"same as git":>12}')
+    print(f'{"combined":<12} {combined_time * 1000:>10.1f} {str(combined == git_result):>12}')
+    print(f'{"per-rule":<12} {per_rule_time * 1000:>10.1f} {str(per_rule_result == git_result):>12}')
+    print(f'{"git":<12} {git_time * 1000:>10.1f} {"-":>12}')
+
+
+if __name__ == '__main__':
+    main()
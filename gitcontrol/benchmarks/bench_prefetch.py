@@ -0,0 +1,61 @@
+"""미리 받기 벤치마크: 다운로드를 바로 pull 할 때 vs 쉬는 동안 미리 받아 둔 뒤
+
+합성 저장소(synthetic_repo)의 로컬 bare 원격에 새 커밋(파일 N개)을 올리고
+- 그냥 download (pull)
+- prefetch 한 뒤 download (병합만)
+의 걸린 시간을 비교 (sync_git_to_local 은 항상 fetch 하므로 제외)
+로컬 원격이라 네트워크 지연은 없으므로 실제 원격에서는 차이가 더 큼
+
+실행: python gitcontrol/benchmarks/bench_prefetch.py [파일 수] [새 커밋의 파일 수] [--workdir 폴더]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from git import Repo
+
+import prefetch
+import synthetic_repo
+from git_ops import RemoteRunner, run_operation
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='미리 받기 벤치마크')
+    parser.add_argument('files', nargs='?', type=int, default=10000)
+    parser.add_argument('changes', nargs='?', type=int, default=500)
+    parser.add_argument('--workdir', help='합성 저장소를 만들어 두고 다시 쓸 폴더 (없으면 임시 폴더)')
+    args = parser.parse_args()
+    base = args.workdir or tempfile.mkdtemp(prefix='gitcontrol-bench-')
+    rows = []
+    try:
+        work, origin = synthetic_repo.generate(base, args.files)
+        repo = Repo(work)
+        synthetic_repo.change_remote(origin, args.changes, 'fetch')
+        rows.append(('download (pull)', timed(run_operation, repo, 'download', RemoteRunner())))
+        synthetic_repo.change_remote(origin, args.changes, 'prefetch')
+        rows.append(('prefetch (idle)', timed(prefetch.prefetch, repo)))
+        rows.append(('download (prefetched)', timed(run_operation, repo, 'download', RemoteRunner())))
+        rows.append(('ahead/behind', timed(prefetch.ahead_behind, repo)))
+    finally:
+        if not args.workdir:
+            shutil.rmtree(base, ignore_errors=True)
+    print(f'파일 {args.files}개, 새 커밋마다 파일 {args.changes}개')
+    print(f'{"step":<32} {"time(ms)":>10}')
+    for label, elapsed in rows:
+        print(f'{label:<32} {elapsed * 1000:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""작업 폴더 스캔 벤치마크: 예전 os.walk vs 병렬 scandir (무시 규칙 적용 유무)
+
+네트워크 드라이브처럼 폴더 읽기마다 지연이 있는 경우를 흉내 내려고 os.scandir 호출마다 지연(ms)을 넣을 수 있음
+node_modules(.gitignore 에 등록)가 있는 저장소에서 전체 시간과 첫 묶음이 나올 때까지의 시간을 비교
+
+실행: python gitcontrol/benchmarks/bench_scan.py [폴더 수] [scandir 지연(ms)]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dir_scanner
+from gitignore import IgnoreRules
+
+
+def make_tree(base, dirs, files_per_dir=20):
+    with open(os.path.join(base, '.gitignore'), 'w') as f:
+        f.write('node_modules/\n*.log\n')
+    for i in range(dirs):
+        # 일반 폴더와, 같은 수의 무시될 폴더 (node_modules 아래)
+        for top in ('src', 'node_modules'):
+            path = os.path.join(base, top, f'pkg{i // 50}', f'mod{i}')
+            os.makedirs(path, exist_ok=True)
+            for j in range(files_per_dir):
+                open(os.path.join(path, f'f{j}.{"log" if j == 0 else "js"}'), 'w').close()
+
+
+class SlowScandir:
+    # os.scandir 호출마다 지연을 넣음 (sleep 중에는 GIL 을 놓으므로 네트워크 대기와 비슷)
+    def __init__(self, delay):
+        self.delay = delay
+        self.original = os.scandir
+
+    def __call__(self, path):
+        time.sleep(self.delay)
+        return self.original(path)
+
+
+def bench_walk(base):
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _root, dirs, files in os.walk(base):
+        if '.git' in dirs:
+            dirs.remove('.git')
+        count += len(files)
+        if first is None:
+            first = time.perf_counter() - start
+    return time.perf_counter() - start, first, count
+
+
+def bench_parallel(base, ignore):
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for batch in dir_scanner.scan_tree(base, IgnoreRules(base) if ignore else None):
+        count += sum(len(files) for _rel_dir, _dirs, files in batch)
+        if first is None:
+            first = time.perf_counter() - start
+    return time.perf_counter() - start, first, count
+
+
+def main():
+    dirs = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    delay = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.002
+    with tempfile.TemporaryDirectory() as base:
+        make_tree(base, dirs)
+        print(f'폴더 {dirs * 2}개 (절반은 node_modules), scandir 지연 {delay * 1000:.1f}ms')
+        print(f'{"mode":<24} {"total(s)":>9} {"first(s)":>9} {"files":>8}')
+        os.scandir = SlowScandir(delay)
+        try:
+            for name, func, args in [('os.walk (old)', bench_walk, (base,)),
+                                     ('parallel', bench_parallel, (base, False)),
+                                     ('parallel + .gitignore', bench_parallel, (base, True))]:
+                total, first, count = func(*args)
+                print(f'{name:<24} {total:>9.3f} {first:>9.3f} {count:>8}')
+        finally:
+            os.scandir = os.scandir.original
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""파일 검색 벤치마크: 경로 N개에서 검색어를 한 글자씩 입력할 때 글자마다 걸리는 시간
+
+- 첫 화면: 검색창처럼 FRAME_BUDGET 안에서 찾은 결과 (또는 전체 결과가 그보다 빨리 끝난 경우)
+- 전체: 끝까지 찾는 데 걸린 시간 (검색창은 이 시간을 여러 프레임에 나눠서 씀)
+- 완성: 검색어를 다 입력했을 때 끝까지 찾는 시간
+- 선형 비교: 색인 없이 모든 경로를 확인하는 경우 (부분 일치는 in, 글롭은 fnmatch)
+
+실행: python gitcontrol/benchmarks/bench_search.py [경로 수]
+"""
+import fnmatch
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from path_index import PathIndex
+
+FRAME_BUDGET = 0.008
+WORDS = ['src', 'lib', 'components', 'images', 'docs', 'test', 'util', 'core', 'assets', 'build',
+         'main', 'index', 'style', 'page', 'blog', 'post', 'about', 'contact', 'api', 'model']
+EXTENSIONS = ['html', 'css', 'js', 'png', 'md', 'py']
+# (검색어, 퍼지 여부). 한 글자씩 입력하는 것처럼 앞부분부터 차례로 검색
+QUERIES = [('contact_1234', False), ('*.png', False), ('src/**/page_1*.md', False), ('ctpg42', True)]
+
+
+def make_paths(count):
+    random.seed(0)
+    paths = []
+    for i in range(count):
+        folder = '/'.join(random.choice(WORDS) for _ in range(random.randint(1, 4)))
+        paths.append(f'{folder}/{random.choice(WORDS)}_{i}.{random.choice(EXTENSIONS)}')
+    return paths
+
+
+def first_frame(index, query, fuzzy):
+    # 검색창의 첫 프레임: 예산 시간이 지나거나 한 화면(100개)을 채울 때까지 찾음
+    start = time.perf_counter()
+    found = 0
+    for paths in index.search_blocks(query, fuzzy):
+        found += len(paths)
+        if found >= 100 or time.perf_counter() - start > FRAME_BUDGET:
+            break
+    return time.perf_counter() - start
+
+
+def full(index, query, fuzzy):
+    start = time.perf_counter()
+    count = len(index.search(query, fuzzy))
+    return time.perf_counter() - start, count
+
+
+def linear(lower, query):
+    start = time.perf_counter()
+    if any(c in query for c in '*?['):
+        [p for p in lower if fnmatch.fnmatchcase(p, query) or fnmatch.fnmatchcase(p.rpartition('/')[2], query)]
+    else:
+        [p for p in lower if query in p]
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    paths = make_paths(count)
+    start = time.perf_counter()
+    index = PathIndex(paths)
+    print(f'경로 {count}개, 색인 만들기 {time.perf_counter() - start:.2f}초')
+    lower = [p.lower() for p in paths]
+    print(f'{"query":<20} {"fuzzy":>5} {"first max(ms)":>14} {"full max(ms)":>13} {"final(ms)":>10} '
+          f'{"linear(ms)":>11} {"matches":>8}')
+    for query, fuzzy in QUERIES:
+        # 입력 중인 모든 앞부분(한 글자씩)에 대해 가장 느린 경우
+        prefixes = [query[:n] for n in range(1, len(query) + 1)]
+        first_max = max(first_frame(index, q, fuzzy) for q in prefixes)
+        full_max = max(full(index, q, fuzzy)[0] for q in prefixes)
+        final, matches = full(index, query, fuzzy)
+        linear_time = float('nan') if fuzzy else linear(lower, query)
+        print(f'{query:<20} {str(fuzzy):>5} {first_max * 1000:>14.2f} {full_max * 1000:>13.2f} {final * 1000:>10.2f} '
+              f'{linear_time * 1000:>11.2f} {matches:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""부분 클론 벤치마크: 전체 클론 vs 부분 클론(blob:none) + 폴더 하나만 cone
+
+로컬 bare 저장소(uploadpack.allowFilter=true)를 만들고 file:// 주소로 받음
+폴더 N개 × 파일 M개, 파일마다 서로 다른 내용 (압축되지 않도록 무작위 바이트)
+받은 뒤 .git/objects 크기, 작업 폴더 파일 수, 걸린 시간 비교
+
+실행: python gitcontrol/benchmarks/bench_sparse.py [폴더 수] [폴더당 파일 수]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from git import Repo
+
+import sparse
+from git_ops import RemoteRunner
+
+FILE_SIZE = 4096
+
+
+def git(*args, cwd=None):
+    subprocess.run(['git', '-c', 'user.name=bench', '-c', 'user.email=bench@example.com'] + list(args),
+                   cwd=cwd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def make_origin(base, folders, files):
+    src = os.path.join(base, 'src')
+    os.makedirs(src)
+    git('init', '-q', '-b', 'main', src)
+    for i in range(folders):
+        os.makedirs(os.path.join(src, f'd{i}'))
+        for j in range(files):
+            with open(os.path.join(src, f'd{i}', f'f{j}.bin'), 'wb') as f:
+                f.write(os.urandom(FILE_SIZE))
+    git('add', '.', cwd=src)
+    git('commit', '-q', '-m', 'init', cwd=src)
+    bare = os.path.join(base, 'bare.git')
+    git('clone', '-q', '--bare', src, bare)
+    git('config', 'uploadpack.allowFilter', 'true', cwd=bare)
+    return 'file://' + bare
+
+
+def size_of(path):
+    return sum(os.path.getsize(os.path.join(d, f)) for d, _, names in os.walk(path) for f in names)
+
+
+def file_count(path):
+    return sum(len(names) for d, _, names in os.walk(path) if '.git' not in d.split(os.sep))
+
+
+def full_clone(url, path):
+    git('clone', '-q', url, path)
+
+
+def partial(url, path):
+    runner = RemoteRunner()
+    repo = sparse.partial_clone(url, path, runner)
+    sparse.download(repo, runner, folders=['d0'])
+
+
+def main():
+    folders = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    files = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    with tempfile.TemporaryDirectory() as base:
+        url = make_origin(base, folders, files)
+        rows = []
+        for label, func in (('full clone', full_clone), ('partial+cone', partial)):
+            path = os.path.join(base, label.replace(' ', '_').replace('+', '_'))
+            start = time.perf_counter()
+            func(url, path)
+            elapsed = time.perf_counter() - start
+            rows.append((label, elapsed, size_of(os.path.join(path, '.git', 'objects')), file_count(path)))
+        # 이어서 폴더 하나를 더 받을 때 (그 폴더의 blob 만 받음)
+        path = os.path.join(base, 'partial_cone')
+        before = size_of(os.path.join(path, '.git', 'objects'))
+        start = time.perf_counter()
+        sparse.download_folders(Repo(path), RemoteRunner(), ['d1'])
+        rows.append(('+1 folder', time.perf_counter() - start,
+                     size_of(os.path.join(path, '.git', 'objects')) - before, files))
+    print(f'폴더 {folders}개 × 파일 {files}개 ({FILE_SIZE} bytes)')
+    print(f'{"method":<14} {"time(ms)":>10} {"objects(KB)":>12} {"files":>8}')
+    for label, elapsed, size, count in rows:
+        print(f'{label:<14} {elapsed * 1000:>10.1f} {size // 1024:>12} {count:>8}')
+
+
+if __name__ == '__main__':
+    main()
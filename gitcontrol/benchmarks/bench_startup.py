@@ -0,0 +1,51 @@
+"""시작 시간 벤치마크: 새 파이썬 프로세스가 뜨고 끝날 때까지의 시간 (여러 번 재서 중앙값)
+
+- python: 빈 인터프리터 (기준)
+- cli --help: python -m gitcontrol (Qt, GitPython 을 불러오지 않음)
+- import git_ops: Git 작업 본체 (GitPython 포함)
+- import git_gui: GUI (PyQt5 + GitPython)
+'모듈 비용' 은 빈 인터프리터를 뺀 시간
+
+실행: python gitcontrol/benchmarks/bench_startup.py [반복 수]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+GITCONTROL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = (
+    ('python', ['-c', 'pass']),
+    ('cli --help', ['-m', 'gitcontrol', '--help']),
+    ('import git_ops', ['-c', 'import git_ops']),
+    ('import git_gui', ['-c', 'import git_gui']),
+)
+
+
+def run_once(args):
+    env = dict(os.environ, PYTHONPATH=GITCONTROL_DIR, QT_QPA_PLATFORM='offscreen')
+    start = time.perf_counter()
+    subprocess.run([sys.executable] + args, cwd=os.path.dirname(GITCONTROL_DIR), env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def measure(repeat=10):
+    # {항목: 중앙값(초)}
+    return {label: statistics.median(run_once(args) for _ in range(repeat)) for label, args in CASES}
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    results = measure(repeat)
+    base = results['python']
+    print(f'반복 {repeat}회 (중앙값)')
+    print(f'{"case":<16} {"time(ms)":>10} {"module(ms)":>11}')
+    for label, seconds in results.items():
+        print(f'{label:<16} {seconds * 1000:>10.1f} {(seconds - base) * 1000:>11.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,281 @@
+"""벤치마크 모음: 합성 저장소(규모 × 폴더 구조)마다 주요 경로의 시간을 재서 JSON 으로 저장
+
+- update_file_list: 캐시 없이 트리가 보일 때까지 / 검색 색인까지, 디스크 캐시로 다시 열 때
+- 트리 구성: PathTree.add_file (Git 트리), add_children (로컬 스캔 묶음), 지연 로딩용 tracked 인덱스
+- _get_checked_items: 폴더 전체 체크 / 파일 10개 중 하나씩 체크
+- GitWorker 작업 전부 (로컬 bare 원격 대상, 작업 전에 로컬/원격 변경을 만들어 둠)
+- auto_push 한 주기 (변경 있음 / 없음)
+- 시작 시간: python -m gitcontrol, git_ops, git_gui 를 불러오는 새 프로세스 (bench_startup.py)
+Qt 는 offscreen 으로 실행. --compare 로 이전 결과와 비교
+
+실행: python gitcontrol/benchmarks/bench_suite.py [--scales 1000,10000,100000] [--layouts wide,deep]
+      [--workdir 폴더] [--output 결과.json] [--compare 이전결과.json]
+결과는 기본으로 gitcontrol/benchmarks/results/ 에 저장 (git 에서 무시됨)
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+GITCONTROL_DIR = os.path.dirname(BENCH_DIR)
+# 기본 결과 저장 폴더 (.gitignore 에 등록되어 있어 작업 트리를 더럽히지 않음)
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+sys.path.insert(0, GITCONTROL_DIR)
+sys.path.insert(0, os.path.dirname(GITCONTROL_DIR))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+import auto_push
+import bench_startup
+import synthetic_repo
+from dir_scanner import scan_tree
+from git_gui import GitGUI, GitWorker, build_tracked_index
+from path_tree import PathTree
+
+# 작업마다 바꾸는 파일 수 (규모의 1%, 최소 10개 최대 1000개)
+CHANGE_RATIO = 0.01
+# 이벤트 루프를 돌리며 결과를 기다리는 최대 시간 (초)
+WAIT_LIMIT = 600
+
+
+class BenchGUI(GitGUI):
+    """트리가 모델에 들어간 시각과 검색 색인이 들어간 시각을 기록하는 GitGUI"""
+
+    def __init__(self):
+        self.marks = {}
+        super().__init__()
+
+    def _on_files_scanned(self, generation, *args):
+        super()._on_files_scanned(generation, *args)
+        if generation == self._scan_generation:
+            self.marks['scanned'] = time.perf_counter()
+
+    def _on_files_indexed(self, generation, *args):
+        super()._on_files_indexed(generation, *args)
+        if generation == self._scan_generation:
+            self.marks['indexed'] = time.perf_counter()
+
+
+def wait_for(app, done):
+    deadline = time.monotonic() + WAIT_LIMIT
+    while not done():
+        if time.monotonic() > deadline:
+            raise TimeoutError('결과를 기다리다 시간 초과')
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def bench_file_list(app, gui, work):
+    # 캐시 없이 처음 열 때 / 다른 경로를 거쳐 다시 열 때 (디스크 캐시부터 보여줌)
+    results = {}
+    shutil.rmtree(os.environ['XDG_CACHE_HOME'], ignore_errors=True)
+    empty = tempfile.mkdtemp(prefix='gitcontrol-bench-empty-')
+    gui.local_path_input.blockSignals(True)
+    for label in ('update_file_list (no cache)', 'update_file_list (cached)'):
+        gui.local_path_input.setText(work)
+        gui.marks.clear()
+        start = time.perf_counter()
+        gui.update_file_list()
+        shown = time.perf_counter()
+        wait_for(app, lambda: 'indexed' in gui.marks)
+        if label.endswith('(cached)'):
+            results[f'{label} first paint'] = shown - start
+        results[f'{label} tree'] = gui.marks['scanned'] - start
+        results[f'{label} index'] = gui.marks['indexed'] - start
+        # 다음 번에 디스크 캐시를 쓰도록 빈 폴더로 바꿔 둠
+        gui.local_path_input.setText(empty)
+        gui.update_file_list()
+        gui.marks.clear()
+        wait_for(app, lambda: 'indexed' in gui.marks)
+    gui.local_path_input.setText(work)
+    gui.local_path_input.blockSignals(False)
+    os.rmdir(empty)
+    return results
+
+
+def bench_tree_builders(work):
+    tracked = synthetic_repo.git(work, '-c', 'core.quotePath=false', 'ls-files').splitlines()
+    listings = [listing for batch in scan_tree(work) for listing in batch]
+
+    def by_paths():
+        tree = PathTree()
+        for path in tracked:
+            tree.add_file(path)
+        tree.finish_build()
+
+    def by_listings():
+        tree = PathTree()
+        for rel_dir, dirs, files in listings:
+            tree.add_children(tree.dir_node(rel_dir), dirs, files)
+        tree.finish_build()
+
+    return {
+        'tree build add_file': timed(by_paths),
+        'tree build add_children': timed(by_listings),
+        'tracked index (lazy)': timed(build_tracked_index, tracked),
+    }
+
+
+def bench_checked_items(gui):
+    results = {}
+    model = gui.git_file_model
+    tree = model.tree()
+    top = list(tree.children(0))
+    cases = (('_get_checked_items (folders)', top),
+             ('_get_checked_items (every 10th file)',
+              [node for node in range(1, len(tree)) if not tree.is_dir(node)][::10]))
+    for label, nodes in cases:
+        for node in nodes:
+            tree.set_checked(node, True)
+        results[label] = timed(gui._get_checked_items, gui.git_file_tree)
+        for node in top:
+            tree.set_checked(node, False)
+    return results
+
+
+def run_worker(work, operation, **kwargs):
+    # GitWorker 를 현재 스레드에서 바로 실행 (오류 메시지는 결과에 기록)
+    worker = GitWorker(work, operation, None, **kwargs)
+    errors = []
+    worker.error.connect(errors.append)
+    elapsed = timed(worker.run)
+    return elapsed, errors[0] if errors else None
+
+
+def bench_operations(work, origin, changes):
+    results, errors = {}, {}
+    steps = (
+        ('fetch', lambda: None, {}),
+        ('upload', lambda: synthetic_repo.change_local(work, changes, 'upload'), {}),
+        ('sync_local_to_git', lambda: synthetic_repo.change_local(work, changes, 'sync'), {}),
+        # 폴더 받기는 브랜치를 옮기지 않으므로 다음의 download 가 이어서 병합함
+        ('download_folders', lambda: synthetic_repo.change_remote(origin, changes, 'folders'),
+         {'paths': ['remote/folders']}),
+        ('download', lambda: synthetic_repo.change_remote(origin, changes, 'download'), {}),
+        ('sync_git_to_local', lambda: synthetic_repo.change_remote(origin, changes, 'reset'), {}),
+        ('build_images', lambda: None, {}),
+    )
+    for operation, prepare, kwargs in steps:
+        prepare()
+        elapsed, error = run_worker(work, operation, **kwargs)
+        results[f'GitWorker {operation}'] = elapsed
+        if error:
+            errors[f'GitWorker {operation}'] = error
+    return results, errors
+
+
+def bench_auto_push(work, changes):
+    backend = auto_push.make_backend(work)
+
+    def cycle():
+        if backend.commit('자동 커밋'):
+            backend.push('origin', 'main')
+
+    # 저장소를 열고 인덱스를 읽어 두는 첫 주기는 빼고 잼 (상주 중인 auto_push 와 같은 조건)
+    cycle()
+    synthetic_repo.change_local(work, changes, 'auto')
+    return {'auto_push cycle (changes)': timed(cycle), 'auto_push cycle (idle)': timed(cycle)}
+
+
+def run_case(app, gui, base, count, layout, report):
+    start = time.perf_counter()
+    work, origin = synthetic_repo.generate(base, count, layout)
+    report(f'[{layout} {count}] 저장소 준비 {time.perf_counter() - start:.1f}초')
+    changes = max(10, min(1000, int(count * CHANGE_RATIO)))
+    results, errors = {}, {}
+    results.update(bench_file_list(app, gui, work))
+    results.update(bench_tree_builders(work))
+    results.update(bench_checked_items(gui))
+    timings, errors = bench_operations(work, origin, changes)
+    results.update(timings)
+    results.update(bench_auto_push(work, changes))
+    return [{'layout': layout, 'files': count, 'name': name, 'seconds': round(seconds, 6),
+             **({'error': errors[name]} if name in errors else {})}
+            for name, seconds in results.items()]
+
+
+def package_version():
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], cwd=GITCONTROL_DIR,
+                              capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ''
+
+
+def compare(old_path, results):
+    # 같은 (구조, 파일 수, 항목) 끼리 이전 결과와 비교
+    with open(old_path, encoding='utf-8') as f:
+        old = {(r['layout'], r['files'], r['name']): r['seconds'] for r in json.load(f)['results']}
+    print(f'{"layout":<6} {"files":>7} {"name":<44} {"old(ms)":>10} {"new(ms)":>10} {"ratio":>6}')
+    for r in results:
+        before = old.get((r['layout'], r['files'], r['name']))
+        if before is None:
+            continue
+        ratio = r['seconds'] / before if before else float('inf')
+        print(f'{r["layout"]:<6} {r["files"]:>7} {r["name"]:<44} {before * 1000:>10.1f} '
+              f'{r["seconds"] * 1000:>10.1f} {ratio:>6.2f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='gitcontrol 벤치마크 모음')
+    parser.add_argument('--scales', default='1000,10000,100000', help='파일 수 목록 (쉼표 구분, 예: 1000,500000)')
+    parser.add_argument('--layouts', default='wide,deep', help='폴더 구조 (wide, deep)')
+    parser.add_argument('--workdir', help='합성 저장소를 만들어 두고 다시 쓸 폴더 (없으면 임시 폴더)')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: benchmarks/results/bench-<버전>-<시각>.json)')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    args = parser.parse_args()
+    scales = [int(value) for value in args.scales.split(',')]
+    layouts = args.layouts.split(',')
+    base = args.workdir or tempfile.mkdtemp(prefix='gitcontrol-bench-')
+    cache = tempfile.mkdtemp(prefix='gitcontrol-bench-cache-')
+    os.environ['XDG_CACHE_HOME'] = cache
+    app = QApplication(sys.argv)
+    gui = BenchGUI()
+    # 측정 중에 미리 받기가 끼어들지 않도록
+    gui.prefetch_check.setChecked(False)
+    results = [{'layout': 'startup', 'files': 0, 'name': f'startup {label}', 'seconds': round(seconds, 6)}
+               for label, seconds in bench_startup.measure().items()]
+    for row in results:
+        print(f'  {row["name"]:<44} {row["seconds"] * 1000:>10.1f} ms')
+    try:
+        for count in scales:
+            for layout in layouts:
+                rows = run_case(app, gui, base, count, layout, print)
+                for row in rows:
+                    error = f'  오류: {row["error"][:80]}' if 'error' in row else ''
+                    print(f'  {row["name"]:<44} {row["seconds"] * 1000:>10.1f} ms{error}')
+                results.extend(rows)
+    finally:
+        gui.close()
+        shutil.rmtree(cache, ignore_errors=True)
+        if not args.workdir:
+            shutil.rmtree(base, ignore_errors=True)
+    version = package_version()
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f'bench-{version or "unknown"}-{time.strftime("%Y%m%d-%H%M%S")}.json')
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'version': version, 'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                   'python': platform.python_version(), 'platform': platform.platform(),
+                   'results': results}, f, ensure_ascii=False, indent=1)
+    print(f'결과 저장: {output}')
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == '__main__':
+    main()
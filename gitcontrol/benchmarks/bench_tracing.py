@@ -0,0 +1,65 @@
+"""시간 측정(tracing) 비용: span/count 한 번에 드는 시간 (꺼져 있을 때 / 켜져 있을 때)
+
+꺼져 있을 때는 빈 with 블록과 거의 같아야 함
+
+실행: python gitcontrol/benchmarks/bench_tracing.py [반복 수]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tracing
+
+
+class Empty:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+def per_call(func, count):
+    start = time.perf_counter()
+    func(count)
+    return (time.perf_counter() - start) / count * 1e9
+
+
+def empty_with(count):
+    empty = Empty()
+    for _ in range(count):
+        with empty:
+            pass
+
+
+def spans(count):
+    for _ in range(count):
+        with tracing.span('walk'):
+            pass
+
+
+def counts(count):
+    for _ in range(count):
+        tracing.count('bytes', 1)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    rows = [('empty with', per_call(empty_with, count))]
+    for on in (False, True):
+        tracing.enable(on)
+        tracing.clear()
+        state = 'on' if on else 'off'
+        rows.append((f'span ({state})', per_call(spans, count)))
+        rows.append((f'count ({state})', per_call(counts, count)))
+    tracing.enable(False)
+    print(f'반복 {count}회')
+    print(f'{"method":<14} {"ns/call":>8}')
+    for label, value in rows:
+        print(f'{label:<14} {value:>8.0f}')
+
+
+if __name__ == '__main__':
+    main()
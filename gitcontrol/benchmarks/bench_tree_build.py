@@ -0,0 +1,82 @@
+"""트리 구성 벤치마크: 파일 수에 따른 파일 목록 트리 구성 시간 측정
+
+실행: QT_QPA_PLATFORM=offscreen python gitcontrol/benchmarks/bench_tree_build.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication, QTreeView, QTreeWidget, QTreeWidgetItem
+
+from path_tree import PathTree
+from tree_model import PathTreeModel
+
+
+def make_paths(count, per_dir):
+    # 한 폴더 아래 형제 폴더가 count / per_dir 개인 넓은 폴더 구조
+    return [f'site/dir{i // per_dir}/file{i}.txt' for i in range(count)]
+
+
+def linear_scan_add(tree_widget, file_path):
+    # 예전 방식: QTreeWidgetItem 형제 노드를 item.text(0)로 하나씩 비교 (비교용)
+    parts = file_path.split('/')
+    parent = tree_widget
+    for part in parts[:-1]:
+        found = None
+        for i in range(parent.topLevelItemCount() if parent is tree_widget else parent.childCount()):
+            item = parent.topLevelItem(i) if parent is tree_widget else parent.child(i)
+            if item.text(0) == part:
+                found = item
+                break
+        if found:
+            parent = found
+        else:
+            parent = QTreeWidgetItem(parent, [part])
+    QTreeWidgetItem(parent, [parts[-1]])
+
+
+def bench_linear(paths):
+    tree = QTreeWidget()
+    start = time.perf_counter()
+    for p in paths:
+        linear_scan_add(tree, p)
+    elapsed = time.perf_counter() - start
+    tree.clear()
+    return elapsed
+
+
+def bench_path_tree(view, paths):
+    # 현재 방식: 워커 스레드에서 PathTree 구성 + GUI 스레드에서 모델 교체
+    start = time.perf_counter()
+    tree = PathTree()
+    for p in paths:
+        tree.add_file(p)
+    tree.finish_build()
+    view.model().set_tree(tree)
+    elapsed = time.perf_counter() - start
+    view.model().clear()
+    return elapsed
+
+
+def main():
+    app = QApplication(sys.argv)
+    view = QTreeView()
+    view.setModel(PathTreeModel())
+    view.show()
+    print(f'{"files":>8} {"dirs":>6} {"PathTree(s)":>12} {"us/file":>8} {"linear(s)":>10} {"us/file":>8}')
+    for count, per_dir in [(1000, 2), (5000, 2), (10000, 2), (40000, 8), (120000, 24), (500000, 100)]:
+        paths = make_paths(count, per_dir)
+        indexed = bench_path_tree(view, paths)
+        # 예전 방식은 큰 규모에서 너무 오래 걸리므로 작은 규모만 측정
+        linear = bench_linear(paths) if count <= 10000 else None
+        linear_cols = f'{linear:>10.3f} {linear / count * 1e6:>8.1f}' if linear is not None else f'{"-":>10} {"-":>8}'
+        print(f'{count:>8} {count // per_dir:>6} {indexed:>12.3f} {indexed / count * 1e6:>8.1f} {linear_cols}')
+    view.close()
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""트리 메모리 벤치마크: QTreeWidget(항목 객체) 방식과 PathTree 모델 방식의 파일당 메모리 비교
+
+실행: QT_QPA_PLATFORM=offscreen python gitcontrol/benchmarks/bench_tree_memory.py
+각 측정은 별도 프로세스에서 실행하고, 트리 구성 전후의 RSS(/proc/self/statm) 차이를 잰다 (Linux 전용).
+PathTree 자체 크기는 tracemalloc으로 따로 잰다 (Qt 뷰의 고정 비용 제외).
+"""
+import os
+import subprocess
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+def make_paths(count):
+    # 폴더당 파일 20개, 2단계 폴더 구조
+    return [f'src/module{i // 2000}/pkg{i // 20}/file_{i:07d}.py' for i in range(count)]
+
+
+def rss_bytes():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def build_widget(app, paths):
+    # 예전 방식: 파일마다 체크박스가 달린 QTreeWidgetItem 생성 (폴더는 경로 인덱스 사용)
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QTreeWidget, QTreeWidgetItem
+    tree = QTreeWidget()
+    tree.show()
+    nodes = {}
+
+    def folder(rel_path):
+        node = nodes.get(rel_path)
+        if node is None:
+            parent_path, _, name = rel_path.rpartition('/')
+            node = nodes[rel_path] = QTreeWidgetItem(folder(parent_path) if parent_path else tree, [name])
+        return node
+
+    for p in paths:
+        parent_path, _, name = p.rpartition('/')
+        item = QTreeWidgetItem(folder(parent_path), [name])
+        item.setCheckState(0, Qt.Unchecked)
+    app.processEvents()
+    return tree
+
+
+def build_model(app, paths):
+    # 현재 방식: PathTree(압축 배열) + PathTreeModel + QTreeView
+    from PyQt5.QtWidgets import QTreeView
+    from path_tree import PathTree
+    from tree_model import PathTreeModel
+    tracemalloc.start()
+    tree = PathTree()
+    for p in paths:
+        tree.add_file(p)
+    tree.finish_build()
+    print(tracemalloc.get_traced_memory()[0] / len(paths))
+    tracemalloc.stop()
+    model = PathTreeModel()
+    model.set_tree(tree)
+    view = QTreeView()
+    view.setModel(model)
+    view.show()
+    view.expandToDepth(1)
+    app.processEvents()
+    return view
+
+
+def measure(kind, count):
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    paths = make_paths(count)
+    before = rss_bytes()
+    keep = (build_widget if kind == 'widget' else build_model)(app, paths)
+    after = rss_bytes()
+    print((after - before) / count)
+    return keep
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == '--one':
+        measure(sys.argv[2], int(sys.argv[3]))
+        return
+    print(f'{"files":>8} {"QTreeWidget B/file":>19} {"PathTree B/file":>16} {"(arrays only)":>14}')
+    for count in (20000, 120000, 500000):
+        results = []
+        for kind in ('widget', 'model'):
+            out = subprocess.run([sys.executable, __file__, '--one', kind, str(count)],
+                                 capture_output=True, text=True, check=True).stdout
+            results.append([float(v) for v in out.split()])
+        widget_rss, = results[0]
+        arrays, model_rss = results[1]
+        print(f'{count:>8} {widget_rss:>19.1f} {model_rss:>16.1f} {arrays:>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
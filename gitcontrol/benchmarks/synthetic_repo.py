@@ -0,0 +1,140 @@
+"""벤치마크용 합성 저장소: 파일 N개의 작업 저장소 + 로컬 bare 원격(origin)
+
+- wide: 최상위 그룹 GROUPS 개 아래 폴더마다 파일 FILES_PER_DIR 개 (형제 폴더가 많은 구조)
+- deep: 폴더 번호를 4진수 DEPTH 자리로 풀어 n0/n3/n1/... 처럼 DEPTH 단계 중첩 (깊은 구조)
+images/ 에 작은 PNG 몇 개 (Pillow 가 있을 때)
+만든 저장소는 처음 커밋을 기록해 두고, 다시 쓸 때 작업 폴더/원격을 그 커밋으로 되돌림 (같은 조건에서 측정)
+
+실행: python gitcontrol/benchmarks/synthetic_repo.py <폴더> [파일 수] [wide|deep]
+"""
+import os
+import subprocess
+import sys
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+LAYOUTS = ('wide', 'deep')
+GROUPS = 20
+FILES_PER_DIR = 50
+DEPTH = 8
+IMAGES = 4
+MARKER = 'bench-initial'
+AUTHOR = {'GIT_AUTHOR_NAME': 'bench', 'GIT_AUTHOR_EMAIL': 'bench@example.com',
+          'GIT_COMMITTER_NAME': 'bench', 'GIT_COMMITTER_EMAIL': 'bench@example.com'}
+
+
+def git(cwd, *args, input=None):
+    result = subprocess.run(['git', *args], cwd=cwd, input=input, capture_output=True,
+                            env=dict(os.environ, **AUTHOR), check=True)
+    return result.stdout.decode('utf-8', 'replace').strip()
+
+
+def dir_of(index, layout):
+    # 파일 번호 → 폴더 상대경로
+    folder = index // FILES_PER_DIR
+    if layout == 'wide':
+        return f'g{folder % GROUPS}/d{folder}'
+    digits = []
+    for _ in range(DEPTH):
+        digits.append(f'n{folder % 4}')
+        folder //= 4
+    return '/'.join(digits)
+
+
+def file_paths(count, layout):
+    return [f'{dir_of(i, layout)}/f{i}.txt' for i in range(count)]
+
+
+def write_files(root, paths):
+    made = set()
+    for i, rel_path in enumerate(paths):
+        rel_dir = rel_path.rpartition('/')[0]
+        if rel_dir not in made:
+            os.makedirs(os.path.join(root, rel_dir), exist_ok=True)
+            made.add(rel_dir)
+        with open(os.path.join(root, rel_path), 'w') as f:
+            f.write(f'line {i}\n')
+
+
+def write_images(root):
+    if Image is None:
+        return
+    os.makedirs(os.path.join(root, 'images'), exist_ok=True)
+    for i in range(IMAGES):
+        Image.new('RGB', (1600, 1200), (40 * i, 80, 160)).save(os.path.join(root, 'images', f'photo{i}.png'))
+
+
+def generate(base, count, layout='wide'):
+    # base/<layout>-<count>/ 아래 work(작업 저장소), origin.git(bare) 를 만들고 (work, origin) 경로 반환
+    # 이미 만들어 둔 것이 있으면 처음 커밋으로 되돌려서 다시 씀
+    if layout not in LAYOUTS:
+        raise ValueError(f'layout 은 {LAYOUTS} 중 하나여야 합니다: {layout}')
+    target = os.path.join(base, f'{layout}-{count}')
+    work = os.path.join(target, 'work')
+    origin = os.path.join(target, 'origin.git')
+    marker = os.path.join(target, MARKER)
+    if os.path.exists(marker):
+        with open(marker) as f:
+            reset(work, origin, f.read().strip())
+        return work, origin
+    os.makedirs(work)
+    git(work, 'init', '-q', '-b', 'main')
+    write_files(work, file_paths(count, layout))
+    write_images(work)
+    git(work, 'add', '-A')
+    git(work, 'commit', '-q', '-m', 'initial')
+    git(target, 'clone', '-q', '--bare', work, origin)
+    # 부분 클론/폴더 받기도 시험할 수 있도록
+    git(origin, 'config', 'uploadpack.allowFilter', 'true')
+    git(work, 'remote', 'add', 'origin', origin)
+    git(work, 'fetch', '-q', 'origin')
+    git(work, 'branch', '-q', '-u', 'origin/main')
+    with open(marker, 'w') as f:
+        f.write(git(work, 'rev-parse', 'HEAD'))
+    return work, origin
+
+
+def reset(work, origin, commit):
+    git(origin, 'update-ref', 'refs/heads/main', commit)
+    git(work, 'update-ref', 'refs/remotes/origin/main', commit)
+    git(work, 'checkout', '-q', 'main')
+    git(work, 'reset', '-q', '--hard', commit)
+    git(work, 'clean', '-q', '-fdx')
+
+
+def change_local(work, count, label):
+    # 작업 폴더 변경: 추적 중인 파일 count 개 수정 + 새 파일 count 개
+    tracked = git(work, 'ls-files', '--', '*.txt').splitlines()
+    step = max(1, len(tracked) // count)
+    for rel_path in tracked[::step][:count]:
+        with open(os.path.join(work, rel_path), 'a') as f:
+            f.write(f'{label}\n')
+    os.makedirs(os.path.join(work, 'local', label), exist_ok=True)
+    for i in range(count):
+        with open(os.path.join(work, 'local', label, f'f{i}.txt'), 'w') as f:
+            f.write(f'{label} {i}\n')
+
+
+def change_remote(origin, count, label):
+    # 다른 사람이 올린 커밋 흉내: 작업 폴더 없이 bare 저장소 main 에 새 파일 count 개를 커밋 (fast-import 한 번)
+    lines = ['commit refs/heads/main', 'committer bench <bench@example.com> 0 +0000',
+             f'data {len(label.encode())}', label, 'from refs/heads/main^0']
+    for i in range(count):
+        data = f'{label} {i}\n'
+        lines += [f'M 100644 inline remote/{label}/f{i}.txt', f'data {len(data.encode())}', data]
+    git(origin, 'fast-import', '--quiet', input=('\n'.join(lines) + '\n').encode())
+
+
+def main():
+    base = sys.argv[1]
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    layout = sys.argv[3] if len(sys.argv) > 3 else 'wide'
+    work, origin = generate(base, count, layout)
+    print(f'작업 저장소: {work}\n원격(bare): {origin}')
+
+
+if __name__ == '__main__':
+    main()
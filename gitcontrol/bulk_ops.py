@@ -0,0 +1,304 @@
+import os
+import shutil
+import stat
+import struct
+import tempfile
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from git.index import IndexFile
+from git.index.fun import stat_mode_to_index_mode
+from git.index.typ import IndexEntry
+
+# 트리에서 고른 항목 묶음에 대한 파일 작업 (삭제/이동/복사, Git 삭제/이동). Qt 비의존
+# 항목마다 셸 명령을 띄우지 않고 파일은 스레드 풀에서 처리하고, Git 인덱스는 한 번 읽어 고친 뒤 한 번 씀
+# 지운 항목은 휴지통 폴더(.git/gitcontrol-trash)로 옮겨 두므로 되돌릴 수 있음
+# progress(단계, 현재, 전체, 메시지), cancelled() 가 True 면 아직 시작하지 않은 항목은 건너뜀
+
+WORKERS = 8
+TRASH_DIR = 'gitcontrol-trash'
+
+
+class BulkResult:
+    """일괄 작업 결과 (트리에 반영할 폴더/추적 파일 변경과 되돌리기 함수)"""
+
+    def __init__(self, message, changed_dirs=(), tracked_added=(), tracked_removed=(), undo=None, trash=None):
+        self.message = message
+        # 목록이 바뀐 폴더 상대경로 (트리에서 이 폴더들만 다시 읽음)
+        self.changed_dirs = sorted(set(changed_dirs))
+        self.tracked_added = sorted(tracked_added)
+        self.tracked_removed = sorted(tracked_removed)
+        # undo(progress=None, cancelled=None) → 되돌린 결과 BulkResult. 되돌릴 것이 없으면 None
+        self.undo = undo
+        # 지운 항목을 보관한 휴지통 폴더 (되돌리기 기록을 버릴 때 discard 로 지움)
+        self.trash = trash
+
+
+def discard(result):
+    # 되돌리기 기록을 버릴 때 휴지통에 보관한 항목을 실제로 지움
+    if result.trash:
+        shutil.rmtree(result.trash, ignore_errors=True)
+
+
+def revert(result, progress=None, cancelled=None):
+    # 되돌리고, 끝까지 되돌렸으면 휴지통도 비움 (취소되면 남은 항목을 위해 그대로 둠)
+    reverted = result.undo(progress, cancelled)
+    if cancelled is None or not cancelled():
+        discard(result)
+    return reverted
+
+
+def parent_dir(rel_path):
+    return rel_path.rpartition('/')[0]
+
+
+def _full(root, rel_path):
+    return os.path.join(root, *rel_path.split('/'))
+
+
+def _make_trash(root):
+    # 같은 드라이브의 .git 안에 두면 폴더도 이름만 바꿔서 옮겨짐 (저장소가 아니면 임시 폴더)
+    git_dir = os.path.join(root, '.git')
+    base = os.path.join(git_dir if os.path.isdir(git_dir) else tempfile.gettempdir(), TRASH_DIR)
+    os.makedirs(base, exist_ok=True)
+    return tempfile.mkdtemp(dir=base)
+
+
+def _move(src, dst):
+    # 상위 폴더를 만들어 가며 옮김. 대상이 이미 있으면 덮어쓰지 않고 실패
+    if os.path.lexists(dst):
+        raise FileExistsError(f'이미 있습니다: {dst}')
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    try:
+        os.rename(src, dst)
+    except OSError:
+        # 다른 드라이브(임시 폴더 휴지통 등)면 복사 후 삭제
+        if not os.path.lexists(src):
+            raise
+        shutil.move(src, dst)
+
+
+def _copy(src, dst):
+    if os.path.lexists(dst):
+        raise FileExistsError(f'이미 있습니다: {dst}')
+    if os.path.isdir(src) and not os.path.islink(src):
+        shutil.copytree(src, dst, symlinks=True)
+    else:
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        shutil.copy2(src, dst, follow_symlinks=False)
+
+
+def _remove(path):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+
+
+def _prune_empty_dirs(root, rel_dirs):
+    # 비게 된 폴더를 깊은 것부터 지움 (git rm 처럼)
+    for rel_dir in sorted(set(rel_dirs), key=lambda p: p.count('/'), reverse=True):
+        while rel_dir:
+            try:
+                os.rmdir(_full(root, rel_dir))
+            except OSError:
+                break
+            rel_dir = parent_dir(rel_dir)
+
+
+def run_parallel(func, jobs, stage, progress=None, cancelled=None):
+    # jobs 의 각 인자 묶음으로 func 를 스레드 풀에서 실행 → (성공한 작업, [(실패한 작업, 오류)])
+    # 취소되면 아직 시작하지 않은 작업은 건너뜀 (성공한 작업까지만 되돌리기에 들어감)
+    def run(job):
+        if cancelled is not None and cancelled():
+            return False
+        func(*job)
+        return True
+
+    done, failed = [], []
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        futures = {pool.submit(run, job): job for job in jobs}
+        for count, future in enumerate(as_completed(futures), 1):
+            job = futures[future]
+            try:
+                if future.result():
+                    done.append(job)
+            except OSError as e:
+                failed.append((job, e))
+            if progress is not None:
+                progress(stage, count, len(jobs), '')
+    return done, failed
+
+
+def _summary(action, done, failed, cancelled):
+    message = f'{action} 완료: {len(done)}개'
+    if failed:
+        message += f', 실패 {len(failed)}개 ({failed[0][1]})'
+    if cancelled is not None and cancelled():
+        message += ' (취소됨)'
+    return message
+
+
+def _move_back(moves, stage, progress, cancelled):
+    # 옮긴 (원래 위치, 옮긴 위치) 목록을 거꾸로 옮김
+    done, _failed = run_parallel(_move, [(dst, src) for src, dst in moves], stage, progress, cancelled)
+    return done
+
+
+# ---- 작업 폴더 ----
+def delete_paths(root, rel_paths, progress=None, cancelled=None):
+    # 항목(폴더면 통째로)을 휴지통으로 옮김
+    trash = _make_trash(root)
+    jobs = {(_full(root, p), os.path.join(trash, *p.split('/'))): p for p in rel_paths}
+    done, failed = run_parallel(_move, list(jobs), '삭제 중', progress, cancelled)
+    changed = [parent_dir(jobs[job]) for job in done]
+
+    def undo(progress=None, cancelled=None):
+        restored = _move_back(done, '복원 중', progress, cancelled)
+        return BulkResult(f'삭제 되돌림: {len(restored)}개', changed)
+
+    return BulkResult(_summary('삭제', done, failed, cancelled), changed, undo=undo if done else None, trash=trash)
+
+
+def move_paths(root, moves, progress=None, cancelled=None):
+    # moves: [(원래 상대경로, 새 상대경로)] (이름 바꾸기는 같은 폴더 안의 이동)
+    jobs = {(_full(root, src), _full(root, dst)): (src, dst) for src, dst in moves}
+    done, failed = run_parallel(_move, list(jobs), '이동 중', progress, cancelled)
+    changed = [parent_dir(p) for job in done for p in jobs[job]]
+
+    def undo(progress=None, cancelled=None):
+        restored = _move_back(done, '되돌리는 중', progress, cancelled)
+        return BulkResult(f'이동 되돌림: {len(restored)}개', changed)
+
+    return BulkResult(_summary('이동', done, failed, cancelled), changed, undo=undo if done else None)
+
+
+def copy_paths(root, copies, progress=None, cancelled=None):
+    # copies: [(원본 상대경로, 복사본 상대경로)]
+    jobs = {(_full(root, src), _full(root, dst)): dst for src, dst in copies}
+    done, failed = run_parallel(_copy, list(jobs), '복사 중', progress, cancelled)
+    changed = [parent_dir(jobs[job]) for job in done]
+
+    def undo(progress=None, cancelled=None):
+        removed, _failed = run_parallel(_remove, [(dst,) for _src, dst in done], '복사본 지우는 중', progress, cancelled)
+        return BulkResult(f'복사 되돌림: {len(removed)}개', changed)
+
+    return BulkResult(_summary('복사', done, failed, cancelled), changed, undo=undo if done else None)
+
+
+def copy_name(root, rel_path):
+    # 같은 폴더에 만들 복사본 이름: 'a.txt' → 'a - 복사본.txt', 이미 있으면 'a - 복사본 (2).txt' ...
+    folder, _, name = rel_path.rpartition('/')
+    stem, ext = (name, '') if os.path.isdir(_full(root, rel_path)) else os.path.splitext(name)
+    candidate = f'{stem} - 복사본{ext}'
+    number = 2
+    while os.path.lexists(_full(root, f'{folder}/{candidate}' if folder else candidate)):
+        candidate = f'{stem} - 복사본 ({number}){ext}'
+        number += 1
+    return f'{folder}/{candidate}' if folder else candidate
+
+
+# ---- Git (인덱스는 프로세스 안에서 한 번 읽고 한 번 씀) ----
+def _entries_under(keys, rel_path):
+    # 정렬된 인덱스 키 중 rel_path 자신이거나 그 아래인 것 (이분 탐색으로 접두사 범위만 훑음)
+    # 'a' 와 'a/...' 사이에 'a-b', 'a.txt' 가 올 수 있으므로 'a/' 보다 뒤인 다른 경로가 나올 때까지 확인
+    prefix = rel_path + '/'
+    found = []
+    for i in range(bisect_left(keys, (rel_path, 0)), len(keys)):
+        path = keys[i][0]
+        if path == rel_path or path.startswith(prefix):
+            found.append(keys[i])
+        elif path > prefix:
+            break
+    return found
+
+
+def _entry_at(entry, rel_path, full_path):
+    # 같은 내용(blob)의 인덱스 항목을 새 경로와 그 파일의 stat 정보로 (다음 변경 확인에서 바뀐 파일로 보이지 않도록)
+    try:
+        st = os.lstat(full_path)
+    except OSError:
+        return IndexEntry((entry.mode, entry.binsha, entry.flags, rel_path) + tuple(entry[4:]))
+    mode = entry.mode if stat.S_ISDIR(st.st_mode) else stat_mode_to_index_mode(st.st_mode)
+    return IndexEntry((
+        mode, entry.binsha, entry.flags, rel_path,
+        struct.pack('>LL', st.st_ctime_ns // 1000000000, st.st_ctime_ns % 1000000000),
+        struct.pack('>LL', st.st_mtime_ns // 1000000000, st.st_mtime_ns % 1000000000),
+        st.st_dev & 0xFFFFFFFF, st.st_ino & 0xFFFFFFFF, st.st_uid, st.st_gid, st.st_size & 0xFFFFFFFF,
+        entry.extended_flags))
+
+
+def git_remove(repo, rel_paths, keep_files=False, progress=None, cancelled=None):
+    # git rm -r (keep_files 면 git rm -r --cached). 인덱스에서 한 번에 빼고, 추적 파일은 휴지통으로
+    # (GitPython index.remove 는 경로를 모두 인자로 붙여 git rm 프로세스를 띄우므로 쓰지 않음)
+    root = repo.working_tree_dir
+    index = IndexFile(repo)
+    keys = sorted(index.entries)
+    found = list(dict.fromkeys(key for rel_path in rel_paths for key in _entries_under(keys, rel_path)))
+    if not found:
+        return BulkResult('Git 에서 추적 중인 항목이 없습니다.')
+    saved = {key: index.entries.pop(key) for key in found}
+    # 캐시 트리(TREE 확장)는 버림. 그대로 쓰면 git status 가 지운 폴더를 바뀌지 않은 것으로 봄
+    index.write(ignore_extension_data=True)
+    removed = list(dict.fromkeys(path for path, _stage in found))
+    changed = {parent_dir(p) for p in rel_paths}
+    done, failed, trash = [], [], None
+    if not keep_files:
+        trash = _make_trash(root)
+        jobs = [(_full(root, p), os.path.join(trash, *p.split('/'))) for p in removed
+                if os.path.lexists(_full(root, p))]
+        done, failed = run_parallel(_move, jobs, 'Git 삭제 중', progress, cancelled)
+        _prune_empty_dirs(root, [parent_dir(p) for p in removed])
+        changed.update(parent_dir(p) for p in removed)
+
+    def undo(progress=None, cancelled=None):
+        _move_back(done, '복원 중', progress, cancelled)
+        index = IndexFile(repo)
+        for key, entry in saved.items():
+            index.entries[key] = entry if keep_files else _entry_at(entry, key[0], _full(root, key[0]))
+        index.write(ignore_extension_data=True)
+        return BulkResult(f'Git 삭제 되돌림: {len(removed)}개', changed, tracked_added=removed)
+
+    message = f'{"Git 추적 해제" if keep_files else "Git 삭제"} 완료: {len(removed)}개'
+    if failed:
+        message += f', 파일 삭제 실패 {len(failed)}개 ({failed[0][1]})'
+    return BulkResult(message, changed, tracked_removed=removed, undo=undo, trash=trash)
+
+
+def _rename_entries(repo, renames, index=None):
+    # 인덱스 항목 경로를 {원래 경로: 새 경로} 대로 한 번에 바꿔 씀 (blob 은 그대로)
+    root = repo.working_tree_dir
+    index = index or IndexFile(repo)
+    for key in [key for key in index.entries if key[0] in renames]:
+        entry = index.entries.pop(key)
+        new_path = renames[key[0]]
+        index.entries[(new_path, key[1])] = _entry_at(entry, new_path, _full(root, new_path))
+    index.write(ignore_extension_data=True)
+
+
+def git_move(repo, moves, progress=None, cancelled=None):
+    # git mv: 작업 폴더는 항목(폴더면 통째로)마다 이름만 바꾸고, 인덱스 경로는 한 번에 고쳐 씀
+    root = repo.working_tree_dir
+    # 인덱스는 한 번만 읽음 (GitPython 의 인덱스 읽기/쓰기는 항목 수에 비례해서 느림)
+    index = IndexFile(repo)
+    keys = sorted(index.entries)
+    jobs = {(_full(root, src), _full(root, dst)): (src, dst) for src, dst in moves}
+    done, failed = run_parallel(_move, list(jobs), 'Git 이동 중', progress, cancelled)
+    renames = {}
+    for job in done:
+        src, dst = jobs[job]
+        for path, _stage in _entries_under(keys, src):
+            renames[path] = dst + path[len(src):]
+    if renames:
+        _rename_entries(repo, renames, index)
+    changed = [parent_dir(p) for job in done for p in jobs[job]]
+
+    def undo(progress=None, cancelled=None):
+        restored = _move_back(done, '되돌리는 중', progress, cancelled)
+        if renames:
+            _rename_entries(repo, {new_path: path for path, new_path in renames.items()})
+        return BulkResult(f'Git 이동 되돌림: {len(restored)}개', changed,
+                          tracked_added=renames.keys(), tracked_removed=renames.values())
+
+    return BulkResult(_summary('Git 이동', done, failed, cancelled), changed,
+                      tracked_added=renames.values(), tracked_removed=renames.keys(), undo=undo if done else None)
@@ -0,0 +1,88 @@
+import argparse
+import os
+import sys
+
+import tracing
+
+# 명령줄에서 Git 작업 실행 (python -m gitcontrol <작업> [저장소 경로]). cron 이나 auto_push 에서 씀
+# Qt 는 불러오지 않고, GitPython 이 필요한 git_ops 는 인자를 확인한 뒤 작업을 실행할 때 불러옴 (빠른 시작)
+
+# git_ops.OPERATIONS 의 작업 이름 (여기서 git_ops 를 불러오지 않도록 따로 둠)
+OPERATIONS = ('upload', 'download', 'sync_local_to_git', 'sync_git_to_local', 'fetch', 'download_folders',
+              'build_images')
+# 커밋 메시지를 받는 작업
+COMMIT_OPERATIONS = ('upload', 'sync_local_to_git')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m gitcontrol', description='Qt 없이 Git 작업 실행')
+    parser.add_argument('operation', choices=OPERATIONS)
+    parser.add_argument('repo_path', nargs='?', default='.')
+    parser.add_argument('-m', '--message', help='커밋 메시지 (upload, sync_local_to_git)')
+    parser.add_argument('--url', help='부분 다운로드로 빈 폴더에 처음 받을 때의 원격 주소')
+    parser.add_argument('--partial', action='store_true',
+                        help='부분 클론 모드 (download, sync_git_to_local): blob 없이 받고 --folders 만 작업 폴더에 둠')
+    parser.add_argument('--folders', nargs='+', help='부분 클론 모드에서 받을 폴더 목록')
+    parser.add_argument('--paths', nargs='+', default=[], help='download_folders 로 받을 폴더/파일 목록')
+    parser.add_argument('--overwrite', action='store_true',
+                        help='download_folders: 커밋하지 않은 로컬 변경이 있어도 원격 내용으로 덮어씀')
+    parser.add_argument('--trace', help='작업 시간 측정 기록을 Chrome trace JSON 으로 저장할 경로')
+    parser.add_argument('-q', '--quiet', action='store_true', help='진행 표시를 출력하지 않음')
+    return parser
+
+
+def operation_kwargs(args):
+    kwargs = {}
+    if args.message and args.operation in COMMIT_OPERATIONS:
+        kwargs['message'] = args.message
+    if args.partial and args.operation in ('download', 'sync_git_to_local'):
+        kwargs.update(partial=True, folders=args.folders)
+    if args.operation == 'download_folders':
+        kwargs.update(paths=args.paths, overwrite=args.overwrite)
+    return kwargs
+
+
+def progress_printer(stream):
+    # 터미널이면 같은 줄을 덮어쓰며 진행 상황 표시
+    def show(stage, cur_count, max_count, message=''):
+        counts = f'{cur_count}/{max_count}' if max_count else f'{cur_count}'
+        stream.write(f'\r{stage} {counts}' + (f' - {message.strip(", ")}' if message else '') + '\033[K')
+        stream.flush()
+    return show
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.operation == 'download_folders' and not args.paths:
+        print('download_folders 에는 --paths 가 필요합니다.', file=sys.stderr)
+        return 2
+    if not os.path.isdir(args.repo_path):
+        print(f'저장소 폴더가 없습니다: {args.repo_path}', file=sys.stderr)
+        return 2
+    if args.trace:
+        tracing.enable()
+    show = progress_printer(sys.stderr) if not args.quiet and sys.stderr.isatty() else None
+    # 여기서부터 GitPython 을 불러옴
+    from git import GitCommandError
+    from git_ops import OperationCancelled, RemoteRunner, open_and_run
+    runner = RemoteRunner(show)
+    code = 0
+    try:
+        message, added, removed = open_and_run(os.path.abspath(args.repo_path), args.operation, runner,
+                                               args.url, **operation_kwargs(args))
+        if show is not None:
+            sys.stderr.write('\r\033[K')
+        print(message + (f' (추적 파일 +{len(added)} -{len(removed)})' if added or removed else ''))
+    except (KeyboardInterrupt, OperationCancelled):
+        runner.cancel()
+        print('작업이 취소되었습니다.', file=sys.stderr)
+        code = 130
+    except GitCommandError as e:
+        print(f'Git 오류: {str(e)}', file=sys.stderr)
+        code = 1
+    except Exception as e:
+        print(f'오류 발생: {str(e)}', file=sys.stderr)
+        code = 1
+    if args.trace:
+        tracing.export_chrome(args.trace)
+    return code
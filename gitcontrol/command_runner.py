@@ -0,0 +1,180 @@
+import codecs
+import locale
+import os
+import re
+import sys
+
+from PyQt5.QtCore import QObject, QProcess, QProcessEnvironment, pyqtSignal
+
+# 사용자가 입력한 셸 명령을 GUI 프로세스 밖에서 비동기로 실행 (os.chdir / 새 콘솔 창 없이)
+# Windows 는 cmd.exe, 그 밖에는 /bin/sh 로 실행하고 출력은 줄 단위로 돌려줌
+
+WINDOWS = sys.platform == 'win32'
+
+# 옵션 입력란에 채워 넣는 파일 명령 (운영체제별). {path}/{paths} 는 따옴표로 감싼 경로,
+# 이름 변경은 Windows 는 새 이름({name}), 그 밖에는 같은 폴더 안의 새 경로({new_path})를 씀
+if WINDOWS:
+    SHELL_COMMANDS = {
+        'new_file': 'type nul > {path}',
+        'new_dir': 'mkdir {paths}',
+        'rename': 'rename {path} {name}',
+        'delete_file': 'del {paths}',
+        'delete_dir': 'rmdir /s /q {paths}',
+        'copy': 'copy {paths} {target}',
+        'reveal': 'explorer /select,{path}',
+    }
+else:
+    SHELL_COMMANDS = {
+        'new_file': 'touch {path}',
+        'new_dir': 'mkdir -p {paths}',
+        'rename': 'mv {path} {new_path}',
+        'delete_file': 'rm {paths}',
+        'delete_dir': 'rm -rf {paths}',
+        'copy': 'cp {paths} {target}',
+        'reveal': 'open -R {path}' if sys.platform == 'darwin' else 'xdg-open "$(dirname {path})"',
+    }
+
+# 명령 문자열에서 경로 후보를 꺼냄 (따옴표 안은 통째로, 셸 연산자는 제외)
+TOKEN_RE = re.compile(r'"([^"]*)"|\'([^\']*)\'|([^\s"\'&|;<>()]+)')
+LINE_RE = re.compile(r'\r\n|\r|\n')
+# 명령 중에 git 을 실행하는 부분이 있는지 (있으면 tracked 파일 목록도 다시 확인)
+GIT_RE = re.compile(r'(?:^|[&|;(]\s*)git(?:\.exe)?\s', re.I)
+
+
+def shell_command(action, path='', paths=None, name='', target=''):
+    # SHELL_COMMANDS 템플릿에 경로를 넣어 명령 문자열을 만듦
+    parent = path.rpartition('/')[0]
+    new_path = f'{parent}/{name}' if parent else name
+    return SHELL_COMMANDS[action].format(path=f'"{path}"', paths=paths or f'"{path}"', name=f'"{name}"',
+                                         new_path=f'"{new_path}"', target=f'"{target}"')
+
+
+def command_paths(command, cwd):
+    # 명령에 나온 작업 폴더 안의 상대경로 후보 (옵션, 작업 폴더 밖의 경로는 제외)
+    root = os.path.abspath(cwd)
+    paths = []
+    for quoted, single, bare in TOKEN_RE.findall(command):
+        token = quoted or single or bare
+        if not token or token.startswith('-') or (WINDOWS and token.startswith('/')):
+            continue
+        full = os.path.normpath(os.path.join(root, token))
+        rel_path = os.path.relpath(full, root).replace('\\', '/')
+        if rel_path.startswith('../') or rel_path == '..':
+            continue
+        if rel_path == '.':
+            # 'git add .' 처럼 작업 폴더 전체
+            rel_path = ''
+        if rel_path not in paths:
+            paths.append(rel_path)
+    return paths
+
+
+def runs_git(command):
+    return GIT_RE.search(command) is not None
+
+
+class CommandJob:
+    """실행 중인 명령 하나 (프로세스, 줄 단위로 나누기 전 출력, 실행 전에 있던 경로)"""
+
+    def __init__(self, job_id, command, cwd, process):
+        self.job_id = job_id
+        self.command = command
+        self.cwd = cwd
+        self.process = process
+        encoding = locale.getpreferredencoding(False) if WINDOWS else 'utf-8'
+        self.decoders = {stream: codecs.getincrementaldecoder(encoding)(errors='replace') for stream in (False, True)}
+        self.partial = {False: '', True: ''}
+        self.paths = command_paths(command, cwd)
+        self.existed = {path for path in self.paths if os.path.lexists(os.path.join(cwd, path))}
+
+    def affected_paths(self):
+        # 명령 전이나 후에 실제로 있던 경로 (명령 이름 같은 낱말은 빠짐)
+        return [path for path in self.paths
+                if path in self.existed or os.path.lexists(os.path.join(self.cwd, path))]
+
+
+class CommandRunner(QObject):
+    """셸 명령을 QProcess 로 여러 개 동시에 실행하고 출력을 줄 단위로 알리는 실행기"""
+    # (작업 번호, 명령)
+    started = pyqtSignal(int, str)
+    # (작업 번호, 출력 줄 목록, 오류 출력 여부)
+    output = pyqtSignal(int, list, bool)
+    # (작업 번호, 종료 코드(시작 실패/강제 종료는 -1), 명령, 실행 폴더, 영향받은 상대경로 목록)
+    finished = pyqtSignal(int, int, str, str, list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs = {}
+        self._next_id = 1
+
+    def run(self, command, cwd):
+        # 명령을 cwd 에서 실행하고 작업 번호를 돌려줌 (GUI 프로세스의 작업 폴더는 바꾸지 않음)
+        job_id = self._next_id
+        self._next_id += 1
+        process = QProcess(self)
+        process.setWorkingDirectory(cwd)
+        env = QProcessEnvironment.systemEnvironment()
+        # 입력 창이 없으므로 인증 프롬프트에서 멈추지 않고 바로 실패하게 함
+        env.insert('GIT_TERMINAL_PROMPT', '0')
+        process.setProcessEnvironment(env)
+        job = CommandJob(job_id, command, cwd, process)
+        self._jobs[job_id] = job
+        process.readyReadStandardOutput.connect(lambda: self._read(job, False))
+        process.readyReadStandardError.connect(lambda: self._read(job, True))
+        process.finished.connect(lambda code, status: self._finish(job, code if status == QProcess.NormalExit else -1))
+        process.errorOccurred.connect(lambda error: self._on_error(job, error))
+        if WINDOWS:
+            # cmd.exe 는 인자를 직접 해석하므로 따옴표를 그대로 넘김 (/s: 바깥 따옴표만 벗김)
+            process.setProgram(os.environ.get('COMSPEC', 'cmd.exe'))
+            process.setNativeArguments(f'/d /s /c "{command}"')
+        else:
+            process.setProgram('/bin/sh')
+            process.setArguments(['-c', command])
+        self.started.emit(job_id, command)
+        process.start()
+        process.closeWriteChannel()
+        return job_id
+
+    def running(self):
+        return len(self._jobs)
+
+    def _read(self, job, is_error):
+        process = job.process
+        data = bytes(process.readAllStandardError() if is_error else process.readAllStandardOutput())
+        text = job.partial[is_error] + job.decoders[is_error].decode(data)
+        lines = LINE_RE.split(text)
+        job.partial[is_error] = lines.pop()
+        if lines:
+            self.output.emit(job.job_id, lines, is_error)
+
+    def _flush(self, job):
+        for is_error in (False, True):
+            rest = job.partial[is_error] + job.decoders[is_error].decode(b'', final=True)
+            job.partial[is_error] = ''
+            if rest:
+                self.output.emit(job.job_id, [rest], is_error)
+
+    def _on_error(self, job, error):
+        # 시작 실패는 finished 가 오지 않으므로 여기서 끝냄
+        if error == QProcess.FailedToStart:
+            self.output.emit(job.job_id, [f'실행 실패: {job.process.errorString()}'], True)
+            self._finish(job, -1)
+
+    def _finish(self, job, exit_code):
+        if self._jobs.pop(job.job_id, None) is None:
+            return
+        self._read(job, False)
+        self._read(job, True)
+        self._flush(job)
+        self.finished.emit(job.job_id, exit_code, job.command, job.cwd, job.affected_paths())
+        job.process.deleteLater()
+
+    def kill(self, job_id=None):
+        # 해당 작업(없으면 전체)을 강제 종료
+        for job in list(self._jobs.values()):
+            if job_id is None or job.job_id == job_id:
+                job.process.kill()
+
+    def wait_all(self, msecs=3000):
+        for job in list(self._jobs.values()):
+            job.process.waitForFinished(msecs)
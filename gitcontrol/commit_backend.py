@@ -0,0 +1,261 @@
+import os
+import stat
+import struct
+from io import BytesIO
+
+from git import Repo, GitCommandError
+from git.index import IndexFile
+from git.index.fun import stat_mode_to_index_mode
+from git.index.typ import IndexEntry
+from gitdb import LooseObjectDB
+from gitdb.base import IStream
+
+import tracing
+from assets import AssetConfig
+from gitignore import IgnoreRules
+
+try:
+    # 있으면 순수 파이썬 Git 구현(dulwich) 백엔드도 사용 가능
+    from dulwich import porcelain
+    from dulwich.repo import Repo as DulwichRepo
+except ImportError:
+    porcelain = None
+
+# auto_push 용 커밋/푸시 백엔드: 저장소를 한 번 열어 두고 주기마다 셸/git 프로세스를 띄우지 않음 (Qt 비의존)
+
+
+class GitPythonBackend:
+    """GitPython 으로 변경 확인/스테이징/트리 비교/커밋을 프로세스 안에서 처리하는 백엔드"""
+
+    def __init__(self, repo_path):
+        # 저장소 탐색은 처음 한 번만
+        self.repo = Repo(repo_path, search_parent_directories=True)
+        self.root = self.repo.working_tree_dir
+        self._index = None
+        self._index_stamp = None
+        # 마지막으로 트리를 비교했을 때의 인덱스 상태 (그대로면 트리를 다시 계산하지 않음)
+        self._checked_stamp = None
+        # 무시 규칙 (git check-ignore 프로세스 대신 내장 판별기). 규칙 파일이 바뀌면 새로 만듦
+        self._ignore = IgnoreRules(self.root)
+        self._ignore_stamps = {}
+        # 큰 바이너리 포인터 설정 (assets.py install 로 켠 저장소만). git 필터와 같은 포인터를 만듦
+        self.assets = AssetConfig.load(self.repo)
+
+    def _stat_index(self):
+        try:
+            st = os.stat(os.path.join(self.repo.git_dir, 'index'))
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _load_index(self):
+        # 인덱스 파일이 밖에서 바뀌었을 때만 다시 읽음
+        stamp = self._stat_index()
+        if self._index is None or stamp != self._index_stamp:
+            self._index = IndexFile(self.repo)
+            self._index_stamp = stamp
+        return self._index
+
+    def _classify(self, paths):
+        # 추적 안 된 경로 중 무시되지 않는 것만 (폴더는 '/'로 끝남)
+        return self._ignore.filter_paths(paths)
+
+    def _check_ignore_file(self, rel_path, mtime_ns, stamps):
+        # 규칙 파일이 생기거나 바뀌면 판별기를 새로 만듦 (내용이 같은 규칙 파일은 컴파일 결과를 다시 씀)
+        stamps[rel_path] = mtime_ns
+        if self._ignore_stamps.get(rel_path) != mtime_ns:
+            self._ignore = IgnoreRules(self.root)
+
+    def scan(self):
+        # 작업 폴더를 stat 만으로 훑어서 (바뀐 파일, 새 파일, 지워진 파일). 파일 내용은 읽지 않음
+        with tracing.span('walk', root=self.root) as span:
+            modified, new, deleted = self._scan()
+            span.set(modified=len(modified), new=len(new), deleted=len(deleted))
+        return modified, new, deleted
+
+    def _scan(self):
+        index = self._load_index()
+        # sparse-checkout 으로 작업 폴더에 두지 않은 파일(skip-worktree)은 지워진 것이 아님
+        entries = {path: entry for (path, stage), entry in index.entries.items()
+                   if stage == 0 and not entry.skip_worktree}
+        tracked_dirs = {''}
+        for path in entries:
+            while True:
+                path = path.rpartition('/')[0]
+                if path in tracked_dirs:
+                    break
+                tracked_dirs.add(path)
+        stamps = {}
+        for path in self._ignore.exclude_paths:
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            self._check_ignore_file(path, mtime_ns, stamps)
+        modified, new, seen = [], [], set()
+        level = ['']
+        # 폴더 깊이 단위로 훑고, 추적 안 된 폴더/파일은 깊이마다 한 번에 무시 여부 판별
+        while level:
+            next_level, new_dirs, new_files = [], [], []
+            for rel_dir in level:
+                try:
+                    it = os.scandir(os.path.join(self.root, rel_dir) if rel_dir else self.root)
+                except OSError:
+                    continue
+                has_rules = False
+                with it:
+                    for entry in it:
+                        rel_path = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name == '.git':
+                                    continue
+                                if rel_path in entries:
+                                    # 하위 모듈 (gitlink) 은 건드리지 않음
+                                    seen.add(rel_path)
+                                    continue
+                                if rel_path in tracked_dirs:
+                                    next_level.append(rel_path)
+                                else:
+                                    new_dirs.append(rel_path + '/')
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        if entry.name == '.gitignore':
+                            has_rules = True
+                            self._check_ignore_file(rel_path, st.st_mtime_ns, stamps)
+                        tracked = entries.get(rel_path)
+                        if tracked is None:
+                            new_files.append(rel_path)
+                            continue
+                        seen.add(rel_path)
+                        sec, nsec = tracked.mtime
+                        if st.st_size & 0xFFFFFFFF != tracked.size or st.st_mtime_ns != sec * 1000000000 + nsec:
+                            modified.append(rel_path)
+                # .gitignore 가 없는 폴더는 판별기가 파일을 열어 보지 않도록 알려 둠
+                self._ignore.load_dir(rel_dir, has_rules)
+            next_level.extend(path[:-1] for path in self._classify(new_dirs))
+            new.extend(self._classify(new_files))
+            level = next_level
+        if set(self._ignore_stamps) - set(stamps):
+            # .gitignore 가 지워졌으면 다음 번에 다시 판별
+            self._ignore = IgnoreRules(self.root)
+        self._ignore_stamps = stamps
+        deleted = [path for path in entries if path not in seen]
+        return modified, new, deleted
+
+    def _store_blob(self, size, stream):
+        # 느슨한 객체로 직접 저장 (GitPython 3.2 의 odb.store 는 git hash-object 프로세스를 띄움)
+        return LooseObjectDB.store(self.repo.odb, IStream(b'blob', size, stream))
+
+    def _stage_file(self, index, rel_path):
+        # 파일 내용을 객체 DB 에 저장하고 stat 정보까지 채운 인덱스 항목으로 교체
+        # (GitPython index.add 는 stat 정보를 0 으로 남겨서 다음 주기에 모든 파일이 바뀐 것으로 보임)
+        full_path = os.path.join(self.root, rel_path)
+        st = os.lstat(full_path)
+        if stat.S_ISLNK(st.st_mode):
+            data = os.fsencode(os.readlink(full_path))
+            istream = self._store_blob(len(data), BytesIO(data))
+        elif stat.S_ISREG(st.st_mode):
+            pointer = self.assets.clean_file(self.root, rel_path) if self.assets is not None else None
+            if pointer is not None:
+                istream = self._store_blob(len(pointer), BytesIO(pointer))
+            else:
+                with open(full_path, 'rb') as f:
+                    st = os.fstat(f.fileno())
+                    istream = self._store_blob(st.st_size, f)
+                tracing.count('bytes hashed', st.st_size)
+        else:
+            return
+        index.entries[(rel_path, 0)] = IndexEntry((
+            stat_mode_to_index_mode(st.st_mode), istream.binsha, 0, rel_path,
+            struct.pack('>LL', st.st_ctime_ns // 1000000000, st.st_ctime_ns % 1000000000),
+            struct.pack('>LL', st.st_mtime_ns // 1000000000, st.st_mtime_ns % 1000000000),
+            st.st_dev & 0xFFFFFFFF, st.st_ino & 0xFFFFFFFF, st.st_uid, st.st_gid, st.st_size & 0xFFFFFFFF))
+
+    def _head_tree(self):
+        try:
+            return self.repo.head.commit.tree.binsha
+        except ValueError:
+            # 아직 커밋이 없는 저장소
+            return None
+
+    def commit(self, message):
+        # 바뀐 파일만 스테이징하고, 인덱스 트리 해시가 HEAD 트리와 같으면 커밋하지 않음. 커밋했으면 True
+        modified, new, deleted = self.scan()
+        index = self._load_index()
+        if not (modified or new or deleted) and self._checked_stamp == self._index_stamp:
+            return False
+        with tracing.span('add', files=len(modified) + len(new), deleted=len(deleted)):
+            for path in modified + new:
+                try:
+                    self._stage_file(index, path)
+                except OSError:
+                    # 훑은 뒤에 지워진 파일
+                    index.entries.pop((path, 0), None)
+            for path in deleted:
+                index.entries.pop((path, 0), None)
+            if modified or new or deleted:
+                # 예전 트리 캐시(TREE 확장)를 남기면 git 이 바뀐 폴더를 예전 트리로 보므로 확장 없이 씀
+                index.write(ignore_extension_data=True)
+                if self.assets is not None:
+                    self.assets.cache.save()
+        tracing.count('objects written', len(modified) + len(new))
+        with tracing.span('commit'):
+            tree = index.write_tree()
+            self._index_stamp = self._checked_stamp = self._stat_index()
+            if tree.binsha == self._head_tree():
+                return False
+            index.commit(message)
+        return True
+
+    def push(self, remote, branch):
+        # 원격 전송만은 git 프로세스가 필요 (새 커밋이 있을 때만 실행됨)
+        try:
+            with tracing.span('push', remote=remote, branch=branch):
+                self.repo.git.push(remote, branch)
+        except GitCommandError as e:
+            print(f"푸시 실패: {e.stderr.strip()}")
+            return False
+        return True
+
+
+class DulwichBackend:
+    """dulwich 로 같은 일을 하는 백엔드 (원격 전송까지 프로세스 안에서 처리, dulwich 설치 시)"""
+
+    def __init__(self, repo_path):
+        if porcelain is None:
+            raise ImportError('dulwich 가 설치되어 있지 않습니다.')
+        self.repo = DulwichRepo.discover(repo_path)
+
+    def commit(self, message):
+        status = porcelain.status(self.repo)
+        paths = [p.decode('utf-8', 'surrogateescape') if isinstance(p, bytes) else p
+                 for p in list(status.unstaged) + list(status.untracked)]
+        if paths:
+            # 지워진 파일은 stage() 가 인덱스에서 뺌
+            self.repo.stage(paths)
+        tree_id = self.repo.open_index().commit(self.repo.object_store)
+        try:
+            head_tree = self.repo[self.repo.head()].tree
+        except KeyError:
+            head_tree = None
+        if tree_id == head_tree:
+            return False
+        porcelain.commit(self.repo, message=message.encode('utf-8'))
+        return True
+
+    def push(self, remote, branch):
+        try:
+            porcelain.push(self.repo, remote, f'refs/heads/{branch}')
+        except Exception as e:
+            print(f"푸시 실패: {e}")
+            return False
+        return True
+
+
+BACKENDS = {
+    'gitpython': GitPythonBackend,
+    'dulwich': DulwichBackend,
+}
@@ -0,0 +1,66 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from gitignore import join_rel_path
+
+# 작업 폴더 병렬 스캐너 (Qt 비의존)
+# 네트워크 드라이브나 캐시가 비어 있는 디스크에서는 폴더 읽기가 응답 지연에 묶이므로,
+# 여러 폴더의 os.scandir 를 스레드 풀에서 동시에 실행하고 읽힌 폴더부터 묶어서 돌려줌
+
+WORKERS = 16
+BATCH_INTERVAL = 0.1
+
+
+def list_dir(root, rel_dir, ignore=None):
+    # 폴더 한 단계 → (폴더 상대경로, 하위 폴더 목록, 파일 목록) (.git 제외, 이름순)
+    # ignore(IgnoreRules)가 있으면 무시 규칙에 걸리는 항목은 빼서, 무시된 폴더(node_modules 등)는 들어가지 않음
+    dirs, files = [], []
+    try:
+        with os.scandir(os.path.join(root, rel_dir) if rel_dir else root) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != '.git':
+                            dirs.append(entry.name)
+                    else:
+                        files.append(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    if ignore is not None:
+        ignore.load_dir(rel_dir, '.gitignore' in files)
+        dirs = [name for name in dirs if not ignore.matches(join_rel_path(rel_dir, name), True)]
+        files = [name for name in files if not ignore.matches(join_rel_path(rel_dir, name), False)]
+    dirs.sort()
+    files.sort()
+    return rel_dir, dirs, files
+
+
+def scan_tree(root, ignore=None, start='', workers=WORKERS, batch_interval=BATCH_INTERVAL, cancelled=None):
+    # start 폴더 아래 전체를 읽어서 batch_interval 초마다 [(폴더 상대경로, 하위 폴더, 파일), ...] 묶음을 돌려줌
+    # 상위 폴더 항목이 항상 하위 폴더 항목보다 먼저 나옴. cancelled() 가 True 면 남은 폴더는 읽지 않고 끝냄
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(list_dir, root, start, ignore)}
+        batch = []
+        # 첫 묶음(최상위 폴더)은 기다리지 않고 바로 보냄
+        flush_at = time.monotonic()
+        while pending:
+            # 보낼 묶음이 있으면 보낼 시각까지만, 없으면 폴더가 읽히거나 취소를 확인할 때까지 기다림
+            # (묶음이 비었을 때 0 초로 기다리면 느린 폴더가 읽힐 때까지 헛돎)
+            timeout = max(0.0, flush_at - time.monotonic()) if batch else batch_interval
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                rel_dir, dirs, files = future.result()
+                batch.append((rel_dir, dirs, files))
+                for name in dirs:
+                    pending.add(pool.submit(list_dir, root, join_rel_path(rel_dir, name), ignore))
+            if cancelled is not None and cancelled():
+                for future in pending:
+                    future.cancel()
+                return
+            if batch and (not pending or time.monotonic() >= flush_at):
+                yield batch
+                batch = []
+                flush_at = time.monotonic() + batch_interval
@@ -0,0 +1,165 @@
+import os
+import threading
+
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QThread, QTimer, pyqtSignal
+
+
+class PollWorker(QThread):
+    """감시 등록에 실패한 폴더들의 mtime 을 주기적으로 확인하는 워커 스레드 (느린 드라이브에서도 GUI 가 멈추지 않게)"""
+    # (감시 세대, 바뀌었거나 사라진 폴더의 절대경로 목록)
+    changed = pyqtSignal(int, list)
+
+    def __init__(self, interval):
+        super().__init__()
+        self.interval = interval
+        self._lock = threading.Lock()
+        # 절대경로 → mtime_ns (None 은 아직 처음 mtime 을 읽지 않음)
+        self._paths = {}
+        self._generation = 0
+        self._wake = threading.Event()
+
+    def add(self, paths):
+        with self._lock:
+            for path in paths:
+                self._paths.setdefault(path, None)
+        # 새 폴더의 처음 mtime 은 바로 읽어 둠 (그 사이의 변경을 놓치지 않도록)
+        self._wake.set()
+
+    def reset(self, generation):
+        # 감시 대상을 모두 비우고 세대를 바꿈 (이전 세대의 결과는 버려짐)
+        with self._lock:
+            self._paths.clear()
+            self._generation = generation
+
+    def stop(self):
+        self.requestInterruption()
+        self._wake.set()
+        self.wait()
+
+    def run(self):
+        while not self.isInterruptionRequested():
+            with self._lock:
+                items = list(self._paths.items())
+                generation = self._generation
+            changed, updates = [], {}
+            for path, mtime in items:
+                if self.isInterruptionRequested():
+                    return
+                try:
+                    current = os.stat(path).st_mtime_ns
+                except OSError:
+                    # 사라진 폴더는 감시 목록에서 빼고, 감시하던 폴더였으면 바뀐 것으로 알림
+                    updates[path] = None
+                    if mtime is not None:
+                        changed.append(path)
+                    continue
+                if mtime is not None and current != mtime:
+                    changed.append(path)
+                updates[path] = current
+            with self._lock:
+                if generation == self._generation:
+                    for path, current in updates.items():
+                        if current is None:
+                            self._paths.pop(path, None)
+                        elif path in self._paths:
+                            self._paths[path] = current
+            if changed:
+                self.changed.emit(generation, changed)
+            self._wake.wait(self.interval / 1000)
+            self._wake.clear()
+
+
+class DirectoryWatcher(QObject):
+    """작업 폴더의 폴더 변경(생성/삭제/이름 변경)을 감시해서 바뀐 폴더 목록을 알려주는 감시기"""
+    # 바뀐 폴더들의 상대경로 목록 ('' = 최상위). 짧은 시간 안의 이벤트는 한 번으로 묶음
+    dirs_changed = pyqtSignal(list)
+
+    def __init__(self, parent=None, poll_interval=2000, use_polling=False):
+        super().__init__(parent)
+        self._root = None
+        self._use_polling = use_polling
+        # QFileSystemWatcher(inotify 등)로 감시하는 폴더
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_directory_changed)
+        # 내용만 바뀌는 파일(.gitignore 등)은 파일 자체를 감시하고, 그 파일이 있는 폴더가 바뀐 것으로 알림
+        self._fs_watcher.fileChanged.connect(self._on_file_changed)
+        # 감시 등록에 실패한 폴더(감시 개수 제한 등)는 mtime 폴링으로 대신 감시 (처음 쓸 때 워커 스레드 시작)
+        self._poll_interval = poll_interval
+        self._poller = None
+        self._generation = 0
+        self._pending = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush)
+
+    def watch(self, root, rel_dirs):
+        # 감시 대상을 새 저장소 기준으로 교체
+        self.clear()
+        self._root = root
+        self.add(rel_dirs)
+
+    def add(self, rel_dirs):
+        if self._root is None:
+            return
+        paths = [os.path.join(self._root, rel_dir) if rel_dir else self._root for rel_dir in rel_dirs]
+        failed = paths if self._use_polling else self._fs_watcher.addPaths(paths)
+        if not failed:
+            return
+        if self._poller is None:
+            self._poller = PollWorker(self._poll_interval)
+            self._poller.reset(self._generation)
+            self._poller.changed.connect(self._on_polled)
+            self._poller.start()
+        self._poller.add(failed)
+
+    def add_files(self, rel_paths):
+        if self._root is None or not rel_paths:
+            return
+        self._fs_watcher.addPaths([os.path.join(self._root, rel_path) for rel_path in rel_paths])
+
+    def clear(self):
+        watched = self._fs_watcher.directories() + self._fs_watcher.files()
+        if watched:
+            self._fs_watcher.removePaths(watched)
+        self._generation += 1
+        if self._poller is not None:
+            self._poller.reset(self._generation)
+        self._pending.clear()
+        self._flush_timer.stop()
+        self._root = None
+
+    def _rel(self, path):
+        rel_dir = os.path.relpath(path, self._root).replace(os.sep, '/')
+        return '' if rel_dir == '.' else rel_dir
+
+    def _on_directory_changed(self, path):
+        if self._root is None:
+            return
+        self._pending.add(self._rel(path))
+        self._flush_timer.start()
+
+    def _on_file_changed(self, path):
+        if self._root is None:
+            return
+        self._pending.add(self._rel(os.path.dirname(path)))
+        self._flush_timer.start()
+
+    def _on_polled(self, generation, paths):
+        # 폴링 워커가 찾은 변경 (감시 대상을 바꾸기 전의 결과는 버림)
+        if self._root is None or generation != self._generation:
+            return
+        self._pending.update(self._rel(path) for path in paths)
+        self._flush_timer.start()
+
+    def stop(self):
+        # 프로그램 종료 전에 폴링 워커 정리
+        if self._poller is not None:
+            self._poller.stop()
+            self._poller = None
+
+    def _flush(self):
+        if self._pending:
+            changed = sorted(self._pending)
+            self._pending.clear()
+            self.dirs_changed.emit(changed)
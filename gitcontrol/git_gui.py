@@ -1,21 +1,86 @@
 import sys
 import os
+import html
+import time
+from collections import deque
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QListWidget, QMessageBox,
-    QFileDialog, QProgressBar, QTreeWidget, QTreeWidgetItem, QComboBox, QMenu, QInputDialog
+    QFileDialog, QProgressBar, QTreeView, QComboBox, QMenu, QInputDialog,
+    QCheckBox, QPlainTextEdit, QShortcut
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QIcon, QFont
+from PyQt5.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon, QFont, QFontDatabase, QKeySequence
 import git
 from git import Repo, GitCommandError
 
+from path_tree import PathTree, ROOT
+from path_index import PathIndex
+from dir_scanner import list_dir, scan_tree
+from gitignore import IgnoreRules, join_rel_path
+from tree_model import PathTreeModel
+from search_panel import SearchPanel
+from timing_panel import TimingPanel
+import tracing
+from command_runner import CommandRunner, shell_command, runs_git
+import bulk_ops
+from fs_watcher import DirectoryWatcher
+from git_status import stream_status, status_label
+import index_cache
+import sparse
+import prefetch
+from git_ops import OperationCancelled, RemoteRunner, READ_ONLY_OPERATIONS, open_and_run
+
+# 되돌리기 기록 수 (넘치면 가장 오래된 기록의 휴지통부터 비움)
+UNDO_LIMIT = 20
+# 저장소를 연 뒤 처음 미리 받기까지 / Git 작업이나 명령이 실행 중이어서 미룰 때 기다리는 시간 (초)
+PREFETCH_FIRST_DELAY = 5
+PREFETCH_RETRY = 30
+
+
+def build_tracked_index(tracked_files):
+    # 'a/b/c.txt' 목록 → {폴더 경로: (하위 폴더 dict(순서 유지 집합), 파일 목록)}
+    index = {'': ({}, [])}
+    update_tracked_index(index, tracked_files, ())
+    return index
+
+
+def update_tracked_index(index, added, removed):
+    # tracked 인덱스에 추가/삭제된 파일만 반영
+    for path in removed:
+        parent, _, name = path.rpartition('/')
+        node = index.get(parent)
+        if node is not None and name in node[1]:
+            node[1].remove(name)
+    for path in added:
+        parent, _, name = path.rpartition('/')
+        node = index.get(parent)
+        if node is None:
+            node = index[parent] = ({}, [])
+            # 처음 보는 폴더는 상위 폴더들에 차례로 등록
+            child = parent
+            while child:
+                up, _, dir_name = child.rpartition('/')
+                up_node = index.get(up)
+                created = up_node is None
+                if created:
+                    up_node = index[up] = ({}, [])
+                up_node[0][dir_name] = None
+                if not created:
+                    break
+                child = up
+        node[1].append(name)
+
+
 class GitWorker(QThread):
     """Git 작업을 백그라운드에서 처리하는 워커 스레드"""
     progress = pyqtSignal(str)
     error = pyqtSignal(str)
     finished = pyqtSignal()
-    files_updated = pyqtSignal(list)
+    # (추가된 tracked 파일 목록, 삭제된 tracked 파일 목록)
+    files_updated = pyqtSignal(list, list)
+    # 원격 전송 진행 상황 (단계, 현재 개수, 전체 개수, 전송량/속도 메시지)
+    transfer = pyqtSignal(str, int, int, str)
 
     def __init__(self, repo_path, operation, github_url=None, *args, **kwargs):
         super().__init__()
@@ -24,50 +89,368 @@ class GitWorker(QThread):
         self.github_url = github_url
         self.args = args
         self.kwargs = kwargs
+        self.read_only = operation in READ_ONLY_OPERATIONS
+        self._runner = RemoteRunner(self.transfer.emit)
+
+    def cancel(self):
+        self._runner.cancel()
 
     def run(self):
         try:
-            repo = Repo(self.repo_path)
-            
-            if self.operation == 'upload':
-                repo.git.add('.')
-                repo.index.commit('Update files')
-                origin = repo.remote('origin')
-                origin.push()
-                self.progress.emit('내컴퓨터 → GIT 업로드 완료!')
-                
-            elif self.operation == 'download':
-                origin = repo.remote('origin')
-                origin.pull()
-                self.progress.emit('GIT → 내컴퓨터 다운로드 완료!')
-                
-            elif self.operation == 'sync_local_to_git':
-                repo.git.add('.')
-                repo.index.commit('Sync local to git')
-                origin = repo.remote('origin')
-                origin.push()
-                self.progress.emit('내컴퓨터 → GIT 동기화 완료! (내컴퓨터 내용으로 GIT 동일화)')
-
-            elif self.operation == 'sync_git_to_local':
-                origin = repo.remote('origin')
-                origin.fetch()
-                repo.git.reset('--hard', 'origin/main')
-                self.progress.emit('GIT → 내컴퓨터 동기화 완료! (GIT 내용으로 내컴퓨터 동일화)')
-
-            # 파일 목록 업데이트
-            files = [item.a_path for item in repo.index.entries]
-            self.files_updated.emit(files)
+            message, added, removed = open_and_run(self.repo_path, self.operation, self._runner,
+                                                   self.github_url, **self.kwargs)
+            self.progress.emit(message)
+            # 파일 목록 업데이트 (바뀐 파일만)
+            self.files_updated.emit(added, removed)
 
+        except OperationCancelled:
+            self.error.emit('작업이 취소되었습니다.')
         except GitCommandError as e:
-            self.error.emit(f'Git 오류: {str(e)}')
+            if self._runner.cancelled:
+                self.error.emit('작업이 취소되었습니다.')
+            else:
+                self.error.emit(f'Git 오류: {str(e)}')
         except Exception as e:
             self.error.emit(f'오류 발생: {str(e)}')
         finally:
             self.finished.emit()
 
+
+class PrefetchWorker(QThread):
+    """쉬는 동안 원격 브랜치를 미리 받고 원격보다 앞선/뒤처진 커밋 수를 세는 워커 스레드 (fetch=False 면 로컬 ref 만 봄)"""
+    # (저장소 경로, (앞선 커밋 수, 뒤처진 커밋 수) 또는 None, 마지막으로 미리 받은 시각 또는 None, 오류 메시지)
+    done = pyqtSignal(str, object, object, str)
+
+    def __init__(self, prefetcher, fetch=True):
+        super().__init__()
+        self.prefetcher = prefetcher
+        self.fetch = fetch
+        self._runner = RemoteRunner()
+
+    def cancel(self):
+        self._runner.cancel()
+
+    def run(self):
+        counts = stamp = None
+        try:
+            if self.fetch:
+                self.prefetcher.run(self._runner)
+            counts = self.prefetcher.ahead_behind()
+            stamp = self.prefetcher.last_prefetch()
+        except Exception:
+            pass
+        if self._runner.cancelled:
+            return
+        self.done.emit(self.prefetcher.repo_path, counts, stamp, self.prefetcher.error or '')
+
+
+class OperationScheduler(QObject):
+    """저장소별 Git 작업 대기열 (같은 저장소의 변경 작업은 하나씩, 읽기 작업과 다른 저장소 작업은 병렬)"""
+    # 대기 중이거나 실행 중인 작업 수가 바뀔 때
+    changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._queues = {}
+        self._running = {}
+        # 끝났지만 스레드가 아직 정리되지 않은 워커 (실행 중에 객체가 사라지지 않도록 보관)
+        self._retired = []
+
+    @staticmethod
+    def repo_key(repo_path):
+        return os.path.normcase(os.path.realpath(repo_path))
+
+    def submit(self, worker):
+        # 작업을 대기열에 넣고 실행 가능하면 바로 시작. 대기 중이면 False
+        key = self.repo_key(worker.repo_path)
+        worker.finished.connect(lambda: self._on_finished(key, worker))
+        self._queues.setdefault(key, deque()).append(worker)
+        self._pump(key)
+        self.changed.emit()
+        return worker.isRunning()
+
+    def _pump(self, key):
+        running = self._running.setdefault(key, [])
+        queue = self._queues.get(key)
+        while queue:
+            worker = queue[0]
+            # 변경 작업은 혼자, 읽기 작업은 변경 작업이 없을 때 여러 개 동시에
+            if worker.read_only:
+                can_start = all(w.read_only for w in running)
+            else:
+                can_start = not running
+            if not can_start:
+                break
+            queue.popleft()
+            running.append(worker)
+            worker.start()
+
+    def _on_finished(self, key, worker):
+        running = self._running.get(key, [])
+        if worker in running:
+            running.remove(worker)
+        self._retired = [w for w in self._retired if w.isRunning()] + [worker]
+        self._pump(key)
+        self.changed.emit()
+
+    def cancel(self, repo_path=None):
+        # 해당 저장소(없으면 전체)의 대기 작업은 버리고 실행 중인 작업은 취소 요청
+        keys = [self.repo_key(repo_path)] if repo_path else list(self._queues)
+        for key in keys:
+            queue = self._queues.get(key)
+            while queue:
+                worker = queue.popleft()
+                worker.error.emit('작업이 취소되었습니다.')
+            for worker in self._running.get(key, []):
+                worker.cancel()
+        self.changed.emit()
+
+    def pending(self, repo_path=None):
+        # (실행 중 작업 수, 대기 중 작업 수)
+        keys = [self.repo_key(repo_path)] if repo_path else list(self._queues)
+        running = sum(len(self._running.get(key, [])) for key in keys)
+        queued = sum(len(self._queues.get(key, ())) for key in keys)
+        return running, queued
+
+    def wait_all(self):
+        for workers in list(self._running.values()) + [self._retired]:
+            for worker in workers:
+                worker.wait()
+
+class FileScanWorker(QThread):
+    """파일 목록(병렬 scandir + ls_files)을 백그라운드에서 수집하는 워커 스레드"""
+    # (세대 번호, 저장소 경로, 로컬 PathTree, Git PathTree, 지연 로딩용 tracked 인덱스)
+    scanned = pyqtSignal(int, str, object, object, dict)
+    # 트리를 보낸 뒤 만든 검색 색인 (세대 번호, 로컬 PathIndex, Git PathIndex 또는 None)
+    indexed = pyqtSignal(int, object, object)
+    # stream 이면 스캔 중에 읽힌 폴더 묶음 (세대 번호, [(폴더 상대경로, 하위 폴더, 파일), ...])
+    listed = pyqtSignal(int, list)
+
+    def __init__(self, generation, repo_path, lazy=False, tracked=True, ignore=None, stream=False):
+        super().__init__()
+        self.generation = generation
+        self.repo_path = repo_path
+        self.lazy = lazy
+        # False면 ls_files를 생략 (Git 창이 변경 상태 보기일 때는 StatusWorker가 대신함)
+        self.tracked = tracked
+        # 무시 규칙 (IgnoreRules). 있으면 무시된 폴더는 들어가지 않음
+        self.ignore = ignore
+        self.stream = stream
+
+    def _walk(self, on_batch):
+        # 작업 폴더 전체를 병렬로 훑으며 파일 상대경로 목록을 모음 (중단되면 None)
+        paths = []
+        # 새 스캔이 시작되면 현재 스캔은 결과 없이 중단
+        for batch in scan_tree(self.repo_path, self.ignore, cancelled=self.isInterruptionRequested):
+            if on_batch is not None:
+                on_batch(batch)
+            for rel_dir, _dirs, files in batch:
+                paths.extend(join_rel_path(rel_dir, f) for f in files)
+        return None if self.isInterruptionRequested() else paths
+
+    def run(self):
+        repo_path = self.repo_path
+        # 저장소 파일 목록 (실제 폴더 내 모든 파일, 폴더 구조)
+        local_tree = PathTree()
+        local_paths = []
+        if os.path.isdir(repo_path):
+            if self.lazy:
+                # 지연 로딩: 최상위 폴더만 읽고 나머지는 펼칠 때 읽음 (검색 색인용 전체 목록은 트리를 보낸 뒤 모음)
+                with tracing.span('walk', lazy=True):
+                    _, dirs, files = list_dir(repo_path, '', self.ignore)
+                    local_tree.add_children(ROOT, dirs, files)
+                local_paths = None
+            else:
+                def add_batch(batch):
+                    for rel_dir, dirs, files in batch:
+                        local_tree.add_children(local_tree.dir_node(rel_dir), dirs, files)
+                    if self.stream:
+                        self.listed.emit(self.generation, batch)
+                # 폴더 묶음마다 로컬 트리에도 넣으므로 로컬 트리 만드는 시간이 포함됨
+                with tracing.span('walk') as span:
+                    local_paths = self._walk(add_batch)
+                    if local_paths is None:
+                        return
+                    span.set(files=len(local_paths))
+        local_tree.finish_build()
+        git_tree = None
+        tracked_index = {}
+        tracked_files = None
+        if self.tracked:
+            # Git 파일 목록 (tracked 파일, 폴더 구조)
+            # 캐시 유효성 기준은 ls_files 전에 읽어 둠 (스캔 중에 인덱스가 바뀌면 다음 실행에서 무효 처리)
+            signature = index_cache.index_signature(repo_path)
+            tracked_files = []
+            with tracing.span('ls_files') as span:
+                try:
+                    repo = Repo(repo_path)
+                    # -z: 한글 등 비 ASCII 경로도 따옴표/8진수 이스케이프 없이 그대로 (TrackedPathsWorker 와 같은 형태)
+                    tracked_files = [p for p in repo.git.ls_files('-z').split('\0') if p]
+                except Exception:
+                    pass
+                span.set(files=len(tracked_files))
+            if self.isInterruptionRequested():
+                return
+            git_tree = PathTree()
+            with tracing.span('tree build', lazy=self.lazy):
+                if self.lazy:
+                    # 지연 로딩이면 폴더별 인덱스를 여기서 만들어 두고, 펼칠 때 바로 꺼내 씀
+                    tracked_index = build_tracked_index(tracked_files)
+                    subdirs, files = tracked_index['']
+                    git_tree.add_children(ROOT, subdirs, files)
+                else:
+                    for f in tracked_files:
+                        git_tree.add_file(f)
+                git_tree.finish_build()
+            if self.isInterruptionRequested():
+                return
+            if not self.lazy:
+                # 다음 실행 때 바로 보여줄 수 있도록 디스크 캐시 갱신
+                try:
+                    with tracing.span('cache save'):
+                        index_cache.save_trees(repo_path, signature, local_tree, git_tree)
+                except OSError:
+                    pass
+        self.scanned.emit(self.generation, repo_path, local_tree, git_tree, tracked_index)
+        # 트리를 먼저 보여주고, 검색 색인은 그 뒤에 만듦
+        if local_paths is None and os.path.isdir(repo_path):
+            local_paths = self._walk(None)
+        if local_paths is None or self.isInterruptionRequested():
+            return
+        with tracing.span('search index'):
+            local_index = PathIndex(local_paths)
+            git_index = PathIndex(tracked_files) if tracked_files is not None else None
+        if not self.isInterruptionRequested():
+            self.indexed.emit(self.generation, local_index, git_index)
+
+class StatusWorker(QThread):
+    """git status --porcelain=v2 한 번으로 변경 상태 트리를 만드는 워커 스레드"""
+    scanned = pyqtSignal(int, object)
+
+    def __init__(self, generation, repo_path):
+        super().__init__()
+        self.generation = generation
+        self.repo_path = repo_path
+
+    def run(self):
+        tree = PathTree()
+        try:
+            repo = Repo(self.repo_path)
+            # 출력이 도착하는 대로 해석해서 바로 트리에 추가
+            with tracing.span('status'):
+                for path, flags, _orig_path in stream_status(repo, cancelled=self.isInterruptionRequested):
+                    if path.endswith('/'):
+                        # 폴더 전체가 추적 안 됨/무시됨
+                        node = tree.get_or_create_dir(path.rstrip('/'))
+                    else:
+                        node = tree.add_file(path)
+                    tree.add_status(node, flags)
+        except Exception:
+            pass
+        tree.finish_build()
+        if self.isInterruptionRequested():
+            return
+        self.scanned.emit(self.generation, tree)
+
+class TrackedPathsWorker(QThread):
+    """명령이 끝난 뒤 영향받은 경로 아래의 tracked 파일만 다시 읽는 워커 스레드"""
+    # (저장소 경로, 확인한 상대경로 목록('' 는 저장소 전체), 그 아래 tracked 파일 목록)
+    listed = pyqtSignal(str, list, list)
+
+    def __init__(self, repo_path, rel_paths):
+        super().__init__()
+        self.repo_path = repo_path
+        self.rel_paths = rel_paths
+
+    def run(self):
+        try:
+            repo = Repo(self.repo_path)
+            output = repo.git(literal_pathspecs=True).ls_files('-z', '--', *(p or '.' for p in self.rel_paths))
+        except Exception:
+            return
+        self.listed.emit(self.repo_path, self.rel_paths, [p for p in output.split('\0') if p])
+
+
+class BulkWorker(QThread):
+    """트리에서 고른 항목들에 대한 일괄 파일 작업(bulk_ops 함수)을 백그라운드에서 실행하는 워커"""
+    progress = pyqtSignal(str)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+    transfer = pyqtSignal(str, int, int, str)
+    # (저장소 경로, 작업 이름, 결과 BulkResult)
+    done = pyqtSignal(str, str, object)
+
+    def __init__(self, repo_path, label, func, *args, **kwargs):
+        super().__init__()
+        self.repo_path = repo_path
+        self.label = label
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        # 작업 폴더/인덱스를 바꾸므로 같은 저장소의 다른 작업과 겹치지 않게 함
+        self.read_only = False
+        self._runner = RemoteRunner(self.transfer.emit)
+
+    def cancel(self):
+        self._runner.cancel()
+
+    def run(self):
+        try:
+            self._runner.check()
+            with tracing.span(self.label):
+                result = self.func(*self.args, progress=self._runner.report,
+                                   cancelled=lambda: self._runner.cancelled, **self.kwargs)
+            self.progress.emit(result.message)
+            self.done.emit(self.repo_path, self.label, result)
+        except OperationCancelled:
+            self.error.emit('작업이 취소되었습니다.')
+        except Exception as e:
+            self.error.emit(f'오류 발생: {str(e)}')
+        finally:
+            self.finished.emit()
+
+
 class GitGUI(QMainWindow):
     def __init__(self):
         super().__init__()
+        # 파일 목록 갱신: 입력이 멈춘 뒤 한 번만 백그라운드 스캔 실행
+        self._scan_generation = 0
+        self._scan_workers = []
+        self._status_generation = 0
+        self._status_workers = []
+        # 디스크 캐시에서 트리를 이미 보여준 저장소 경로
+        self._cached_repo_path = None
+        # 스캔 중에 폴더 묶음을 바로 트리에 넣고 있는 스캔 세대 / 로컬 트리에 쓰는 무시 규칙
+        self._streamed_generation = None
+        self._ignore = None
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(300)
+        self._refresh_timer.timeout.connect(self.update_file_list)
+        # Git 작업 대기열 (같은 저장소에 대한 작업이 서로 겹치지 않도록)
+        self.scheduler = OperationScheduler(self)
+        self.scheduler.changed.connect(self._on_scheduler_changed)
+        self._tracked_index = {}
+        # 작업 폴더 감시: 바뀐 폴더만 다시 읽어서 로컬 트리에 반영
+        self.file_watcher = DirectoryWatcher(self)
+        self.file_watcher.dirs_changed.connect(self._on_local_dirs_changed)
+        # 사용자 명령 실행기 (저장소 폴더에서 실행, 여러 명령 동시 실행 가능)
+        self.command_runner = CommandRunner(self)
+        self.command_runner.started.connect(self._on_command_started)
+        self.command_runner.output.connect(self._on_command_output)
+        self.command_runner.finished.connect(self._on_command_finished)
+        self._tracked_workers = []
+        # 되돌리기 기록 [(저장소 경로, 작업 이름, BulkResult)] (오래된 것부터 버리며 휴지통도 비움)
+        self._undo_stack = []
+        # 쉬는 동안 미리 받기 (Git 작업이나 명령이 실행 중이면 미룸)
+        self._prefetcher = None
+        self._prefetch_worker = None
+        self._prefetch_workers = []
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.timeout.connect(self._maybe_prefetch)
+        # 앱이 앞/뒤로 갈 때 미리 받기 간격 상한을 바꿈
+        QApplication.instance().applicationStateChanged.connect(self._on_app_state_changed)
         self.initUI()
         self.worker = None
 
@@ -87,6 +470,28 @@ class GitGUI(QMainWindow):
         path_form_layout.addWidget(self.local_path_input)
         path_form_layout.addWidget(QLabel('Github 위치 :'))
         path_form_layout.addWidget(self.github_url_input)
+        # 큰 저장소용: 최상위만 먼저 보여주고 폴더를 펼칠 때 하위 항목을 불러옴
+        self.lazy_tree_check = QCheckBox('펼칠 때 불러오기')
+        self.lazy_tree_check.toggled.connect(self.update_file_list)
+        path_form_layout.addWidget(self.lazy_tree_check)
+        # .gitignore 에 걸리는 파일/폴더(node_modules 등)는 읽지 않고 숨김
+        self.hide_ignored_check = QCheckBox('무시된 파일 숨기기')
+        self.hide_ignored_check.setChecked(True)
+        self.hide_ignored_check.toggled.connect(self.update_file_list)
+        path_form_layout.addWidget(self.hide_ignored_check)
+        # 부분 다운로드: 파일 내용(blob) 없이 받고, Git 파일 목록에서 체크한 폴더만 작업 폴더에 둠 (sparse-checkout)
+        self.partial_check = QCheckBox('체크한 폴더만 받기')
+        self.partial_check.setToolTip('다운로드/동기화 때 Git 파일 목록에서 체크한 폴더만 받습니다.\n'
+                                      '저장소가 없는 빈 폴더면 부분 클론(--filter=blob:none)으로 받습니다.')
+        path_form_layout.addWidget(self.partial_check)
+        # 미리 받기: 쉬는 동안 원격 브랜치를 refs/prefetch/ 아래로 받아 두고, 막 받아 두었으면 다운로드 때는 병합만
+        self.prefetch_check = QCheckBox('미리 받기')
+        self.prefetch_check.setChecked(True)
+        self.prefetch_check.setToolTip('쉬는 동안 원격의 새 커밋을 미리 받아 둡니다 (작업 폴더는 바꾸지 않음).\n'
+                                       f'{prefetch.MAX_AGE // 60}분 안에 받아 두었으면 다운로드 때 원격에 다시 묻지 않고 바로 병합합니다.\n'
+                                       '동기화(GIT 내용으로 덮어쓰기)는 항상 원격에서 새로 받습니다.')
+        self.prefetch_check.toggled.connect(lambda: self._schedule_prefetch())
+        path_form_layout.addWidget(self.prefetch_check)
         layout.addLayout(path_form_layout)
 
         # 상단 Git 동작 콤보박스 + 옵션입력 + 확인 + 안내
@@ -94,7 +499,9 @@ class GitGUI(QMainWindow):
             '내컴퓨터 → GIT 업로드',
             'GIT → 내컴퓨터 다운로드',
             '내컴퓨터 → GIT 동기화',
-            'GIT → 내컴퓨터 동기화'
+            'GIT → 내컴퓨터 동기화',
+            'GIT 원격 정보 가져오기',
+            '이미지 변환 (크기별 WebP/JPEG)'
         ]
         self.top_git_action_combo = QComboBox()
         self.top_git_action_combo.addItems(git_action_names)
@@ -105,6 +512,19 @@ class GitGUI(QMainWindow):
         top_git_action_row = QHBoxLayout()
         top_git_action_row.addWidget(self.top_git_action_combo)
         top_git_action_row.addWidget(self.top_git_action_confirm)
+        # 실행 중/대기 중인 작업 취소
+        self.top_git_action_cancel = QPushButton('취소')
+        self.top_git_action_cancel.setMaximumWidth(60)
+        self.top_git_action_cancel.setEnabled(False)
+        self.top_git_action_cancel.clicked.connect(self.cancel_git_operations)
+        top_git_action_row.addWidget(self.top_git_action_cancel)
+        # 트리에서 실행한 일괄 삭제/이동/복사 되돌리기 (Ctrl+Z)
+        self.undo_button = QPushButton('되돌리기')
+        self.undo_button.setMaximumWidth(80)
+        self.undo_button.setEnabled(False)
+        self.undo_button.clicked.connect(self.undo_bulk_operation)
+        top_git_action_row.addWidget(self.undo_button)
+        QShortcut(QKeySequence.Undo, self, self.undo_bulk_operation)
         self.top_git_option_input = QLineEdit()
         self.top_git_option_input.setPlaceholderText('옵션 입력 (예: 명령어, 브랜치명 등)')
         self.top_git_option_label = QLabel('')
@@ -118,19 +538,31 @@ class GitGUI(QMainWindow):
         self.message_label.setStyleSheet('color: #1a237e; background: #f4f4f4; border: 1px solid #ccc; padding: 4px; font-size: 13px;')
         self.message_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         layout.addWidget(self.message_label)
+        # 원격 전송 진행 표시 (객체 수, 전송량, 속도)
+        self.transfer_bar = QProgressBar()
+        self.transfer_bar.setTextVisible(True)
+        self.transfer_bar.hide()
+        layout.addWidget(self.transfer_bar)
 
-        # 파일 목록 2열 배치 (QTreeWidget)
+        # 파일 목록 2열 배치 (QTreeView + PathTreeModel)
         file_lists_layout = QHBoxLayout()
         # 왼쪽: 저장소 파일 목록
         left_layout = QVBoxLayout()
         self.file_tree_label = QLabel('저장소 파일 목록:')
-        self.file_tree = QTreeWidget()
-        self.file_tree.setHeaderLabel('폴더/파일')
-        self.file_tree.setSelectionMode(QTreeWidget.SingleSelection)
+        self.file_model = PathTreeModel()
+        self.file_tree = QTreeView()
+        self.file_tree.setModel(self.file_model)
+        self.file_model.dir_loaded.connect(lambda rel_dir: self.file_watcher.add([rel_dir]))
+        self.file_tree.setSelectionMode(QTreeView.SingleSelection)
         self.file_tree.setUniformRowHeights(True)
         self.file_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.file_tree.customContextMenuRequested.connect(lambda pos: self.show_tree_context_menu(self.file_tree, pos, is_git=False))
+        # 파일 검색 (검색 중에는 트리 대신 결과 목록)
+        self.local_search = SearchPanel()
+        self.local_search.active_changed.connect(lambda active: self.file_tree.setVisible(not active))
+        self.local_search.path_activated.connect(lambda path: self._reveal_in_tree(self.file_tree, path))
         left_layout.addWidget(self.file_tree_label)
+        left_layout.addWidget(self.local_search)
         left_layout.addWidget(self.file_tree)
         # 내컴퓨터 관리용 명령어 UI (콤보박스+입력+확인+옵션라벨)
         self.local_action_combo = QComboBox()
@@ -161,13 +593,30 @@ class GitGUI(QMainWindow):
         # 오른쪽: Git 파일 목록
         right_layout = QVBoxLayout()
         self.git_file_tree_label = QLabel('Git 파일 목록:')
-        self.git_file_tree = QTreeWidget()
-        self.git_file_tree.setHeaderLabel('폴더/파일')
-        self.git_file_tree.setSelectionMode(QTreeWidget.SingleSelection)
+        # Git 창 보기 전환: 추적 파일 전체 / 변경 상태(git status 한 번으로 수정·스테이징·추적 안 됨·무시됨 표시)
+        self.git_view_combo = QComboBox()
+        self.git_view_combo.addItems(['추적 파일', '변경 상태'])
+        self.git_view_combo.currentIndexChanged.connect(self._on_git_view_changed)
+        git_label_row = QHBoxLayout()
+        git_label_row.addWidget(self.git_file_tree_label)
+        git_label_row.addWidget(self.git_view_combo)
+        # 원격보다 앞선(↑)/뒤처진(↓) 커밋 수 (미리 받아 둔 ref 기준, 네트워크 없이 계산)
+        self.ahead_behind_label = QLabel('')
+        self.ahead_behind_label.setStyleSheet('color: #555; font-size: 11px;')
+        git_label_row.addWidget(self.ahead_behind_label)
+        self.git_file_model = PathTreeModel()
+        self.status_model = PathTreeModel(status_header='상태', status_label=status_label)
+        self.git_file_tree = QTreeView()
+        self.git_file_tree.setModel(self.git_file_model)
+        self.git_file_tree.setSelectionMode(QTreeView.SingleSelection)
         self.git_file_tree.setUniformRowHeights(True)
         self.git_file_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.git_file_tree.customContextMenuRequested.connect(lambda pos: self.show_tree_context_menu(self.git_file_tree, pos, is_git=True))
-        right_layout.addWidget(self.git_file_tree_label)
+        self.git_search = SearchPanel()
+        self.git_search.active_changed.connect(lambda active: self.git_file_tree.setVisible(not active))
+        self.git_search.path_activated.connect(lambda path: self._reveal_in_tree(self.git_file_tree, path))
+        right_layout.addLayout(git_label_row)
+        right_layout.addWidget(self.git_search)
         right_layout.addWidget(self.git_file_tree)
         # Git 관리용 명령어 UI (콤보박스+입력+확인+옵션라벨)
         self.git_action_combo = QComboBox()
@@ -199,21 +648,48 @@ class GitGUI(QMainWindow):
         file_lists_layout.addLayout(right_layout)
         layout.addLayout(file_lists_layout)
 
+        # 명령 출력 (여러 명령이 동시에 실행되면 줄 앞의 [번호]로 구분)
+        command_output_row = QHBoxLayout()
+        command_output_row.addWidget(QLabel('명령 출력:'))
+        command_output_row.addStretch()
+        self.command_stop_button = QPushButton('중지')
+        self.command_stop_button.setMaximumWidth(60)
+        self.command_stop_button.setEnabled(False)
+        self.command_stop_button.clicked.connect(lambda: self.command_runner.kill())
+        command_output_row.addWidget(self.command_stop_button)
+        self.command_clear_button = QPushButton('지우기')
+        self.command_clear_button.setMaximumWidth(60)
+        command_output_row.addWidget(self.command_clear_button)
+        self.command_output = QPlainTextEdit()
+        self.command_output.setReadOnly(True)
+        self.command_output.setMaximumBlockCount(5000)
+        self.command_output.setMaximumHeight(140)
+        self.command_output.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.command_clear_button.clicked.connect(self.command_output.clear)
+        layout.addLayout(command_output_row)
+        layout.addWidget(self.command_output)
+        # 작업 시간 측정 (켜면 구간별 시간 표, Chrome trace 로 내보내기)
+        self.timing_panel = TimingPanel()
+        self.timing_panel.message.connect(self.message_label.setText)
+        layout.addWidget(self.timing_panel)
+
         # 경로 입력 변경 시 자동 갱신
         self.local_path_input.textChanged.connect(self.on_path_changed)
         self.github_url_input.textChanged.connect(self.on_path_changed)
         # 폴더 경로가 바뀔 때마다 상단 명령어 예시도 갱신
         self.local_path_input.textChanged.connect(self.update_top_git_action_option)
 
-        # 프로그램 시작 시 바로 갱신
-        self.on_path_changed()
+        # 프로그램 시작 시 바로 갱신 (디바운스 없이)
+        self.update_buttons()
+        self.update_file_list()
 
         # 체크박스 신호 연결
         self._connect_tree_checkbox_signals()
 
     def on_path_changed(self):
         self.update_buttons()
-        self.update_file_list()
+        # 키 입력마다 스캔하지 않고, 입력이 멈추면 한 번만 갱신
+        self._refresh_timer.start()
 
     def update_buttons(self):
         path = self.local_path_input.text()
@@ -277,17 +753,26 @@ class GitGUI(QMainWindow):
             0: 'upload',
             1: 'download',
             2: 'sync_local_to_git',
-            3: 'sync_git_to_local'
+            3: 'sync_git_to_local',
+            4: 'fetch',
+            5: 'build_images'
         }
         operation = operation_map.get(idx)
         self.run_git_operation(operation, extra_option=option)
 
-    def run_git_operation(self, operation, extra_option=None):
+    def run_git_operation(self, operation, extra_option=None, **kwargs):
         repo_path = self.local_path_input.text()
         github_url = self.github_url_input.text()
         if not repo_path:
             self.message_label.setText('저장소 경로를 입력해주세요.')
             return
+        if operation in ('download', 'sync_git_to_local') and self.partial_check.isChecked():
+            # 체크한 폴더가 sparse-checkout cone 이 됨 (체크가 없으면 지금 cone 그대로)
+            kwargs.update(partial=True, folders=self._checked_git_folders())
+        if self._prefetch_worker is not None and self._prefetch_worker.isRunning():
+            # 미리 받기는 멈추고 사용자 작업에 네트워크를 양보 (작업이 끝나면 다시 예약)
+            self._prefetch_worker.cancel()
+            self._schedule_prefetch(PREFETCH_RETRY)
         # 안내 메시지 초기화
         if operation == 'upload':
             self.message_label.setText('내컴퓨터 → GIT 업로드 중...')
@@ -297,13 +782,41 @@ class GitGUI(QMainWindow):
             self.message_label.setText('내컴퓨터 → GIT 동기화 중...')
         elif operation == 'sync_git_to_local':
             self.message_label.setText('GIT → 내컴퓨터 동기화 중...')
-        # 워커 스레드 시작
-        self.worker = GitWorker(repo_path, operation, github_url)
+        elif operation == 'fetch':
+            self.message_label.setText('GIT 원격 정보 가져오는 중...')
+        elif operation == 'download_folders':
+            self.message_label.setText('폴더 다운로드 중...')
+        elif operation == 'build_images':
+            self.message_label.setText('이미지 변환 중...')
+        # 워커를 대기열에 넣음 (같은 저장소의 이전 작업이 끝나면 시작)
+        self.worker = GitWorker(repo_path, operation, github_url, **kwargs)
         self.worker.progress.connect(self.update_status)
         self.worker.error.connect(self.show_error)
         self.worker.finished.connect(self.operation_finished)
-        self.worker.files_updated.connect(self.update_file_list)
-        self.worker.start()
+        self.worker.files_updated.connect(self._apply_tracked_changes)
+        self.worker.transfer.connect(self.update_transfer)
+        if kwargs.get('partial') and sparse.open_repo(repo_path) is None:
+            # 새로 받은 저장소는 두 트리를 처음부터 다시 읽음
+            self.worker.finished.connect(self.update_file_list)
+        if not self.scheduler.submit(self.worker):
+            self.message_label.setText(self.message_label.text() + ' (앞선 작업이 끝나면 시작합니다)')
+
+    def cancel_git_operations(self):
+        self.scheduler.cancel(self.local_path_input.text())
+
+    def _on_scheduler_changed(self):
+        running, queued = self.scheduler.pending()
+        self.top_git_action_cancel.setEnabled(bool(running or queued))
+        if not running:
+            self.transfer_bar.hide()
+
+    def update_transfer(self, stage, cur_count, max_count, message):
+        # 예: '객체 보내는 중 120/400 - 1.20 MiB | 2.34 MiB/s'
+        self.transfer_bar.show()
+        self.transfer_bar.setMaximum(max_count)
+        self.transfer_bar.setValue(min(cur_count, max_count) if max_count else 0)
+        counts = f'{cur_count}/{max_count}' if max_count else f'{cur_count}'
+        self.transfer_bar.setFormat(f'{stage} {counts}' + (f' - {message.strip(", ")}' if message else ''))
 
     def update_status(self, message):
         self.message_label.setText(message)
@@ -311,153 +824,330 @@ class GitGUI(QMainWindow):
     def show_error(self, error_message):
         self.message_label.setText(f'<span style="color:red;">{error_message}</span>')
 
+    def _checked_git_folders(self):
+        # Git 파일 목록에서 체크된 항목이 든 폴더들 (파일이면 그 상위 폴더)
+        tree = self.git_file_model.tree()
+        return [tree.path_of(node if tree.is_dir(node) else tree.parent(node)) for node in tree.checked_nodes()]
+
     def operation_finished(self):
         # 모든 버튼 다시 활성화
         self.update_buttons()
+        self._refresh_ahead_behind()
+
+    def _update_prefetcher(self, repo_path):
+        # 저장소가 바뀌면 미리 받기를 새로 시작 (처음 미리 받기는 PREFETCH_FIRST_DELAY 초 뒤)
+        if self._prefetcher is not None and self._prefetcher.repo_path == repo_path:
+            return
+        self.ahead_behind_label.clear()
+        self._prefetcher = None
+        if os.path.exists(os.path.join(repo_path, '.git')):
+            self._prefetcher = prefetch.Prefetcher(repo_path, max_interval=self._prefetch_max_interval())
+            self._prefetcher.next_run = time.monotonic() + PREFETCH_FIRST_DELAY
+        self._schedule_prefetch()
+
+    def _prefetch_max_interval(self):
+        # 앱이 앞에 있으면 다운로드 때 쓸 수 있도록 MAX_AGE 안쪽 간격으로, 뒤에 있으면 길게
+        if QApplication.applicationState() == Qt.ApplicationActive:
+            return prefetch.FOREGROUND_MAX_INTERVAL
+        return prefetch.MAX_INTERVAL
+
+    def _on_app_state_changed(self, _state):
+        if self._prefetcher is not None:
+            self._prefetcher.set_max_interval(self._prefetch_max_interval())
+            if self._prefetch_timer.isActive():
+                self._schedule_prefetch()
+
+    def _schedule_prefetch(self, delay=None):
+        # 다음 미리 받기 예약 (꺼져 있거나 저장소가 아니면 멈춤)
+        self._prefetch_timer.stop()
+        if self._prefetcher is None or not self.prefetch_check.isChecked():
+            return
+        if delay is None:
+            delay = self._prefetcher.delay()
+        self._prefetch_timer.start(int(delay * 1000))
+
+    def _maybe_prefetch(self):
+        # Git 작업이나 사용자 명령이 실행 중이면 미룸
+        running, queued = self.scheduler.pending()
+        if running or queued or self.command_runner.running():
+            self._schedule_prefetch(PREFETCH_RETRY)
+            return
+        if not self._start_prefetch_worker(fetch=True):
+            self._schedule_prefetch(PREFETCH_RETRY)
+
+    def _refresh_ahead_behind(self):
+        # 로컬 ref 만 보고 앞선/뒤처진 커밋 수를 다시 셈 (미리 받는 중이면 그 결과를 기다림)
+        self._start_prefetch_worker(fetch=False)
+
+    def _start_prefetch_worker(self, fetch):
+        if self._prefetcher is None or (self._prefetch_worker is not None and self._prefetch_worker.isRunning()):
+            return False
+        self._prefetch_workers = [w for w in self._prefetch_workers if w.isRunning()]
+        worker = PrefetchWorker(self._prefetcher, fetch)
+        worker.done.connect(self._on_prefetched)
+        self._prefetch_worker = worker
+        self._prefetch_workers.append(worker)
+        worker.start()
+        return True
 
-    def update_file_list(self, files=None):
-        self.file_tree.clear()
-        self.git_file_tree.clear()
+    def _on_prefetched(self, repo_path, counts, stamp, error):
+        if self._prefetcher is None or repo_path != self._prefetcher.repo_path:
+            return
+        if counts is None:
+            self.ahead_behind_label.clear()
+        else:
+            ahead, behind = counts
+            self.ahead_behind_label.setText(f'↑{ahead} ↓{behind}')
+            tooltip = [f'원격보다 앞선 커밋 {ahead}개, 뒤처진 커밋 {behind}개',
+                       f'마지막으로 미리 받은 시각: {time.strftime("%H:%M:%S", time.localtime(stamp))}'
+                       if stamp else '아직 미리 받지 않음']
+            if error:
+                tooltip.append(f'미리 받기 실패: {error}')
+            self.ahead_behind_label.setToolTip('\n'.join(tooltip))
+        # 미리 받기가 끝났으면 다음 번을 예약 (앞선/뒤처진 수만 다시 센 경우는 예약이 그대로 남아 있음)
+        if not self._prefetch_timer.isActive():
+            self._schedule_prefetch()
+
+    def update_file_list(self):
+        # 진행 중인 스캔은 취소하고 새 스캔을 백그라운드에서 시작
+        self._refresh_timer.stop()
+        for worker in self._scan_workers:
+            worker.requestInterruption()
+        self._scan_workers = [w for w in self._scan_workers if w.isRunning()]
+        self._scan_generation += 1
+        status_view = self._is_status_view()
         repo_path = self.local_path_input.text()
-        # 저장소 파일 목록 (실제 폴더 내 모든 파일, 폴더 구조)
+        self._update_prefetcher(repo_path)
+        self._refresh_ahead_behind()
+        # 무시 규칙은 스캔마다 새로 읽음 (지연 로딩/폴더 감시도 같은 규칙을 씀)
+        self._ignore = IgnoreRules(repo_path) if self.hide_ignored_check.isChecked() else None
+        stream = False
+        if not self.lazy_tree_check.isChecked() and repo_path != self._cached_repo_path:
+            # 저장소가 바뀌었으면 디스크 캐시부터 즉시 보여주고, 아래 스캔으로 백그라운드 재검증
+            self._cached_repo_path = repo_path
+            cached = index_cache.load_trees(repo_path)
+            if cached is not None:
+                self.file_model.set_tree(cached[0])
+                if not status_view:
+                    self.git_file_model.set_tree(cached[1])
+            else:
+                # 캐시가 없으면 빈 트리에서 시작해서 읽히는 폴더부터 바로 보여줌
+                self.file_model.clear()
+                stream = True
+        self._streamed_generation = self._scan_generation if stream else None
+        worker = FileScanWorker(self._scan_generation, repo_path, lazy=self.lazy_tree_check.isChecked(),
+                                tracked=not status_view, ignore=self._ignore, stream=stream)
+        worker.listed.connect(self._on_local_listed)
+        worker.scanned.connect(self._on_files_scanned)
+        worker.indexed.connect(self._on_files_indexed)
+        self._scan_workers.append(worker)
+        worker.start()
+        if status_view:
+            self._refresh_status()
+
+    def _is_status_view(self):
+        return self.git_view_combo.currentIndex() == 1
+
+    def _on_git_view_changed(self):
+        self.git_file_tree.setModel(self.status_model if self._is_status_view() else self.git_file_model)
+        self.update_file_list()
+
+    def _refresh_status(self):
+        # 변경 상태 트리만 다시 계산 (진행 중인 status 는 취소)
+        for worker in self._status_workers:
+            worker.requestInterruption()
+        self._status_workers = [w for w in self._status_workers if w.isRunning()]
+        self._status_generation += 1
+        worker = StatusWorker(self._status_generation, self.local_path_input.text())
+        worker.scanned.connect(self._on_status_scanned)
+        self._status_workers.append(worker)
+        worker.start()
+
+    def _on_status_scanned(self, generation, tree):
+        if generation != self._status_generation:
+            return
+        # 다시 계산해도 체크한 항목은 유지 (_get_checked_items 로 이어짐)
+        self.status_model.set_tree(tree, keep_checked=True)
+
+    def _on_files_scanned(self, generation, repo_path, local_tree, git_tree, tracked_index):
+        # 더 최신 스캔이 시작된 경우 이전 결과는 버림
+        if generation != self._scan_generation:
+            return
+        # 완성된 트리를 모델에 한 번에 넣음 (지연 로딩이면 펼칠 때 불러올 함수도 함께)
+        local_loader = git_loader = None
+        if self.lazy_tree_check.isChecked():
+            ignore = self._ignore
+            local_loader = lambda rel_path: list_dir(repo_path, rel_path, ignore)[1:]
+            git_loader = lambda rel_path: tracked_index.get(rel_path, ((), ()))
+        with tracing.span('set tree'):
+            if generation != self._streamed_generation:
+                # 스캔 중에 이미 모두 넣었으면 (같은 내용이므로) 다시 넣지 않음
+                self.file_model.set_tree(local_tree, local_loader)
+            if git_tree is not None:
+                self.git_file_model.set_tree(git_tree, git_loader)
+                self._tracked_index = tracked_index
+        # 읽어 둔 폴더들을 감시 대상으로 등록 (.gitignore 는 내용이 바뀌어도 알 수 있도록 파일도 감시)
         if os.path.isdir(repo_path):
-            for root, dirs, files in os.walk(repo_path):
-                if '.git' in dirs:
-                    dirs.remove('.git')
-                rel_root = os.path.relpath(root, repo_path)
-                parent = self.file_tree
-                if rel_root != '.':
-                    parent = self._get_or_create_tree_node(self.file_tree, rel_root)
-                for file in files:
-                    item = QTreeWidgetItem(parent, [file])
-                    # 체크박스 추가
-                    item.setCheckState(0, Qt.Unchecked)
-        # Git 파일 목록 (tracked 파일, 폴더 구조)
-        try:
-            repo = Repo(repo_path)
-            tracked_files = list(repo.git.ls_files().splitlines())
-            for f in tracked_files:
-                self._add_tree_path_with_checkbox(self.git_file_tree, f)
-        except Exception:
-            pass
+            self.file_watcher.watch(repo_path, local_tree.loaded_dirs())
+            if self._ignore is not None:
+                self.file_watcher.add_files(self._ignore.rule_files())
+        else:
+            self.file_watcher.clear()
 
-    def _get_or_create_tree_node(self, tree_widget, rel_path):
-        # rel_path: 'a/b/c' -> 트리에서 해당 폴더 노드 반환, 없으면 생성
-        parts = rel_path.split(os.sep)
-        parent = tree_widget
-        for part in parts:
-            found = None
-            for i in range(parent.topLevelItemCount() if parent is tree_widget else parent.childCount()):
-                item = parent.topLevelItem(i) if parent is tree_widget else parent.child(i)
-                if item.text(0) == part:
-                    found = item
-                    break
-            if found:
-                parent = found
-            else:
-                new_item = QTreeWidgetItem([part])
-                if parent is tree_widget:
-                    parent.addTopLevelItem(new_item)
-                else:
-                    parent.addChild(new_item)
-                parent = new_item
-        return parent
-
-    def _add_tree_path_with_checkbox(self, tree_widget, file_path):
-        # file_path: 'a/b/c.txt' -> 트리 구조로 추가 + 체크박스
-        parts = file_path.split('/')
-        parent = tree_widget
-        for part in parts[:-1]:
-            found = None
-            for i in range(parent.topLevelItemCount() if parent is tree_widget else parent.childCount()):
-                item = parent.topLevelItem(i) if parent is tree_widget else parent.child(i)
-                if item.text(0) == part:
-                    found = item
-                    break
-            if found:
-                parent = found
-            else:
-                new_item = QTreeWidgetItem([part])
-                if parent is tree_widget:
-                    parent.addTopLevelItem(new_item)
-                else:
-                    parent.addChild(new_item)
-                parent = new_item
-        item = QTreeWidgetItem(parent, [parts[-1]])
-        item.setCheckState(0, Qt.Unchecked)
+    def _on_local_listed(self, generation, batch):
+        if generation == self._scan_generation:
+            self.file_model.add_listings(batch)
+
+    def _on_files_indexed(self, generation, local_index, git_index):
+        if generation != self._scan_generation:
+            return
+        self.local_search.set_index(local_index)
+        if git_index is not None:
+            self.git_search.set_index(git_index)
 
-    # 체크박스 연동: 체크 상태 변경 시 옵션 입력란 자동 채움
+    def _reveal_in_tree(self, tree_view, rel_path):
+        # 검색 결과를 트리에서 펼쳐 보이고 선택
+        index = tree_view.model().index_for_path(rel_path)
+        if not index.isValid():
+            self.message_label.setText(f'트리에서 찾을 수 없습니다: {rel_path}')
+            return
+        parent = index.parent()
+        while parent.isValid():
+            tree_view.expand(parent)
+            parent = parent.parent()
+        tree_view.setCurrentIndex(index)
+        tree_view.scrollTo(index)
+        tree_view.setFocus()
+
+    def _on_local_dirs_changed(self, rel_dirs):
+        # 바뀐 폴더만 다시 읽어서 로컬 트리에 증분 반영 (전체 os.walk 없음)
+        repo_path = self.local_path_input.text()
+        lazy = self.lazy_tree_check.isChecked()
+        ignore = self._ignore
+        if ignore is not None and any(ignore.is_stale(rel_dir) for rel_dir in rel_dirs):
+            # .gitignore 가 바뀌면 숨길 항목이 폴더 곳곳에서 달라지므로 전체를 다시 읽음
+            self.update_file_list()
+            return
+        new_dirs = []
+        # 검색 색인에도 반영할 파일/삭제된 경로
+        added, removed = [], []
+        # 트리에는 모아서 한 번에 반영 (삭제는 레이아웃 변경 한 번, 추가는 폴더마다 행 삽입 한 번)
+        listings = []
+        for rel_dir in rel_dirs:
+            current = self.file_model.child_entries(rel_dir)
+            abs_dir = os.path.join(repo_path, rel_dir)
+            # 아직 읽지 않은 폴더이거나, 폴더 자체가 지워진 경우(상위 폴더 이벤트에서 처리)
+            if current is None or not os.path.isdir(abs_dir):
+                continue
+            _, dirs, files = list_dir(repo_path, rel_dir, ignore)
+            entries = dict.fromkeys(files, False)
+            entries.update(dict.fromkeys(dirs, True))
+            removed.extend(join_rel_path(rel_dir, name) for name, is_dir in current.items()
+                           if entries.get(name) != is_dir)
+            added_dirs = [name for name in dirs if current.get(name) is not True]
+            added_files = [name for name in files if current.get(name) is not False]
+            added.extend(join_rel_path(rel_dir, name) for name in added_files)
+            listings.append((rel_dir, added_dirs, added_files))
+            # 새로 생긴(또는 옮겨 온) 폴더는 그 폴더 아래만 읽음
+            # 지연 로딩이면 트리는 펼칠 때 읽지만, 검색 색인에는 바로 넣음
+            for name in added_dirs:
+                for batch in scan_tree(repo_path, ignore, start=join_rel_path(rel_dir, name)):
+                    for rel_root, sub_dirs, sub_files in batch:
+                        added.extend(join_rel_path(rel_root, f) for f in sub_files)
+                        if not lazy:
+                            listings.append((rel_root, sub_dirs, sub_files))
+                            new_dirs.append(rel_root)
+        if removed:
+            self.file_model.remove_paths(removed)
+        self.file_model.add_listings(listings)
+        if added or removed:
+            self.local_search.update_paths(added, removed)
+        if new_dirs:
+            self.file_watcher.add(new_dirs)
+        if self._is_status_view():
+            self._refresh_status()
+
+    def _apply_tracked_changes(self, added, removed):
+        # Git 작업 후 tracked 파일 중 바뀐 것만 Git 트리에 반영
+        self.git_file_model.remove_paths(removed, prune_empty=True)
+        self.git_file_model.add_files(added)
+        if self._tracked_index:
+            update_tracked_index(self._tracked_index, added, removed)
+        self.git_search.update_paths(added, removed)
+        if self._is_status_view():
+            self._refresh_status()
+
+    # 체크박스 연동: 체크 상태 변경 시 옵션 입력란 자동 채움 (연달은 변경은 모델이 한 번으로 묶어서 알림)
     def _connect_tree_checkbox_signals(self):
-        self.file_tree.itemChanged.connect(self._update_local_option_from_checkbox)
-        self.git_file_tree.itemChanged.connect(self._update_git_option_from_checkbox)
-    def _update_local_option_from_checkbox(self, item, col):
+        self.file_model.checked_changed.connect(self._update_local_option_from_checkbox)
+        self.git_file_model.checked_changed.connect(self._update_git_option_from_checkbox)
+        self.status_model.checked_changed.connect(self._update_git_option_from_checkbox)
+    def _update_local_option_from_checkbox(self):
         checked = self._get_checked_items(self.file_tree)
         if checked:
             self.local_option_input.setText(' '.join(checked))
-    def _update_git_option_from_checkbox(self, item, col):
+    def _update_git_option_from_checkbox(self):
         checked = self._get_checked_items(self.git_file_tree)
         if checked:
             self.git_option_input.setText(' '.join(checked))
-    def _get_checked_items(self, tree_widget):
-        result = []
-        def _recurse(parent, path=''):
-            for i in range(parent.topLevelItemCount() if parent is tree_widget else parent.childCount()):
-                item = parent.topLevelItem(i) if parent is tree_widget else parent.child(i)
-                name = item.text(0)
-                full = f'{path}/{name}' if path else name
-                if item.checkState(0) == Qt.Checked and item.childCount() == 0:
-                    result.append(full)
-                _recurse(item, full)
-        _recurse(tree_widget)
-        return result
+    def _get_checked_items(self, tree_view):
+        # 체크된 항목의 상대경로 목록 (통째로 체크된 폴더는 폴더 경로 하나)
+        return tree_view.model().checked_paths()
 
     def update_local_terminal_command(self):
         action = self.local_action_combo.currentText()
-        item = self.file_tree.currentItem()
+        index = self.file_tree.currentIndex()
         repo_path = self.local_path_input.text()
         path = ''
         rel_path = ''
-        if item:
-            path = self._get_full_path_from_tree(item, repo_path)
+        if index.isValid():
+            path = self._get_full_path_from_tree(index, repo_path)
             rel_path = os.path.relpath(path, repo_path)
         if action == '새 파일 만들기':
-            self.local_option_input.setText(f'type nul > "{rel_path or "새파일.txt"}"')
+            self.local_option_input.setText(shell_command('new_file', rel_path or '새파일.txt'))
             self.local_option_label.setText(
                 '설명: 지정한 경로에 새 파일을 생성합니다.\n'
-                '옵션: type nul > "파일명" 형식으로 입력하세요.\n'
-                '예시: type nul > "test.txt"\n예시(여러 개): type nul > "a.txt" & type nul > "b.txt"\n'
+                f'옵션: {shell_command("new_file", "파일명")} 형식으로 입력하세요.\n'
+                f'예시: {shell_command("new_file", "test.txt")}\n'
+                f'예시(여러 개): {shell_command("new_file", "a.txt")} && {shell_command("new_file", "b.txt")}\n'
                 '주의: 이미 존재하는 파일은 덮어쓰지 않고, 빈 파일만 생성합니다.'
             )
         elif action == '새 폴더 만들기':
-            self.local_option_input.setText(f'mkdir "{rel_path or "새폴더"}"')
+            self.local_option_input.setText(shell_command('new_dir', rel_path or '새폴더'))
+            several = shell_command('new_dir', paths='"a" "b" "c"')
             self.local_option_label.setText(
                 '설명: 지정한 경로에 새 폴더를 생성합니다.\n'
-                '옵션: mkdir "폴더명" 형식으로 입력하세요.\n'
-                '예시: mkdir "새폴더"\n예시(여러 개): mkdir "a" "b" "c"\n'
+                f'옵션: {shell_command("new_dir", "폴더명")} 형식으로 입력하세요.\n'
+                f'예시: {shell_command("new_dir", "새폴더")}\n'
+                f'예시(여러 개): {several}\n'
                 '주의: 이미 존재하는 폴더는 무시됩니다.'
             )
         elif action == '이름 변경':
-            self.local_option_input.setText(f'rename "{rel_path}" "새이름"')
+            self.local_option_input.setText(shell_command('rename', rel_path, name='새이름'))
             self.local_option_label.setText(
                 '설명: 선택한 파일/폴더의 이름을 변경합니다.\n'
-                '옵션: rename "기존이름" "새이름" 형식으로 입력하세요.\n'
-                '예시: rename "old.txt" "new.txt"\n예시(폴더): rename "myfolder" "backup"\n'
+                f'옵션: {shell_command("rename", "기존이름", name="새이름")} 형식으로 입력하세요.\n'
+                f'예시: {shell_command("rename", "old.txt", name="new.txt")}\n'
+                f'예시(폴더): {shell_command("rename", "myfolder", name="backup")}\n'
                 '주의: 같은 폴더 내에서만 이름 변경이 가능합니다.'
             )
         elif action == '삭제':
-            self.local_option_input.setText(f'del "{rel_path}"  또는  rmdir /s /q "{rel_path}"')
+            is_folder = index.isValid() and self.file_model.is_dir(index)
+            self.local_option_input.setText(shell_command('delete_dir' if is_folder else 'delete_file', rel_path))
             self.local_option_label.setText(
                 '설명: 선택한 파일 또는 폴더를 삭제합니다.\n'
-                '옵션: 파일은 del, 폴더는 rmdir 명령을 사용합니다.\n'
-                '예시(파일): del "test.txt"\n예시(폴더): rmdir /s /q "myfolder"\n'
+                '옵션: 파일과 폴더는 삭제 명령이 다릅니다.\n'
+                f'예시(파일): {shell_command("delete_file", "test.txt")}\n'
+                f'예시(폴더): {shell_command("delete_dir", "myfolder")}\n'
                 '주의: 삭제된 파일/폴더는 복구할 수 없습니다.'
             )
         elif action == '탐색기에서 열기':
-            self.local_option_input.setText(f'explorer /select,"{path}"')
+            self.local_option_input.setText(shell_command('reveal', path.replace('\\', '/')))
+            example = shell_command('reveal', repo_path.replace('\\', '/').rstrip('/') + '/test.txt')
             self.local_option_label.setText(
-                '설명: 선택한 파일/폴더를 윈도우 탐색기에서 표시합니다.\n'
-                '옵션: explorer /select,"경로" 형식으로 입력하세요.\n'
-                '예시: explorer /select,"C:/Users/me/test.txt"\n예시(폴더): explorer "C:/Users/me/Documents"'
+                '설명: 선택한 파일/폴더를 파일 탐색기에서 표시합니다.\n'
+                f'옵션: {shell_command("reveal", "경로")} 형식으로 입력하세요.\n'
+                f'예시: {example}'
             )
         else:
             self.local_option_input.setText('')
@@ -465,12 +1155,12 @@ class GitGUI(QMainWindow):
 
     def update_git_terminal_command(self):
         action = self.git_action_combo.currentText()
-        item = self.git_file_tree.currentItem()
+        index = self.git_file_tree.currentIndex()
         repo_path = self.local_path_input.text()
         path = ''
         rel_path = ''
-        if item:
-            path = self._get_full_path_from_tree(item, repo_path, git_tree=True)
+        if index.isValid():
+            path = self._get_full_path_from_tree(index, repo_path, git_tree=True)
             rel_path = os.path.relpath(path, repo_path)
         if action == 'Git add (추적 시작)':
             self.git_option_input.setText(f'git add "{rel_path}"')
@@ -521,76 +1211,251 @@ class GitGUI(QMainWindow):
                 '주의: mv 후 커밋해야 반영됩니다.'
             )
         elif action == 'Git 폴더 생성':
-            self.git_option_input.setText(f'mkdir "{rel_path or "새폴더"}" && type nul > "{rel_path or "새폴더"}/.gitkeep" && git add "{rel_path or "새폴더"}/.gitkeep"')
+            self.git_option_input.setText(self._new_git_folder_command(rel_path or '새폴더'))
             self.git_option_label.setText(
                 '설명: 새 폴더를 만들고 .gitkeep 파일로 Git에 추적시킵니다.\n'
-                '옵션: mkdir "폴더명" && type nul > "폴더명/.gitkeep" && git add "폴더명/.gitkeep" 형식으로 입력하세요.\n'
-                '예시: mkdir "새폴더" && type nul > "새폴더/.gitkeep" && git add "새폴더/.gitkeep"\n'
+                f'옵션: {self._new_git_folder_command("폴더명")} 형식으로 입력하세요.\n'
+                f'예시: {self._new_git_folder_command("새폴더")}\n'
                 '주의: Git은 빈 폴더만은 추적하지 않으므로 더미파일(.gitkeep 등)이 필요합니다.'
             )
         else:
             self.git_option_input.setText('')
             self.git_option_label.setText('')
 
+    @staticmethod
+    def _new_git_folder_command(folder):
+        # 빈 폴더는 Git 이 추적하지 않으므로 .gitkeep 을 만들어 추가
+        return (f'{shell_command("new_dir", folder)} && {shell_command("new_file", folder + "/.gitkeep")}'
+                f' && git add "{folder}/.gitkeep"')
+
     def handle_local_action(self):
-        self.update_local_terminal_command()
-        idx = self.local_action_combo.currentIndex()
-        if idx < 0:
+        # 옵션 입력란의 명령을 그대로 실행 (콤보박스 예시를 고쳐 쓴 내용도 유지)
+        if self.local_action_combo.currentIndex() < 0:
             QMessageBox.information(self, '알림', '명령어를 선택하세요.')
             return
-        cmd = self.local_option_input.text().strip()
-        if not cmd:
-            return
-        try:
-            import os
-            # 현재 작업 디렉토리 저장
-            current_dir = os.getcwd()
-            # 명령어를 실행할 디렉토리로 이동
-            repo_path = self.local_path_input.text()
-            os.chdir(repo_path)
-            # 명령 프롬프트 실행
-            os.system(f'start cmd.exe /k "{cmd}"')
-            # 원래 디렉토리로 복귀
-            os.chdir(current_dir)
-            self.message_label.setText('명령어가 터미널에서 실행됩니다.')
-        except Exception as e:
-            error_msg = f'터미널 실행 실패: {str(e)}'
-            self.message_label.setText(f'<span style="color:red;">{error_msg}</span>')
-            QMessageBox.critical(self, '오류', error_msg)
+        self._run_command(self.local_option_input.text().strip())
 
     def handle_git_action(self):
-        self.update_git_terminal_command()
-        idx = self.git_action_combo.currentIndex()
-        if idx < 0:
+        if self.git_action_combo.currentIndex() < 0:
             QMessageBox.information(self, '알림', '명령어를 선택하세요.')
             return
-        cmd = self.git_option_input.text().strip()
+        self._run_command(self.git_option_input.text().strip())
+
+    def _run_command(self, cmd):
+        # 저장소 폴더에서 백그라운드로 실행하고 출력은 아래 출력 창에 표시 (끝나면 바뀐 경로만 트리에 반영)
         if not cmd:
             return
+        repo_path = self.local_path_input.text()
+        if not os.path.isdir(repo_path):
+            self.show_error('저장소 경로를 확인하세요.')
+            return
+        self.command_runner.run(cmd, repo_path)
+
+    def _on_command_started(self, job_id, command):
+        self.command_output.appendPlainText(f'[{job_id}] $ {command}')
+        self.command_stop_button.setEnabled(True)
+        self.message_label.setText(f'명령 실행 중: {command}')
+
+    def _on_command_output(self, job_id, lines, is_error):
+        # 오류 출력(stderr)은 빨간색
+        if is_error:
+            for line in lines:
+                self.command_output.appendHtml(f'<span style="color:#b71c1c;">[{job_id}] {html.escape(line)}</span>')
+        else:
+            self.command_output.appendPlainText('\n'.join(f'[{job_id}] {line}' for line in lines))
+
+    def _on_command_finished(self, job_id, exit_code, command, cwd, affected):
+        self.command_output.appendPlainText(f'[{job_id}] 종료 (코드 {exit_code})')
+        self.command_stop_button.setEnabled(self.command_runner.running() > 0)
+        if exit_code == 0:
+            self.message_label.setText(f'명령 완료: {command}')
+        else:
+            self.show_error(f'명령 실패 (코드 {exit_code}): {command}')
+        # 그 사이 다른 저장소로 바뀌었으면 새 스캔 결과가 이미 반영됨
+        repo_path = self.local_path_input.text()
+        if OperationScheduler.repo_key(cwd) != OperationScheduler.repo_key(repo_path):
+            return
+        if affected:
+            # 명령에 나온 경로의 상위 폴더(폴더면 그 폴더도)만 다시 읽음
+            rel_dirs = [rel_path.rpartition('/')[0] for rel_path in affected]
+            rel_dirs.extend(rel_path for rel_path in affected if os.path.isdir(os.path.join(repo_path, rel_path)))
+            self._refresh_local_dirs(rel_dirs)
+        if runs_git(command) and not self._is_status_view():
+            # git 명령이면 그 경로들(경로가 없으면 저장소 전체)의 tracked 파일만 다시 확인
+            worker = TrackedPathsWorker(repo_path, affected or [''])
+            worker.listed.connect(self._on_tracked_listed)
+            self._tracked_workers = [w for w in self._tracked_workers if w.isRunning()] + [worker]
+            worker.start()
+        elif self._is_status_view() and not affected:
+            self._refresh_status()
+
+    def _refresh_local_dirs(self, rel_dirs):
+        # 폴더들만 다시 읽어서 로컬 트리에 반영
+        # 새로 생긴 폴더 아래면 트리에 이미 있는 가장 가까운 상위 폴더에서 읽음
+        found = set()
+        for rel_dir in rel_dirs:
+            while rel_dir and self.file_model.child_entries(rel_dir) is None:
+                rel_dir = rel_dir.rpartition('/')[0]
+            found.add(rel_dir)
+        self._on_local_dirs_changed(sorted(found))
+
+    # ---- 트리에서 고른 항목 일괄 작업 (셸 명령 없이 프로세스 안에서 실행, 되돌리기 가능) ----
+    def _run_bulk(self, label, func, *args, repo_path=None, **kwargs):
+        repo_path = repo_path or self.local_path_input.text()
+        worker = BulkWorker(repo_path, label, func, *args, **kwargs)
+        worker.progress.connect(self.update_status)
+        worker.error.connect(self.show_error)
+        worker.finished.connect(self.operation_finished)
+        worker.transfer.connect(self.update_transfer)
+        worker.done.connect(self._on_bulk_done)
+        self.message_label.setText(f'{label} 중...')
+        if not self.scheduler.submit(worker):
+            self.message_label.setText(self.message_label.text() + ' (앞선 작업이 끝나면 시작합니다)')
+
+    def _open_repo(self):
         try:
-            import os
-            # 현재 작업 디렉토리 저장
-            current_dir = os.getcwd()
-            # 명령어를 실행할 디렉토리로 이동
-            repo_path = self.local_path_input.text()
-            os.chdir(repo_path)
-            # 명령 프롬프트 실행
-            os.system(f'start cmd.exe /k "{cmd}"')
-            # 원래 디렉토리로 복귀
-            os.chdir(current_dir)
-            self.message_label.setText('명령어가 터미널에서 실행됩니다.')
-        except Exception as e:
-            error_msg = f'터미널 실행 실패: {str(e)}'
-            self.message_label.setText(f'<span style="color:red;">{error_msg}</span>')
-            QMessageBox.critical(self, '오류', error_msg)
-
-    def _get_full_path_from_tree(self, item, root_path, git_tree=False):
-        # 트리에서 선택한 아이템의 전체 경로를 반환
-        parts = []
-        while item is not None:
-            parts.insert(0, item.text(0))
-            item = item.parent()
-        return os.path.join(root_path, *parts)
+            return Repo(self.local_path_input.text())
+        except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+            self.show_error('Git 저장소가 아닙니다.')
+            return None
+
+    def _on_bulk_done(self, repo_path, label, result):
+        if result.undo is not None:
+            self._undo_stack.append((repo_path, label, result))
+            while len(self._undo_stack) > UNDO_LIMIT:
+                bulk_ops.discard(self._undo_stack.pop(0)[2])
+        self.undo_button.setEnabled(bool(self._undo_stack))
+        if self._undo_stack:
+            self.undo_button.setToolTip(f'{self._undo_stack[-1][1]} 되돌리기')
+        if OperationScheduler.repo_key(repo_path) != OperationScheduler.repo_key(self.local_path_input.text()):
+            return
+        # 트리는 작업이 끝난 뒤 한 번에 갱신 (바뀐 폴더만 다시 읽고, tracked 파일은 바뀐 것만)
+        if result.changed_dirs:
+            self._refresh_local_dirs(result.changed_dirs)
+        if result.tracked_added or result.tracked_removed:
+            self._apply_tracked_changes(result.tracked_added, result.tracked_removed)
+
+    def undo_bulk_operation(self):
+        if not self._undo_stack:
+            return
+        repo_path, label, result = self._undo_stack.pop()
+        self.undo_button.setEnabled(bool(self._undo_stack))
+        self._run_bulk(f'{label} 되돌리기', bulk_ops.revert, result, repo_path=repo_path)
+
+    def _bulk_delete(self, targets, is_git, keep_files=False):
+        action = '추적 해제' if keep_files else '삭제'
+        detail = '(로컬 파일은 남습니다)' if keep_files else '(되돌리기/Ctrl+Z 로 복구할 수 있습니다)'
+        preview = '\n'.join(targets[:10]) + (f'\n... 외 {len(targets) - 10}개' if len(targets) > 10 else '')
+        answer = QMessageBox.question(self, f'{action} 확인', f'{len(targets)}개 항목을 {action}합니다. {detail}\n\n{preview}')
+        if answer != QMessageBox.Yes:
+            return
+        if is_git:
+            repo = self._open_repo()
+            if repo is not None:
+                self._run_bulk(f'Git {action}', bulk_ops.git_remove, repo, targets, keep_files=keep_files)
+        else:
+            self._run_bulk(action, bulk_ops.delete_paths, self.local_path_input.text(), targets)
+
+    def _confirm_download(self, targets):
+        # 원격 최신 내용으로 덮어쓰기 전에 확인 (커밋하지 않은 변경이 있는 파일은 목록으로 보여 줌)
+        # 부분 클론 저장소면 그 폴더의 blob 만 받아서 cone 에 더함
+        repo = self._open_repo()
+        if repo is None:
+            return
+        try:
+            dirty = sparse.dirty_paths(repo, targets)
+        except GitCommandError as e:
+            self.show_error(f'Git 상태를 확인하지 못했습니다: {e}')
+            return
+        if dirty:
+            preview = '\n'.join(dirty[:10]) + (f'\n... 외 {len(dirty) - 10}개' if len(dirty) > 10 else '')
+            detail = f'커밋하지 않은 변경이 있는 파일 {len(dirty)}개의 변경 내용이 사라집니다.\n\n{preview}'
+        else:
+            preview = '\n'.join(targets[:10]) + (f'\n... 외 {len(targets) - 10}개' if len(targets) > 10 else '')
+            detail = f'로컬 변경은 없습니다.\n\n{preview}'
+        answer = QMessageBox.question(self, '다운로드 확인',
+                                      f'{len(targets)}개 항목을 원격 최신 내용으로 덮어씁니다. {detail}')
+        if answer != QMessageBox.Yes:
+            return
+        self.run_git_operation('download_folders', paths=targets, overwrite=True)
+
+    def _bulk_move(self, moves, is_git, label):
+        if not moves:
+            return
+        if is_git:
+            repo = self._open_repo()
+            if repo is not None:
+                self._run_bulk(f'Git {label}', bulk_ops.git_move, repo, moves)
+        else:
+            self._run_bulk(label, bulk_ops.move_paths, self.local_path_input.text(), moves)
+
+    def _ask_rename(self, rel_path, is_git):
+        folder, _, name = rel_path.rpartition('/')
+        new_name, ok = QInputDialog.getText(self, '이름 바꾸기', '새 이름:', text=name)
+        new_name = new_name.strip()
+        if not ok or not new_name or new_name == name:
+            return
+        if '/' in new_name or '\\' in new_name:
+            self.show_error('이름에는 폴더 구분자를 쓸 수 없습니다.')
+            return
+        self._bulk_move([(rel_path, join_rel_path(folder, new_name))], is_git, '이름 바꾸기')
+
+    def _ask_move(self, targets, is_git):
+        dest, ok = QInputDialog.getText(self, '이동', f'{len(targets)}개 항목을 옮길 폴더 (저장소 기준, 비우면 최상위):',
+                                        text=targets[0].rpartition('/')[0])
+        if not ok:
+            return
+        dest = dest.replace('\\', '/').strip().strip('/')
+        if any(dest == t or dest.startswith(t + '/') for t in targets):
+            self.show_error('폴더를 자기 자신 안으로 옮길 수 없습니다.')
+            return
+        moves = [(t, join_rel_path(dest, t.rpartition('/')[2])) for t in targets if t.rpartition('/')[0] != dest]
+        self._bulk_move(moves, is_git, '이동')
+
+    def _bulk_copy(self, targets):
+        repo_path = self.local_path_input.text()
+        copies = [(t, bulk_ops.copy_name(repo_path, t)) for t in targets]
+        self._run_bulk('복사', bulk_ops.copy_paths, repo_path, copies)
+
+    def _on_tracked_listed(self, repo_path, rel_paths, tracked):
+        if OperationScheduler.repo_key(repo_path) != OperationScheduler.repo_key(self.local_path_input.text()):
+            return
+        before = self._tracked_under(rel_paths)
+        after = set(tracked)
+        if before != after:
+            self._apply_tracked_changes(sorted(after - before), sorted(before - after))
+
+    def _tracked_under(self, rel_paths):
+        # Git 트리에 있는 파일 중 rel_paths 자신이거나 그 아래인 것 ('' 는 전체)
+        # 지연 로딩이면 트리에 아직 없는 폴더도 있으므로 tracked 인덱스에서 찾음
+        found = set()
+        index = self._tracked_index
+        tree = self.git_file_model.tree()
+        for rel_path in rel_paths:
+            if index:
+                parent, _, name = rel_path.rpartition('/')
+                if rel_path and name in index.get(parent, ((), ()))[1]:
+                    found.add(rel_path)
+                stack = [rel_path] if rel_path in index else []
+                while stack:
+                    rel_dir = stack.pop()
+                    subdirs, files = index[rel_dir]
+                    found.update(join_rel_path(rel_dir, name) for name in files)
+                    stack.extend(join_rel_path(rel_dir, name) for name in subdirs)
+                continue
+            node = tree.find(rel_path) if rel_path else ROOT
+            stack = [node] if node is not None else []
+            while stack:
+                node = stack.pop()
+                if tree.is_dir(node):
+                    stack.extend(tree.children(node))
+                else:
+                    found.add(tree.path_of(node))
+        return found
+
+    def _get_full_path_from_tree(self, index, root_path, git_tree=False):
+        # 트리에서 선택한 항목의 전체 경로를 반환
+        return os.path.join(root_path, *index.model().rel_path(index).split('/'))
 
     def disable_buttons_and_lists(self):
         # 더 이상 사용하지 않음 (on_path_changed로 대체)
@@ -599,14 +1464,35 @@ class GitGUI(QMainWindow):
         # 더 이상 사용하지 않음 (on_path_changed로 대체)
         pass
 
+    def closeEvent(self, event):
+        # 종료 전에 실행 중인 스캔 스레드 정리
+        self._refresh_timer.stop()
+        self._prefetch_timer.stop()
+        for worker in self._prefetch_workers:
+            worker.cancel()
+        self.command_runner.kill()
+        self.command_runner.wait_all()
+        self.file_watcher.stop()
+        workers = self._scan_workers + self._status_workers + self._tracked_workers + self._prefetch_workers
+        for worker in workers:
+            worker.requestInterruption()
+        for worker in workers:
+            worker.wait()
+        self.scheduler.cancel()
+        self.scheduler.wait_all()
+        # 되돌리기 기록은 프로그램을 닫으면 사라지므로 휴지통도 비움
+        for _repo_path, _label, result in self._undo_stack:
+            bulk_ops.discard(result)
+        super().closeEvent(event)
+
     def show_tree_context_menu(self, tree_widget, pos, is_git=False):
-        item = tree_widget.itemAt(pos)
-        if not item:
+        index = tree_widget.indexAt(pos)
+        if not index.isValid():
             return
         # 경로 계산
         repo_path = self.local_path_input.text()
-        path = self._get_full_path_from_tree(item, repo_path, git_tree=is_git)
-        rel_path = os.path.relpath(path, repo_path)
+        path = self._get_full_path_from_tree(index, repo_path, git_tree=is_git)
+        rel_path = tree_widget.model().rel_path(index)
         # 체크된 항목들
         checked = self._get_checked_items(tree_widget)
         # 파일/폴더 판별
@@ -615,99 +1501,52 @@ class GitGUI(QMainWindow):
             is_folder = True
         elif not os.path.exists(path):
             # git 트리의 경우 실제 파일이 없을 수 있음(폴더 추정)
-            if item.childCount() > 0:
+            if tree_widget.model().is_dir(index):
                 is_folder = True
+        # 체크된 항목이 있으면 삭제/이동/복사는 체크된 것들 전체에 한 번에 실행
+        targets = checked if checked else [rel_path]
+        count = f' ({len(targets)}개)' if len(targets) > 1 else ''
+        kind = '폴더' if is_folder else '파일'
         menu = QMenu()
+        act_new = act_untrack = act_upload = act_download = None
         if is_folder:
             act_new = menu.addAction('폴더 생성')
-            act_rename = menu.addAction('폴더 이름 바꾸기')
-            act_delete = menu.addAction('폴더 삭제')
-            menu.addSeparator()
-            if not is_git:
-                act_upload = menu.addAction('폴더 업로드')
-            else:
-                act_download = menu.addAction('폴더 다운로드')
+        act_copy = menu.addAction(f'{kind} 복사{count}')
+        act_rename = menu.addAction(f'{kind} 이름 바꾸기')
+        act_move = menu.addAction(f'이동...{count}')
+        act_delete = menu.addAction(f'{kind} 삭제{count}')
+        if is_git:
+            act_untrack = menu.addAction(f'추적 해제{count}')
+        menu.addSeparator()
+        if not is_git:
+            act_upload = menu.addAction(f'{kind} 업로드')
         else:
-            act_copy = menu.addAction('파일 복사')
-            act_rename = menu.addAction('파일 이름 바꾸기')
-            act_delete = menu.addAction('파일 삭제')
-            menu.addSeparator()
-            if not is_git:
-                act_upload = menu.addAction('파일 업로드')
-            else:
-                act_download = menu.addAction('파일 다운로드')
+            act_download = menu.addAction(f'{kind} 다운로드')
         action = menu.exec_(tree_widget.viewport().mapToGlobal(pos))
+        if action is None:
+            return
 
-        # 체크된 항목이 있으면, 체크된 것들로 명령어 생성
-        targets = checked if checked else [rel_path]
-        targets_str = ' '.join(f'"{t}"' for t in targets)
-        # 아래 옵션 입력란에 명령어 예시 자동 입력
-        if is_git:
-            # 오른쪽(Git) 트리
-            if is_folder:
-                if action == act_new:
-                    self.git_option_input.setText(f'cd "{repo_path}" && mkdir "{rel_path}/새폴더" && type nul > "{rel_path}/새폴더/.gitkeep" && git add "{rel_path}/새폴더/.gitkeep"')
-                elif action == act_rename:
-                    self.git_option_input.setText(f'cd "{repo_path}" && git mv {targets_str} "새이름"')
-                elif action == act_delete:
-                    self.git_option_input.setText(f'cd "{repo_path}" && git rm -r {targets_str}')
-                elif action == act_download:
-                    self.git_option_input.setText(f'cd "{repo_path}" && git checkout origin/main -- {targets_str}')
-            else:
-                if action == act_copy:
-                    self.git_option_input.setText(f'cd "{repo_path}" && copy {targets_str} "복사본.txt" && git add "복사본.txt"')
-                elif action == act_rename:
-                    self.git_option_input.setText(f'cd "{repo_path}" && git mv {targets_str} "새이름"')
-                elif action == act_delete:
-                    self.git_option_input.setText(f'cd "{repo_path}" && git rm {targets_str}')
-                elif action == act_download:
-                    self.git_option_input.setText(f'cd "{repo_path}" && git checkout origin/main -- {targets_str}')
+        if action == act_delete:
+            self._bulk_delete(targets, is_git)
+        elif action == act_untrack:
+            self._bulk_delete(targets, is_git, keep_files=True)
+        elif action == act_move:
+            self._ask_move(targets, is_git)
+        elif action == act_rename:
+            self._ask_rename(rel_path, is_git)
+        elif action == act_copy:
+            self._bulk_copy(targets)
+        elif action == act_download:
+            self._confirm_download(targets)
         else:
-            # 왼쪽(로컬) 트리
-            if is_folder:
-                if action == act_new:
-                    self.local_option_input.setText(f'cd "{repo_path}" && mkdir "{rel_path}/새폴더"')
-                elif action == act_rename:
-                    self.local_option_input.setText(f'cd "{repo_path}" && rename {targets_str} "새이름"')
-                elif action == act_delete:
-                    self.local_option_input.setText(f'cd "{repo_path}" && rmdir /s /q {targets_str}')
-                elif action == act_upload:
-                    self.local_option_input.setText(f'cd "{repo_path}" && git add {targets_str} && git commit -m "폴더 업로드" && git push')
-            else:
-                if action == act_copy:
-                    self.local_option_input.setText(f'cd "{repo_path}" && copy {targets_str} "복사본.txt"')
-                elif action == act_rename:
-                    self.local_option_input.setText(f'cd "{repo_path}" && rename {targets_str} "새이름"')
-                elif action == act_delete:
-                    self.local_option_input.setText(f'cd "{repo_path}" && del {targets_str}')
-                elif action == act_upload:
-                    self.local_option_input.setText(f'cd "{repo_path}" && git add {targets_str} && git commit -m "파일 업로드" && git push')
-
-    def update_file_list(self):
-        self.file_tree.clear()
-        self.git_file_tree.clear()
-        repo_path = self.local_path_input.text()
-        # 저장소 파일 목록 (실제 폴더 내 모든 파일, 폴더 구조)
-        if os.path.isdir(repo_path):
-            for root, dirs, files in os.walk(repo_path):
-                if '.git' in dirs:
-                    dirs.remove('.git')
-                rel_root = os.path.relpath(root, repo_path)
-                parent = self.file_tree
-                if rel_root != '.':
-                    parent = self._get_or_create_tree_node(self.file_tree, rel_root)
-                for file in files:
-                    item = QTreeWidgetItem(parent, [file])
-                    # 체크박스 추가
-                    item.setCheckState(0, Qt.Unchecked)
-        # Git 파일 목록 (tracked 파일, 폴더 구조)
-        try:
-            repo = Repo(repo_path)
-            tracked_files = list(repo.git.ls_files().splitlines())
-            for f in tracked_files:
-                self._add_tree_path_with_checkbox(self.git_file_tree, f)
-        except Exception:
-            pass
+            # 나머지는 아래 옵션 입력란에 명령어 예시 자동 입력 (명령은 저장소 폴더에서 실행되므로 cd 없이)
+            targets_str = ' '.join(f'"{t}"' for t in targets)
+            if action == act_new and is_git:
+                self.git_option_input.setText(self._new_git_folder_command(f'{rel_path}/새폴더'))
+            elif action == act_new:
+                self.local_option_input.setText(shell_command('new_dir', f'{rel_path}/새폴더'))
+            elif action == act_upload:
+                self.local_option_input.setText(f'git add {targets_str} && git commit -m "{kind} 업로드" && git push')
 
 def main():
     app = QApplication(sys.argv)
@@ -0,0 +1,284 @@
+import re
+import time
+
+from git import Repo, RemoteProgress, GitCommandError
+from git.cmd import handle_process_output
+
+import prefetch
+import sparse
+import tracing
+from staging import stage_changes
+
+# Git 작업(업로드/다운로드/동기화) 본체. GitWorker 와 여러 저장소 일괄 동기화가 함께 사용 (Qt 비의존)
+
+# git 진행 표시의 전송량 ('1.20 MiB | 2.34 MiB/s' 의 앞부분)
+TRANSFER_SIZE = re.compile(r'([\d.]+) (bytes|KiB|MiB|GiB)')
+SIZE_UNITS = {'bytes': 1, 'KiB': 1 << 10, 'MiB': 1 << 20, 'GiB': 1 << 30}
+
+
+class OperationCancelled(Exception):
+    """사용자가 Git 작업을 취소했을 때"""
+
+
+class GitProgress(RemoteProgress):
+    """fetch/push/pull 진행 상황(객체 수, 전송량, 속도)을 콜백으로 넘기는 RemoteProgress"""
+    STAGES = {
+        RemoteProgress.COUNTING: '객체 세는 중',
+        RemoteProgress.COMPRESSING: '객체 압축 중',
+        RemoteProgress.WRITING: '객체 보내는 중',
+        RemoteProgress.RECEIVING: '객체 받는 중',
+        RemoteProgress.RESOLVING: '델타 처리 중',
+        RemoteProgress.FINDING_SOURCES: '원본 찾는 중',
+        RemoteProgress.CHECKING_OUT: '체크아웃 중',
+    }
+
+    def __init__(self, callback):
+        super().__init__()
+        self._callback = callback
+        # 받거나 보낸 객체 수 / 전송량 (시간 측정 카운터용)
+        self.objects = 0
+        self.bytes = 0
+
+    def handle_stderr(self, line):
+        # git 은 같은 단계의 진행 표시를 '\r' 로 덮어쓰므로, 줄 하나를 '\r' 단위로 나눠서 각각 해석
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', 'replace')
+        for part in line.split('\r'):
+            if part.strip():
+                self._parse_progress_line(part.rstrip('\n'))
+
+    def update(self, op_code, cur_count, max_count=None, message=''):
+        # message 에는 git 이 보내 주는 '1.20 MiB | 2.34 MiB/s' 같은 전송량/속도가 들어 있음
+        if op_code & (self.RECEIVING | self.WRITING):
+            self.objects = max(self.objects, int(cur_count or 0))
+            match = TRANSFER_SIZE.search(message or '')
+            if match:
+                self.bytes = int(float(match.group(1)) * SIZE_UNITS[match.group(2)])
+        if self._callback is None:
+            return
+        stage = self.STAGES.get(op_code & self.OP_MASK, '진행 중')
+        self._callback(stage, int(cur_count or 0), int(max_count or 0), message or '')
+
+
+class RemoteRunner:
+    """원격 명령(fetch/push/pull)을 진행 표시와 함께 실행하고, 도중에 취소할 수 있게 하는 실행기"""
+
+    def __init__(self, on_progress=None):
+        self._on_progress = on_progress
+        self._cancelled = False
+        self._proc = None
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def cancel(self):
+        # 다음 단계로 넘어가지 않도록 표시하고, 실행 중인 원격 명령은 바로 종료
+        self._cancelled = True
+        proc = self._proc
+        if proc is not None and proc.proc is not None and proc.proc.poll() is None:
+            proc.proc.kill()
+
+    def check(self):
+        if self._cancelled:
+            raise OperationCancelled()
+
+    def report(self, stage, cur_count, max_count, message=''):
+        # 원격 명령이 아닌 작업(이미지 변환 등)의 진행 상황도 같은 경로로 전달
+        if self._on_progress is not None:
+            self._on_progress(stage, cur_count, max_count, message)
+
+    def run(self, repo, command, *args):
+        # --progress 로 실행: stderr 진행 표시를 RemoteProgress 로 해석해서 바로 전달
+        self.check()
+        progress = GitProgress(self._on_progress)
+        with tracing.span(command, args=' '.join(args)) as span:
+            proc = getattr(repo.git, command)('--progress', *args, as_process=True)
+            self._proc = proc
+            try:
+                handle_process_output(proc, None, progress.handle_stderr, finalizer=None, decode_streams=False)
+                self.check()
+                proc.wait(stderr='\n'.join(progress.error_lines))
+            finally:
+                self._proc = None
+            span.set(objects=progress.objects, bytes=progress.bytes)
+        tracing.count('objects transferred', progress.objects)
+        tracing.count('bytes transferred', progress.bytes)
+
+
+def upload(repo, runner, message='Update files'):
+    # 바뀐 파일만 스테이징하고, 변경이 없으면 빈 커밋 없이 push만
+    with tracing.span('add'):
+        changed = stage_changes(repo)
+    if changed:
+        runner.check()
+        with tracing.span('commit'):
+            repo.index.commit(message)
+    elif not has_unpushed(repo):
+        # 올릴 커밋이 없으면 원격에 접속하지 않음
+        return '내컴퓨터 → GIT 업로드: 올릴 변경이 없습니다.'
+    runner.run(repo, 'push', 'origin')
+    return '내컴퓨터 → GIT 업로드 완료!'
+
+
+def has_unpushed(repo):
+    # 따라가는 원격 브랜치보다 앞선 커밋이 있는지 (로컬 ref 로만 판단). 따라가는 브랜치가 없으면 처음 올리는 것으로 봄
+    try:
+        return int(repo.git.rev_list('--count', '@{upstream}..HEAD')) > 0
+    except GitCommandError:
+        return True
+
+
+def download(repo, runner, partial=False, folders=None):
+    # partial: 부분 클론 모드 (blob 없이 받고, folders 가 있으면 그 폴더들만 작업 폴더에 둠)
+    if partial:
+        return sparse.download(repo, runner, folders)
+    adopted = prefetch.adopt(repo)
+    if adopted is not None:
+        # 방금 미리 받아 두었으면 네트워크 없이 병합만 (어느 ref 를 언제 받은 것인지 메시지에 남김)
+        ref, stamp = adopted
+        runner.check()
+        with tracing.span('merge'):
+            merge_upstream(repo)
+        received = time.strftime('%H:%M:%S', time.localtime(stamp))
+        return f'GIT → 내컴퓨터 다운로드 완료! ({received} 에 미리 받은 {ref} 로 병합, fetch 생략)'
+    runner.run(repo, 'pull', 'origin')
+    return 'GIT → 내컴퓨터 다운로드 완료!'
+
+
+def merge_upstream(repo):
+    # git pull 의 병합 단계만 (pull.rebase/pull.ff 설정을 따르고, 설정이 없으면 pull 처럼 fast-forward 만)
+    rebase = _config(repo, 'pull.rebase')
+    ff = _config(repo, 'pull.ff')
+    if rebase is not None and rebase.lower() not in ('false', 'no', 'off', '0'):
+        repo.git.rebase('@{upstream}')
+    elif ff is None or ff == 'only':
+        repo.git.merge('--ff-only', '@{upstream}')
+    elif ff.lower() in ('false', 'no', 'off', '0'):
+        repo.git.merge('--no-ff', '--no-edit', '@{upstream}')
+    else:
+        repo.git.merge('--no-edit', '@{upstream}')
+
+
+def _config(repo, key):
+    # 설정 값 (없으면 None)
+    try:
+        return repo.git.config('--get', key)
+    except GitCommandError:
+        return None
+
+
+def sync_local_to_git(repo, runner, message='Sync local to git'):
+    with tracing.span('add'):
+        changed = stage_changes(repo)
+    if changed:
+        runner.check()
+        with tracing.span('commit'):
+            repo.index.commit(message)
+    elif not has_unpushed(repo):
+        return '내컴퓨터 → GIT 동기화: 올릴 변경이 없습니다.'
+    runner.run(repo, 'push', 'origin')
+    return '내컴퓨터 → GIT 동기화 완료! (내컴퓨터 내용으로 GIT 동일화)'
+
+
+def sync_git_to_local(repo, runner, partial=False, folders=None):
+    if partial:
+        # cone 밖의 파일은 reset 해도 작업 폴더에 쓰지 않음
+        sparse.enable_partial(repo)
+        if folders:
+            sparse.set_cone(repo, folders)
+    runner.run(repo, 'fetch', 'origin')
+    runner.check()
+    with tracing.span('reset'):
+        repo.git.reset('--hard', 'origin/main')
+    return 'GIT → 내컴퓨터 동기화 완료! (GIT 내용으로 내컴퓨터 동일화)'
+
+
+def fetch(repo, runner):
+    runner.run(repo, 'fetch', 'origin')
+    return 'GIT 원격 정보 가져오기 완료!'
+
+
+def download_folders(repo, runner, paths=(), overwrite=False):
+    return sparse.download_folders(repo, runner, paths, overwrite)
+
+
+def build_images(repo, runner):
+    # images/ 원본 → 크기별 WebP/JPEG (캐시에 없는 원본만 변환). Pillow 는 이 작업을 할 때만 불러옴
+    from image_build import build
+    result = build(repo.working_tree_dir, progress=runner.report, cancelled=lambda: runner.cancelled)
+    runner.check()
+    return f"이미지 변환 완료! (새로 변환 {result['processed']}개, 캐시 사용 {result['reused']}개)"
+
+
+OPERATIONS = {
+    'upload': upload,
+    'download': download,
+    'sync_local_to_git': sync_local_to_git,
+    'sync_git_to_local': sync_git_to_local,
+    'fetch': fetch,
+    'download_folders': download_folders,
+    'build_images': build_images,
+}
+
+# 작업 트리를 바꾸지 않는 작업 (같은 저장소에서도 다른 읽기 작업과 동시에 실행 가능)
+READ_ONLY_OPERATIONS = {'fetch'}
+
+
+# 인덱스(tracked 파일 목록)를 건드리지 않는 작업 (전후 비교를 건너뜀)
+INDEX_UNCHANGED_OPERATIONS = READ_ONLY_OPERATIONS | {'build_images'}
+
+
+def tracked_paths(repo):
+    return {path for path, _stage in repo.index.entries}
+
+
+def index_tree(repo):
+    # 지금 인덱스를 트리 객체로 기록 (cache-tree 가 있으면 거의 바로 끝남). 충돌 중이라 못 만들면 None
+    try:
+        return repo.git.write_tree()
+    except GitCommandError:
+        return None
+
+
+def index_changes(repo, tree):
+    # tree(작업 전 인덱스) 와 지금 인덱스를 비교 → (추가된 tracked 파일 목록, 삭제된 tracked 파일 목록)
+    # 비교는 git 이 하고 바뀐 경로만 받아 옴 (-z: 비 ASCII 경로도 그대로)
+    added, removed = [], []
+    fields = repo.git.diff_index('--cached', '--name-status', '-z', '--no-renames', tree).split('\0')
+    for status, path in zip(fields[0::2], fields[1::2]):
+        if status == 'A':
+            added.append(path)
+        elif status == 'D':
+            removed.append(path)
+    return added, removed
+
+
+def run_operation(repo, operation, runner, track_changes=True, **kwargs):
+    # 작업 실행 → (완료 메시지, 추가된 tracked 파일 목록, 삭제된 tracked 파일 목록)
+    # track_changes=False 면 tracked 파일 비교를 하지 않음 (목록은 빈 채로 돌려줌)
+    runner.check()
+    with tracing.span(operation, repo=repo.working_tree_dir):
+        if not track_changes or operation in INDEX_UNCHANGED_OPERATIONS:
+            return OPERATIONS[operation](repo, runner, **kwargs), [], []
+        # 작업 전 인덱스를 트리로 남겨 두고, 작업 뒤에 그 트리와 달라진 경로만 돌려줌 (GUI 트리 갱신용)
+        before = index_tree(repo)
+        if before is None:
+            # 충돌 중인 인덱스: 작업 전후 tracked 파일 목록 전체를 비교
+            paths = tracked_paths(repo)
+            message = OPERATIONS[operation](repo, runner, **kwargs)
+            after = tracked_paths(repo)
+            return message, sorted(after - paths), sorted(paths - after)
+        message = OPERATIONS[operation](repo, runner, **kwargs)
+        with tracing.span('index diff'):
+            added, removed = index_changes(repo, before)
+    return message, added, removed
+
+
+def open_and_run(repo_path, operation, runner, url=None, **kwargs):
+    # 저장소를 열어서 작업 실행 (GitWorker 와 명령줄 공통)
+    # 부분 다운로드인데 아직 저장소가 없으면 빈 폴더에 부분 클론부터 (blob 없이)
+    runner.check()
+    if kwargs.get('partial') and sparse.open_repo(repo_path) is None:
+        sparse.partial_clone(url, repo_path, runner)
+    return run_operation(Repo(repo_path), operation, runner, **kwargs)
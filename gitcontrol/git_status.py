@@ -0,0 +1,117 @@
+# git status --porcelain=v2 -z 출력을 읽는 대로 바로 해석하는 파서 (Qt 비의존)
+
+# 상태 플래그 (PathTree 상태 바이트의 비트, 폴더는 하위 항목 상태를 OR 해서 보여줌)
+STAGED = 0x01      # 인덱스(스테이징)에 변경 있음
+MODIFIED = 0x02    # 작업 폴더에 수정 있음
+ADDED = 0x04       # 새로 추가되어 스테이징됨
+DELETED = 0x08     # 삭제됨 (인덱스 또는 작업 폴더)
+RENAMED = 0x10     # 이름 변경/복사
+CONFLICT = 0x20    # 병합 충돌
+UNTRACKED = 0x40   # 추적 안 됨
+IGNORED = 0x80     # .gitignore 등으로 무시됨
+
+STATUS_LABELS = [
+    (CONFLICT, '충돌', '#c62828'),
+    (RENAMED, '이름 변경', '#2e7d32'),
+    (ADDED, '추가됨', '#2e7d32'),
+    (DELETED, '삭제됨', '#e65100'),
+    (STAGED, '스테이징', '#2e7d32'),
+    (MODIFIED, '수정됨', '#e65100'),
+    (UNTRACKED, '추적 안 됨', '#1565c0'),
+    (IGNORED, '무시됨', '#9e9e9e'),
+]
+
+
+
+def iter_records(stream, chunk_size=65536, cancelled=None):
+    # NUL로 구분된 레코드를 도착하는 대로 하나씩 반환 (전체 출력을 모았다가 나누지 않음)
+    read = getattr(stream, 'read1', stream.read)
+    pending = b''
+    while True:
+        if cancelled is not None and cancelled():
+            return
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        *records, pending = (pending + chunk).split(b'\0')
+        yield from records
+    if pending:
+        yield pending
+
+
+def xy_flags(xy):
+    # 'XY' 두 글자(X=인덱스, Y=작업 폴더) → 상태 플래그
+    x, y = xy[0], xy[1]
+    flags = 0
+    if x != '.':
+        flags |= STAGED
+        if x == 'A':
+            flags |= ADDED
+        elif x == 'D':
+            flags |= DELETED
+        elif x in 'RC':
+            flags |= RENAMED
+    if y != '.':
+        flags |= MODIFIED
+        if y == 'D':
+            flags |= DELETED
+    return flags
+
+
+def parse_records(records):
+    # porcelain v2 레코드 → (경로, 상태 플래그, 원래 경로 또는 None)
+    # 경로가 '/'로 끝나면 폴더 전체가 추적 안 됨/무시됨인 경우
+    records = iter(records)
+    for record in records:
+        kind = record[:1]
+        orig_path = None
+        if kind == b'1':
+            fields = record.split(b' ', 8)
+            flags = xy_flags(fields[1].decode())
+            path = fields[8]
+        elif kind == b'2':
+            # 이름 변경: 다음 레코드가 원래 경로
+            fields = record.split(b' ', 9)
+            flags = xy_flags(fields[1].decode()) | RENAMED
+            path = fields[9]
+            orig_path = next(records, b'').decode('utf-8', 'surrogateescape')
+        elif kind == b'u':
+            fields = record.split(b' ', 10)
+            flags = CONFLICT
+            path = fields[10]
+        elif kind == b'?':
+            flags = UNTRACKED
+            path = record[2:]
+        elif kind == b'!':
+            flags = IGNORED
+            path = record[2:]
+        else:
+            # '# branch...' 헤더나 빈 레코드
+            continue
+        yield path.decode('utf-8', 'surrogateescape'), flags, orig_path
+
+
+def stream_status(repo, cancelled=None, untracked='all', ignored='matching'):
+    # git status 한 번 실행해서 결과를 도착하는 대로 (경로, 플래그, 원래 경로) 로 반환
+    # untracked='normal' 이면 추적 안 된 폴더는 'dir/' 하나로, ignored='no' 면 무시된 항목 생략
+    proc = repo.git.status('--porcelain=v2', '-z', f'--untracked-files={untracked}', f'--ignored={ignored}',
+                           as_process=True)
+    finished = False
+    try:
+        yield from parse_records(iter_records(proc.stdout, cancelled=cancelled))
+        finished = cancelled is None or not cancelled()
+    finally:
+        if finished:
+            # 정상 종료: 종료 코드가 0이 아니면 GitCommandError
+            proc.wait()
+        else:
+            # 중간 취소: 프로세스 정리만 함
+            proc.proc.kill()
+            proc.proc.wait()
+
+
+def status_label(flags):
+    # 상태 플래그 → (표시 문자열, 색상)
+    names = [name for flag, name, _color in STATUS_LABELS if flags & flag]
+    color = next((color for flag, _name, color in STATUS_LABELS if flags & flag), None)
+    return ', '.join(names), color
@@ -0,0 +1,261 @@
+import os
+import re
+from functools import lru_cache
+
+# .gitignore / .git/info/exclude / core.excludesFile 규칙 판별 (Qt 비의존, git 프로세스 없이)
+# 규칙 파일은 폴더별로 처음 필요할 때 한 번만 읽어서 규칙 전체를 정규식 하나로 합쳐 둠
+
+
+def translate(pattern):
+    # gitignore 글롭 하나 → 정규식 ('*' 는 '/' 를 넘지 않고, 앞뒤/중간의 '**' 는 폴더 여러 단계)
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern.startswith('**', i) and (i == 0 or pattern[i - 1] == '/') and (i + 2 == n or pattern[i + 2] == '/'):
+                if i + 2 == n:
+                    # 'a/**' → a 안의 모든 것
+                    out.append('.*')
+                    i += 2
+                else:
+                    # '**/' → 0개 이상의 폴더
+                    out.append('(?:.*/)?')
+                    i += 3
+                continue
+            while i < n and pattern[i] == '*':
+                i += 1
+            out.append('[^/]*')
+            continue
+        if c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            j = i + 1
+            if j < n and pattern[j] in '!^':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            while j < n and pattern[j] != ']':
+                j += 1
+            if j >= n:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:j]
+                negate = body[:1] in ('!', '^')
+                if negate:
+                    body = body[1:]
+                body = body.replace('\\', '\\\\').replace('[', '\\[')
+                out.append(f'[^/{body}]' if negate else f'[{body}]')
+                i = j + 1
+                continue
+        elif c == '\\' and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return ''.join(out)
+
+
+def parse(text):
+    # 규칙 파일 내용 → [(정규식 문자열, 부정(!) 여부, 폴더 전용 여부, 경로 기준 여부)] (파일 안의 순서대로)
+    rules = []
+    for line in text.splitlines():
+        if not line or line.startswith('#'):
+            continue
+        # 끝의 공백은 '\ ' 로 이스케이프하지 않았으면 무시
+        stripped = line.rstrip(' ')
+        if stripped.endswith('\\') and len(stripped) < len(line):
+            stripped += ' '
+        line = stripped
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        elif line.startswith(('\\!', '\\#')):
+            line = line[1:]
+        dir_only = line.endswith('/')
+        if dir_only:
+            line = line[:-1]
+        if not line:
+            continue
+        # 중간이나 앞에 '/' 가 있으면 규칙 파일이 있는 폴더 기준, 없으면 어느 단계의 이름이든
+        anchored = '/' in line
+        regex = translate(line.lstrip('/')) if anchored else translate(line)
+        rules.append((regex + r'\Z', negate, dir_only, anchored))
+    return rules
+
+
+class RuleSet:
+    """규칙 파일 하나를 합친 정규식 몇 개로 바꿔 둔 것 (규칙마다 따로 맞춰 보지 않음)"""
+
+    def __init__(self, rules):
+        self._file = self._combine([(i, rule) for i, rule in enumerate(rules) if not rule[2]])
+        self._dir = self._combine(list(enumerate(rules)))
+
+    @staticmethod
+    def _combine(rules):
+        # 이름 규칙('/' 없음)과 경로 규칙을 따로 합침. 이름 규칙은 '/' 를 넘지 않으므로
+        # 마지막 '/' 뒤의 이름에만 맞춰 봄 (갈래마다 경로 전체를 훑지 않음)
+        # 뒤의 규칙이 이기므로 역순으로 이어 붙여서 처음 맞는 갈래가 마지막 규칙이 되게 하고,
+        # 어느 규칙이 맞았는지는 갈래마다 하나뿐인 그룹 번호(lastindex)로 앎
+        combined = []
+        for anchored in (False, True):
+            group = [(i, rule) for i, rule in reversed(rules) if rule[3] == anchored]
+            if group:
+                regex = re.compile('(?:' + '|'.join(f'({rule[0]})' for _, rule in group) + ')', re.S)
+                combined.append((regex, tuple((i, rule[1]) for i, rule in group), anchored))
+        return combined
+
+    def match(self, rel_path, is_dir=False):
+        # 무시면 True, 다시 포함(!)이면 False, 맞는 규칙이 없으면 None (이름/경로 규칙 중 파일에서 뒤에 있는 규칙이 이김)
+        best = -1
+        result = None
+        name = rel_path[rel_path.rfind('/') + 1:]
+        for regex, rules, anchored in self._dir if is_dir else self._file:
+            m = regex.match(rel_path if anchored else name)
+            if m is not None:
+                index, negate = rules[m.lastindex - 1]
+                if index > best:
+                    best, result = index, not negate
+        return result
+
+
+@lru_cache(maxsize=1024)
+def compile_rules(text):
+    # 규칙 파일 내용 → RuleSet (규칙이 없으면 None). 다시 스캔해도 내용이 같으면 컴파일하지 않음
+    rules = parse(text)
+    return RuleSet(rules) if rules else None
+
+
+def join_rel_path(rel_dir, name):
+    return f'{rel_dir}/{name}' if rel_dir else name
+
+
+def read_rules(path):
+    # 규칙 파일 하나 읽기 (없으면 None), 파일 상태(수정 시각, 크기)도 함께 반환
+    try:
+        with open(path, encoding='utf-8', errors='surrogateescape') as f:
+            st = os.fstat(f.fileno())
+            return compile_rules(f.read()), (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None, None
+
+
+def global_excludes_path(git_dir):
+    # core.excludesFile 경로 (저장소 설정 > ~/.gitconfig > $XDG_CONFIG_HOME/git/config 순으로 우선)
+    # 설정이 없으면 git 기본값 $XDG_CONFIG_HOME/git/ignore
+    home = os.path.expanduser('~')
+    config_home = os.environ.get('XDG_CONFIG_HOME') or os.path.join(home, '.config')
+    value = None
+    for config in (os.path.join(config_home, 'git', 'config'), os.path.join(home, '.gitconfig'),
+                   os.path.join(git_dir, 'config')):
+        value = _read_excludes_setting(config) or value
+    return os.path.expanduser(value) if value else os.path.join(config_home, 'git', 'ignore')
+
+
+def _read_excludes_setting(config_path):
+    # 설정 파일에서 [core] excludesFile 값만 찾음 (없으면 None)
+    value = None
+    section = None
+    try:
+        with open(config_path, encoding='utf-8', errors='surrogateescape') as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith('['):
+                    section = line[1:line.find(']')].strip().lower()
+                    continue
+                if section != 'core':
+                    continue
+                key, sep, rest = line.partition('=')
+                if sep and key.strip().lower() == 'excludesfile':
+                    value = rest.strip().strip('"')
+    except OSError:
+        pass
+    return value
+
+
+class IgnoreRules:
+    """작업 폴더의 .gitignore / info/exclude / core.excludesFile 규칙 (폴더별 규칙은 처음 쓸 때 읽어서 컴파일)"""
+
+    def __init__(self, root):
+        self.root = root
+        # 폴더 상대경로 → (RuleSet, 규칙 파일 상태). 규칙 파일이 없거나 비었으면 RuleSet 은 None
+        self._dirs = {}
+        # 폴더 상대경로 → 그 폴더 안의 항목에 적용되는 ((경로를 자를 위치, RuleSet), ...) (가까운 폴더부터)
+        self._chains = {}
+        # 폴더 상대경로 → 상위 폴더까지 포함한 무시 여부
+        self._ignored_dirs = {}
+        # 저장소 전체 규칙 파일 (우선순위 순서: info/exclude, core.excludesFile)
+        git_dir = os.path.join(root, '.git')
+        self.exclude_paths = [os.path.join(git_dir, 'info', 'exclude'), global_excludes_path(git_dir)]
+        self._exclude = [rules for rules in (read_rules(path)[0] for path in self.exclude_paths) if rules is not None]
+
+    def load_dir(self, rel_dir, present=True):
+        # 폴더의 .gitignore 규칙 (스캐너가 폴더를 읽으면서 파일이 없다는 걸 알면 present=False 로 읽기를 생략)
+        entry = self._dirs.get(rel_dir)
+        if entry is None:
+            if present:
+                entry = read_rules(os.path.join(self.root, rel_dir, '.gitignore'))
+            else:
+                entry = (None, None)
+            self._dirs[rel_dir] = entry
+        return entry[0]
+
+    def is_stale(self, rel_dir):
+        # 읽어 둔 뒤에 그 폴더의 .gitignore 가 생기거나 바뀌거나 지워졌으면 True
+        entry = self._dirs.get(rel_dir)
+        if entry is None:
+            return False
+        try:
+            st = os.stat(os.path.join(self.root, rel_dir, '.gitignore'))
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        return stamp != entry[1]
+
+    def rule_files(self):
+        # 읽어 둔 .gitignore 파일들의 상대경로 (내용이 바뀌는지 감시할 대상)
+        return [join_rel_path(rel_dir, '.gitignore') for rel_dir, (_, stamp) in list(self._dirs.items())
+                if stamp is not None]
+
+    def _chain(self, rel_dir):
+        chain = self._chains.get(rel_dir)
+        if chain is None:
+            rules = self.load_dir(rel_dir)
+            chain = self._chain(rel_dir.rpartition('/')[0]) if rel_dir else ()
+            if rules is not None:
+                chain = ((len(rel_dir) + 1 if rel_dir else 0, rules),) + chain
+            self._chains[rel_dir] = chain
+        return chain
+
+    def matches(self, rel_path, is_dir=False):
+        # 경로 자체가 규칙에 걸리는지 (상위 폴더는 이미 무시되지 않은 것으로 봄: 스캐너가 무시된 폴더를 들어가지 않음)
+        # git 우선순위: 가까운 폴더의 .gitignore 부터, 다음 info/exclude, core.excludesFile. 한 파일 안에서는 뒤의 규칙이 이김
+        for offset, rules in self._chain(rel_path.rpartition('/')[0]):
+            result = rules.match(rel_path[offset:], is_dir)
+            if result is not None:
+                return result
+        for rules in self._exclude:
+            result = rules.match(rel_path, is_dir)
+            if result is not None:
+                return result
+        return False
+
+    def _dir_ignored(self, rel_dir):
+        if not rel_dir:
+            return False
+        ignored = self._ignored_dirs.get(rel_dir)
+        if ignored is None:
+            ignored = self._dir_ignored(rel_dir.rpartition('/')[0]) or self.matches(rel_dir, True)
+            self._ignored_dirs[rel_dir] = ignored
+        return ignored
+
+    def is_ignored(self, rel_path, is_dir=False):
+        # 상위 폴더까지 확인 (무시된 폴더 안의 항목은 ! 규칙이 있어도 무시됨). 폴더별 결과는 기억해 둠
+        return self._dir_ignored(rel_path.rpartition('/')[0]) or self.matches(rel_path, is_dir)
+
+    def filter_paths(self, paths):
+        # 경로 목록에서 무시되지 않는 것만 (git 처럼 '/' 로 끝나는 경로는 폴더)
+        is_ignored = self.is_ignored
+        return [path for path in paths
+                if not (is_ignored(path[:-1], True) if path.endswith('/') else is_ignored(path, False))]
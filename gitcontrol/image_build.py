@@ -0,0 +1,188 @@
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import index_cache
+from assets import HashCache, SNIFF_SIZE, sniff
+
+try:
+    # 이미지 변환에는 Pillow 가 필요 (없으면 build() 가 안내 메시지와 함께 실패)
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# images/ 원본 → 크기별(반응형) WebP/JPEG 파일 생성 (Qt 비의존)
+# 결과는 원본 내용 해시 + 변환 설정으로 정한 캐시 폴더에 저장되어, 새로 생기거나 바뀐 원본만 변환함
+# 사이트에는 images/derived/ 아래 내용 기반 파일 이름으로 두고, manifest.json 에 원본별 목록을 기록
+
+SOURCE_DIR = 'images'
+OUTPUT_DIR = 'images/derived'
+MANIFEST_NAME = 'manifest.json'
+WIDTHS = (480, 960, 1280)
+FORMATS = ('webp', 'jpeg')
+QUALITY = 80
+EXTENSIONS = {'webp': 'webp', 'jpeg': 'jpg', 'png': 'png'}
+
+
+def derivative_cache_dir():
+    return os.path.join(index_cache.cache_dir(), 'derivatives')
+
+
+def settings_key(widths, formats, quality):
+    # 변환 설정이 바뀌면 다른 캐시 항목을 쓰도록
+    text = json.dumps([sorted(widths), list(formats), quality])
+    return hashlib.sha1(text.encode('ascii')).hexdigest()[:12]
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def render(source_path, target_dir, widths, formats, quality):
+    # (작업 프로세스에서 실행) 원본 하나 → target_dir 에 '너비.확장자' 파일들. [(파일 이름, 너비, 형식)] 반환
+    with Image.open(source_path) as img:
+        img.load()
+        has_alpha = img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info
+        base = img.convert('RGBA' if has_alpha else 'RGB')
+    tmp_dir = f'{target_dir}.{os.getpid()}.tmp'
+    os.makedirs(tmp_dir, exist_ok=True)
+    outputs = []
+    # 원본보다 큰 크기는 만들지 않음 (원본 너비로 대신)
+    for width in sorted({min(width, base.width) for width in widths}):
+        height = max(1, round(base.height * width / base.width))
+        resized = base if width == base.width else base.resize((width, height), Image.LANCZOS)
+        for fmt in formats:
+            # 투명도가 있는 원본은 JPEG 대신 PNG
+            fmt = 'png' if fmt == 'jpeg' and has_alpha else fmt
+            name = f'{width}.{EXTENSIONS[fmt]}'
+            path = os.path.join(tmp_dir, name)
+            if fmt == 'webp':
+                resized.save(path, 'WEBP', quality=quality, method=4)
+            elif fmt == 'jpeg':
+                resized.save(path, 'JPEG', quality=quality, optimize=True, progressive=True)
+            else:
+                resized.save(path, 'PNG', optimize=True)
+            outputs.append((name, width, fmt))
+    with open(os.path.join(tmp_dir, 'outputs.json'), 'w', encoding='utf-8') as f:
+        json.dump(outputs, f)
+    try:
+        os.replace(tmp_dir, target_dir)
+    except OSError:
+        # 다른 프로세스가 먼저 만들었음
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return outputs
+
+
+def read_outputs(target_dir):
+    try:
+        with open(os.path.join(target_dir, 'outputs.json'), encoding='utf-8') as f:
+            return [tuple(output) for output in json.load(f)]
+    except (OSError, ValueError):
+        return None
+
+
+def list_sources(source_dir):
+    # images/ 바로 아래의 이미지 파일 (확장자가 없으므로 내용으로 판별). [(이름, stat)]
+    sources = []
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            with open(entry.path, 'rb') as f:
+                mime = sniff(f.read(SNIFF_SIZE))
+            if mime is not None and mime.startswith('image/'):
+                sources.append((entry.name, entry.stat()))
+    return sorted(sources)
+
+
+def link_or_copy(source, target):
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def build(site_root, widths=WIDTHS, formats=FORMATS, quality=QUALITY, workers=None,
+          progress=None, cancelled=None):
+    # images/ 의 원본들을 변환해서 images/derived/ 에 반영. {'processed', 'reused', 'removed'} 반환
+    # progress(단계, 현재, 전체, 메시지), cancelled() 가 True 면 남은 변환을 취소
+    if Image is None:
+        raise RuntimeError('이미지 변환에는 Pillow 가 필요합니다. (pip install Pillow)')
+    site_root = os.path.abspath(site_root)
+    source_dir = os.path.join(site_root, SOURCE_DIR)
+    output_dir = os.path.join(site_root, OUTPUT_DIR)
+    cache_root = derivative_cache_dir()
+    site_key = hashlib.sha1(os.path.normcase(site_root).encode('utf-8', 'surrogateescape')).hexdigest()
+    # 원본 해시 캐시: 크기/수정 시각이 같은 원본은 다시 읽지 않음
+    hashes = HashCache(os.path.join(cache_root, 'sources', f'{site_key}.json'))
+    key = settings_key(widths, formats, quality)
+
+    # 1) 원본별 캐시 위치를 정하고, 캐시에 없는 것만 변환 대상으로
+    sources = []
+    jobs = {}
+    for name, st in list_sources(source_dir):
+        path = os.path.join(source_dir, name)
+        sha = hashes.get(name, st)
+        if sha is None:
+            sha = file_sha256(path)
+            hashes.put(name, st, sha)
+        target_dir = os.path.join(cache_root, 'objects', sha[:2], f'{sha}-{key}')
+        sources.append((name, sha, target_dir))
+        # 내용이 같은 원본은 한 번만 변환
+        if target_dir not in jobs and read_outputs(target_dir) is None:
+            jobs[target_dir] = path
+    hashes.save()
+
+    # 2) 변환은 CPU 코어 수만큼 프로세스로 나눠서 병렬 실행
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(render, path, target_dir, widths, formats, quality)
+                       for target_dir, path in jobs.items()]
+            for done, future in enumerate(as_completed(futures), 1):
+                future.result()
+                if progress is not None:
+                    progress('이미지 변환 중', done, len(jobs), '')
+                if cancelled is not None and cancelled():
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+    # 3) 사이트 폴더에 내용 기반 이름으로 반영하고, 더 이상 쓰지 않는 파일은 삭제
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = {}
+    wanted = {MANIFEST_NAME}
+    for name, sha, target_dir in sources:
+        outputs = read_outputs(target_dir)
+        if outputs is None:
+            continue
+        entries = []
+        for file_name, width, fmt in outputs:
+            site_name = f'{sha[:16]}-{file_name}'
+            site_path = os.path.join(output_dir, site_name)
+            if not os.path.exists(site_path):
+                link_or_copy(os.path.join(target_dir, file_name), site_path)
+            wanted.add(site_name)
+            entries.append({'file': f'{OUTPUT_DIR}/{site_name}', 'width': width, 'format': fmt})
+        manifest[name] = entries
+    removed = 0
+    for entry in os.scandir(output_dir):
+        if entry.name not in wanted and entry.is_file(follow_symlinks=False):
+            os.remove(entry.path)
+            removed += 1
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    text = json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True)
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            unchanged = f.read() == text
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+    return {'processed': len(jobs), 'reused': len(sources) - len(jobs), 'removed': removed}
@@ -0,0 +1,76 @@
+import hashlib
+import mmap
+import os
+import struct
+
+from path_tree import PathTree
+
+# 저장소 파일 목록 디스크 캐시 (Qt 비의존)
+# 파일 구조: 헤더 | 구역 표(오프셋, 길이) | 구역들(PathTree 배열 바이트열 그대로)
+# 저장소 경로 + .git/index 의 mtime/size 가 같을 때만 유효
+
+# 02: Git 트리 경로를 ls-files -z 그대로 저장 (01 은 비 ASCII 경로가 따옴표/8진수 이스케이프된 채로 저장됨)
+MAGIC = b'VGCIDX02'
+HEADER = struct.Struct('<8sqqI')
+SECTION = struct.Struct('<QQ')
+
+
+def cache_dir():
+    # 사용자별 캐시 폴더 (Windows: %LOCALAPPDATA%, 그 외: $XDG_CACHE_HOME 또는 ~/.cache)
+    base = os.environ.get('LOCALAPPDATA') if os.name == 'nt' else os.environ.get('XDG_CACHE_HOME')
+    return os.path.join(base or os.path.join(os.path.expanduser('~'), '.cache'), 'gitcontrol')
+
+
+def cache_path(repo_path):
+    key = os.path.normcase(os.path.abspath(repo_path)).encode('utf-8', 'surrogateescape')
+    return os.path.join(cache_dir(), hashlib.sha1(key).hexdigest() + '.idx')
+
+
+def index_signature(repo_path):
+    # .git/index 의 (mtime_ns, size). 저장소가 아니면 None
+    try:
+        st = os.stat(os.path.join(repo_path, '.git', 'index'))
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def save_trees(repo_path, signature, local_tree, git_tree):
+    # 임시 파일에 쓴 뒤 바꿔치기 (읽는 쪽이 반쯤 쓴 파일을 보지 않도록)
+    if signature is None:
+        return
+    sections = local_tree.to_sections() + git_tree.to_sections()
+    offset = HEADER.size + SECTION.size * len(sections)
+    table = []
+    for data in sections:
+        table.append(SECTION.pack(offset, len(data)))
+        offset += len(data)
+    path = cache_path(repo_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, signature[0], signature[1], len(sections)))
+        f.writelines(table)
+        f.writelines(sections)
+    os.replace(tmp_path, path)
+
+
+def load_trees(repo_path):
+    # 캐시가 유효하면 (로컬 PathTree, Git PathTree), 아니면 None
+    signature = index_signature(repo_path)
+    if signature is None:
+        return None
+    try:
+        with open(cache_path(repo_path), 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, mtime_ns, size, count = HEADER.unpack_from(mm, 0)
+                if magic != MAGIC or (mtime_ns, size) != signature:
+                    return None
+                sections = []
+                for i in range(count):
+                    start, length = SECTION.unpack_from(mm, HEADER.size + SECTION.size * i)
+                    sections.append(mm[start:start + length])
+    except (OSError, ValueError, struct.error):
+        return None
+    half = len(sections) // 2
+    return PathTree.from_sections(sections[:half]), PathTree.from_sections(sections[half:])
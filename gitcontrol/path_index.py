@@ -0,0 +1,179 @@
+import re
+from array import array
+from bisect import bisect_left, insort
+from itertools import compress
+
+# 파일 검색용 경로 색인 (Qt 비의존)
+# 정렬된 경로 배열을 BLOCK 개씩 묶고, 블록마다 들어 있는 3글자 조각(3-gram)과 글자를 기록해 둠
+# 검색어의 조각이 모두 들어 있는 블록만 경로별로 확인하므로, 드문 검색어는 몇 블록만 보면 됨
+
+BLOCK = 128
+GLOB_CHARS = '*?['
+
+
+def glob_to_regex(pattern):
+    # gitignore 와 비슷한 글롭: '*' 는 '/' 를 넘지 않고 '**' 는 넘음
+    # '/' 로 시작하면 저장소 최상위 기준, 아니면 어느 폴더 아래든 맞으면 됨
+    anchored = pattern.startswith('/')
+    pattern = pattern.lstrip('/')
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern.startswith('**/', i):
+                out.append('(?:.*/)?')
+                i += 3
+                continue
+            if pattern.startswith('**', i):
+                out.append('.*')
+                i += 2
+                continue
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[' and pattern.find(']', i + 2) > 0:
+            j = pattern.find(']', i + 2)
+            body = pattern[i + 1:j].replace('\\', '\\\\')
+            if body.startswith('!'):
+                body = '^' + body[1:]
+            out.append(f'[{body}]')
+            i = j + 1
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return re.compile(('' if anchored else '(?:.*/)?') + ''.join(out) + r'\Z', re.S)
+
+
+def fuzzy_to_regex(query):
+    # 검색어 글자가 순서대로 나오면 일치 ('gg.py' → git_gui.py). match 로 앞에서부터 씀
+    # [^c]*c 는 다음 글자 c 의 첫 위치에서만 멈출 수 있어서 되돌아가도 곧바로 실패함 (한 번 훑는 것과 같음)
+    parts = []
+    for c in query:
+        in_class = '\\' + c if c in '\\]^-' else c
+        parts.append(f'[^{in_class}]*{re.escape(c)}')
+    return re.compile(''.join(parts), re.S)
+
+
+def literal_runs(query, glob):
+    # 글롭 문자를 뺀 나머지 글자 덩어리들 (색인에서 후보 블록을 고를 때 씀)
+    if not glob:
+        return [query]
+    return [run for run in re.split(r'\*+|\?|\[[^\]]*\]', query.lstrip('/')) if run]
+
+
+class PathIndex:
+    """정렬된 경로 배열 + 블록별 3-gram/글자 목록으로 만든 경로 검색 색인"""
+
+    def __init__(self, paths=()):
+        self.paths = sorted(paths)
+        # 대소문자 구분 없이 찾도록 소문자로 한 벌 더 보관
+        self._lower = [path.lower() for path in self.paths]
+        # 색인 뒤에 지워진 경로는 표시만 하고, 새 경로는 따로 정렬해 둠 (다음 전체 스캔 때 새로 만듦)
+        self._removed = bytearray(len(self.paths))
+        self._added = []
+        # 3-gram(글자 3개 튜플) / 글자 → 그것이 들어 있는 블록 번호 배열 (오름차순)
+        self._grams = {}
+        self._chars = {}
+        self._build()
+
+    def __len__(self):
+        return len(self.paths) - self._removed.count(1) + len(self._added)
+
+    def _build(self):
+        lower = self._lower
+        grams, chars = self._grams, self._chars
+        for block in range((len(lower) + BLOCK - 1) // BLOCK):
+            # 블록 안 경로들의 이름 조각을 중복 없이 이어서 조각 집합을 한 번에 구함 (경로마다 반복하지 않음)
+            # 같은 폴더 이름이 여러 번 나와도 한 번만 훑음. '/' 를 걸친 조각은 검색할 때 쓰지 않음
+            text = '/'.join(set('/'.join(lower[block * BLOCK:(block + 1) * BLOCK]).split('/')))
+            for gram in set(zip(text, text[1:], text[2:])):
+                postings = grams.get(gram)
+                if postings is None:
+                    grams[gram] = postings = array('i')
+                postings.append(block)
+            for char in set(text):
+                postings = chars.get(char)
+                if postings is None:
+                    chars[char] = postings = array('i')
+                postings.append(block)
+
+    def _candidate_blocks(self, runs):
+        # 검색어 조각이 모두 들어 있는 블록 번호 (3글자 이상이면 3-gram, 아니면 글자로 고름)
+        keys, table = set(), self._grams
+        for run in runs:
+            keys.update(gram for gram in zip(run, run[1:], run[2:]) if '/' not in gram)
+        if not keys:
+            keys, table = set(''.join(runs)) - {'/'}, self._chars
+        block_count = (len(self._lower) + BLOCK - 1) // BLOCK
+        if not keys:
+            return range(block_count)
+        postings = []
+        for key in keys:
+            found = table.get(key)
+            if found is None:
+                return ()
+            postings.append(found)
+        postings.sort(key=len)
+        blocks = set(postings[0])
+        for found in postings[1:]:
+            blocks.intersection_update(found)
+            if not blocks:
+                return ()
+        return sorted(blocks)
+
+    def search_blocks(self, query, fuzzy=False):
+        # 검색어에 맞는 경로를 정렬 순서대로, 후보 블록 하나마다 목록 하나씩 돌려줌 (빈 목록일 수 있음)
+        # 필요한 만큼만 꺼내 쓰면 나머지 블록은 확인하지 않음
+        query = query.strip().lower()
+        if not query:
+            return
+        glob = not fuzzy and any(c in query for c in GLOB_CHARS)
+        if fuzzy:
+            matcher, runs = fuzzy_to_regex(query).match, [c for c in query]
+        elif glob:
+            matcher, runs = glob_to_regex(query).match, literal_runs(query, True)
+        else:
+            matcher, runs = re.compile(re.escape(query)).search, [query]
+        paths, lower, removed = self.paths, self._lower, self._removed
+        for block in self._candidate_blocks(runs):
+            start = block * BLOCK
+            end = min(start + BLOCK, len(lower))
+            yield [paths[i] for i in compress(range(start, end), map(matcher, lower[start:end])) if not removed[i]]
+        if self._added:
+            yield [path for path in self._added if matcher(path.lower())]
+
+    def search(self, query, fuzzy=False, limit=None):
+        result = []
+        for found in self.search_blocks(query, fuzzy):
+            result.extend(found)
+            if limit is not None and len(result) >= limit:
+                return result[:limit]
+        return result
+
+    # ---- 증분 갱신 (작업 폴더 감시 / Git 작업 후) ----
+    def _prefix_range(self, sorted_paths, path):
+        # path 자신과 'path/...' 하위 경로들의 범위 ('0' 은 '/' 바로 다음 글자)
+        lo = bisect_left(sorted_paths, path)
+        hi = bisect_left(sorted_paths, path + '0', lo)
+        return lo, hi
+
+    def update(self, added=(), removed=()):
+        # 지운 경로(폴더면 하위 전체)는 표시만 하고, 새 경로는 따로 모아 둠
+        paths = self.paths
+        for path in removed:
+            lo, hi = self._prefix_range(paths, path)
+            for i in range(lo, hi):
+                if paths[i] == path or paths[i].startswith(path + '/'):
+                    self._removed[i] = 1
+            lo, hi = self._prefix_range(self._added, path)
+            self._added[lo:hi] = [p for p in self._added[lo:hi] if p != path and not p.startswith(path + '/')]
+        for path in added:
+            i = bisect_left(paths, path)
+            if i < len(paths) and paths[i] == path:
+                self._removed[i] = 0
+                continue
+            i = bisect_left(self._added, path)
+            if i == len(self._added) or self._added[i] != path:
+                insort(self._added, path)
@@ -0,0 +1,367 @@
+from array import array
+
+# 노드 플래그 (flags 바이트 배열의 비트)
+FLAG_DIR = 0x01       # 폴더 노드
+FLAG_UNLOADED = 0x02  # 지연 로딩: 아직 하위 항목을 읽지 않은 폴더
+FLAG_REMOVED = 0x04   # 삭제된 노드 (번호는 재사용하지 않음)
+
+ROOT = 0
+
+
+class PathTree:
+    """경로 목록을 노드 번호 기반의 압축 배열로 저장하는 트리 (Qt 비의존)"""
+
+    def __init__(self):
+        # 노드마다 파이썬 객체를 만들지 않고 정수 배열 + 체크 비트셋으로 저장
+        # 세그먼트 i 의 이름 = _blob[_seg_offsets[i]:_seg_offsets[i + 1]]
+        self._blob = bytearray()
+        self._seg_offsets = array('I', [0, 0])
+        # 폴더 이름 → 세그먼트 번호 사전 (같은 폴더 이름은 한 번만 저장, finish_build() 후 해제)
+        # 파일 이름은 대부분 서로 달라서 사전에 넣으면 오히려 메모리가 늘어나므로 그대로 저장
+        self._seg_lookup = {'': 0}
+        self._seg = array('i', [0])
+        self._parent = array('i', [-1])
+        self._row = array('i', [0])
+        self._flags = bytearray([FLAG_DIR])
+        self._checked = bytearray(1)
+        # 노드별 상태 바이트 (Git 상태 등 표시용, 폴더는 하위 상태의 OR)
+        self._status = bytearray(1)
+        # 폴더 노드 번호 → 자식 노드 번호 배열
+        self._children = {ROOT: array('i')}
+        # 폴더 상대경로('a/b') → 폴더 노드 번호
+        self._dir_index = {'': ROOT}
+        # 폴더 3상태 체크용: 노드별 하위 노드 수 / 그중 체크된 수 (처음 체크할 때 한 번 계산한 뒤 증분 갱신)
+        self._subtree = None
+        self._checked_below = None
+
+    def __len__(self):
+        return len(self._parent)
+
+    # ---- 직렬화 (디스크 캐시용) ----
+    def to_sections(self):
+        # 배열들을 그대로 바이트열로 (체크/상태는 저장하지 않음). 폴더 자식 목록은 CSR 형태로 평탄화
+        dir_nodes = array('i', self._children.keys())
+        child_counts = array('i', (len(c) for c in self._children.values()))
+        children_flat = array('i')
+        for children in self._children.values():
+            children_flat.extend(children)
+        dir_paths = '\0'.join(self._dir_index.keys()).encode('utf-8', 'surrogateescape')
+        dir_path_nodes = array('i', self._dir_index.values())
+        return [bytes(self._blob), self._seg_offsets.tobytes(), self._seg.tobytes(),
+                self._parent.tobytes(), self._row.tobytes(), bytes(self._flags),
+                dir_nodes.tobytes(), child_counts.tobytes(), children_flat.tobytes(),
+                dir_paths, dir_path_nodes.tobytes()]
+
+    @classmethod
+    def from_sections(cls, sections):
+        # to_sections() 결과(바이트열 또는 mmap 조각)에서 노드별 반복 없이 배열을 그대로 복원
+        tree = cls()
+        (blob, seg_offsets, seg, parent, row, flags,
+         dir_nodes, child_counts, children_flat, dir_paths, dir_path_nodes) = sections
+        tree._blob = bytearray(blob)
+        tree._seg_lookup = None
+        for name, data in (('_seg_offsets', seg_offsets), ('_seg', seg), ('_parent', parent), ('_row', row)):
+            values = array(getattr(tree, name).typecode)
+            values.frombytes(data)
+            setattr(tree, name, values)
+        tree._flags = bytearray(flags)
+        tree._checked = bytearray((len(tree._parent) >> 3) + 1)
+        tree._status = bytearray(len(tree._parent))
+        nodes, counts, flat = array('i'), array('i'), array('i')
+        nodes.frombytes(dir_nodes)
+        counts.frombytes(child_counts)
+        flat.frombytes(children_flat)
+        tree._children = {}
+        start = 0
+        for node, count in zip(nodes, counts):
+            tree._children[node] = flat[start:start + count]
+            start += count
+        path_nodes = array('i')
+        path_nodes.frombytes(dir_path_nodes)
+        paths = bytes(dir_paths).decode('utf-8', 'surrogateescape').split('\0')
+        tree._dir_index = dict(zip(paths, path_nodes))
+        return tree
+
+    # ---- 구성 ----
+    def _intern(self, name, is_dir):
+        lookup = self._seg_lookup if is_dir else None
+        if lookup is not None:
+            seg = lookup.get(name)
+            if seg is not None:
+                return seg
+        seg = len(self._seg_offsets) - 1
+        self._blob += name.encode('utf-8', 'surrogateescape')
+        self._seg_offsets.append(len(self._blob))
+        if lookup is not None:
+            lookup[name] = seg
+        return seg
+
+    def _new_node(self, parent, name, flags):
+        node = len(self._parent)
+        siblings = self._children[parent]
+        self._seg.append(self._intern(name, flags & FLAG_DIR))
+        self._parent.append(parent)
+        self._row.append(len(siblings))
+        self._flags.append(flags)
+        self._status.append(0)
+        if node >> 3 >= len(self._checked):
+            self._checked.append(0)
+        siblings.append(node)
+        if flags & FLAG_DIR:
+            self._children[node] = array('i')
+        if self._subtree is not None:
+            # 체크된 폴더 아래에 생긴 항목은 체크 상태를 물려받음
+            checked = self.is_checked(parent)
+            if checked:
+                self._set_bit(node, True)
+            self._subtree.append(0)
+            self._checked_below.append(0)
+            self._propagate(parent, 1, 1 if checked else 0)
+        return node
+
+    def finish_build(self):
+        # 대량 구성이 끝나면 이름 사전을 버림 (이후 추가되는 이름은 중복 저장)
+        self._seg_lookup = None
+
+    def get_or_create_dir(self, rel_path, loaded=True):
+        # 'a/b/c' 폴더 노드를 경로 인덱스에서 찾고, 없으면 상위부터 생성
+        node = self._dir_index.get(rel_path)
+        if node is not None:
+            return node
+        parent_path, _, name = rel_path.rpartition('/')
+        parent = self.get_or_create_dir(parent_path) if parent_path else ROOT
+        node = self._new_node(parent, name, FLAG_DIR if loaded else FLAG_DIR | FLAG_UNLOADED)
+        self._dir_index[rel_path] = node
+        return node
+
+    def add_file(self, rel_path):
+        # 'a/b/c.txt' 파일 노드 추가 (상위 폴더는 자동 생성)
+        parent_path, _, name = rel_path.rpartition('/')
+        parent = self.get_or_create_dir(parent_path) if parent_path else ROOT
+        return self._new_node(parent, name, 0)
+
+    def add_children(self, parent, dirs, files):
+        # 지연 로딩용: 한 폴더의 하위 폴더(미로딩 상태)와 파일을 한 번에 추가
+        if dirs:
+            base = self.path_of(parent)
+            for name in dirs:
+                self.get_or_create_dir(f'{base}/{name}' if base else name, loaded=False)
+        for name in files:
+            self._new_node(parent, name, 0)
+        self._flags[parent] &= ~FLAG_UNLOADED
+
+    def add_child(self, parent, name, is_dir=False, loaded=True):
+        # 증분 갱신용: 이미 있는 폴더 노드 아래에 항목 하나 추가
+        if not is_dir:
+            return self._new_node(parent, name, 0)
+        base = self.path_of(parent)
+        return self.get_or_create_dir(f'{base}/{name}' if base else name, loaded=loaded)
+
+    def remove(self, node):
+        # 노드(폴더면 하위 전체 포함)를 트리에서 떼어냄. 번호는 재사용하지 않음
+        parent = self._parent[node]
+        siblings = self._children[parent]
+        row = self._row[node]
+        del siblings[row]
+        for i in range(row, len(siblings)):
+            self._row[siblings[i]] = i
+        self._detach(parent, node)
+
+    def remove_nodes(self, nodes):
+        # 여러 노드를 한 번에 떼어냄. 부모마다 형제 배열을 한 번만 다시 만들고 행 번호도 한 번만 고침
+        # (remove() 를 하나씩 부르면 같은 폴더의 항목 k 개를 지울 때 행 번호를 k 번 고침)
+        targets = set(nodes)
+        by_parent = {}
+        for node in targets:
+            if self._flags[node] & FLAG_REMOVED:
+                continue
+            # 상위 폴더도 지워지면 그 폴더와 함께 떼어짐
+            ancestor = self._parent[node]
+            while ancestor > ROOT and ancestor not in targets:
+                ancestor = self._parent[ancestor]
+            if ancestor in targets:
+                continue
+            by_parent.setdefault(self._parent[node], []).append(node)
+        for parent, group in by_parent.items():
+            gone = set(group)
+            siblings = array('i', (n for n in self._children[parent] if n not in gone))
+            self._children[parent] = siblings
+            for i, n in enumerate(siblings):
+                self._row[n] = i
+            for node in group:
+                self._detach(parent, node)
+
+    def _detach(self, parent, node):
+        # 형제 목록에서 뺀 노드의 개수를 상위로 반영하고 하위 전체를 삭제 표시
+        if self._subtree is not None:
+            self._propagate(parent, -(self._subtree[node] + 1),
+                            -(self._checked_below[node] + self.is_checked(node)))
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if self._flags[n] & FLAG_DIR:
+                self._dir_index.pop(self.path_of(n), None)
+                stack.extend(self._children.pop(n, ()))
+            self._flags[n] |= FLAG_REMOVED
+            self._set_bit(n, False)
+
+    # ---- 조회 ----
+    def name(self, node):
+        seg = self._seg[node]
+        return self._blob[self._seg_offsets[seg]:self._seg_offsets[seg + 1]].decode('utf-8', 'surrogateescape')
+
+    def parent(self, node):
+        return self._parent[node]
+
+    def row(self, node):
+        return self._row[node]
+
+    def children(self, node):
+        return self._children.get(node, ())
+
+    def is_dir(self, node):
+        return bool(self._flags[node] & FLAG_DIR)
+
+    def is_loaded(self, node):
+        return not self._flags[node] & FLAG_UNLOADED
+
+    def is_removed(self, node):
+        return bool(self._flags[node] & FLAG_REMOVED)
+
+    def find_child(self, parent, name):
+        # 폴더 안에서 이름으로 자식 노드 찾기 (이름 바이트열을 직접 비교)
+        encoded = name.encode('utf-8', 'surrogateescape')
+        blob, offsets, seg = self._blob, self._seg_offsets, self._seg
+        for node in self._children.get(parent, ()):
+            s = seg[node]
+            if blob[offsets[s]:offsets[s + 1]] == encoded:
+                return node
+        return None
+
+    def find(self, rel_path):
+        # 상대경로로 노드 찾기 (없으면 None)
+        node = self._dir_index.get(rel_path)
+        if node is not None:
+            return node
+        parent_path, _, name = rel_path.rpartition('/')
+        parent = self._dir_index.get(parent_path)
+        return self.find_child(parent, name) if parent is not None else None
+
+    def loaded_dirs(self):
+        # 하위 항목을 이미 읽은 폴더들의 상대경로 (감시 대상)
+        return [path for path, node in self._dir_index.items() if not self._flags[node] & FLAG_UNLOADED]
+
+    def dir_node(self, rel_path):
+        return self._dir_index.get(rel_path)
+
+    def path_of(self, node):
+        parts = []
+        while node > ROOT:
+            parts.append(self.name(node))
+            node = self._parent[node]
+        return '/'.join(reversed(parts))
+
+    # ---- 상태 바이트 ----
+    def status(self, node):
+        return self._status[node]
+
+    def add_status(self, node, flags):
+        # 노드와 모든 상위 폴더에 상태 비트를 더함
+        status = self._status
+        while node >= ROOT:
+            if status[node] & flags == flags:
+                break
+            status[node] |= flags
+            node = self._parent[node]
+
+    # ---- 체크 상태 (비트셋 + 폴더별 체크 수) ----
+    def is_checked(self, node):
+        return bool(self._checked[node >> 3] & (1 << (node & 7)))
+
+    def _set_bit(self, node, checked):
+        # 비트가 바뀌었으면 True
+        byte, bit = node >> 3, 1 << (node & 7)
+        if bool(self._checked[byte] & bit) == checked:
+            return False
+        self._checked[byte] ^= bit
+        return True
+
+    def _ensure_counts(self):
+        # 하위 노드 수 / 체크된 하위 노드 수를 한 번에 계산 (자식 번호는 항상 부모보다 커서 역순 한 번이면 됨)
+        if self._subtree is not None:
+            return
+        size = len(self._parent)
+        subtree = array('i', bytes(4 * size))
+        checked_below = array('i', bytes(4 * size))
+        parent, flags, checked = self._parent, self._flags, self._checked
+        for node in range(size - 1, ROOT, -1):
+            if flags[node] & FLAG_REMOVED:
+                continue
+            p = parent[node]
+            subtree[p] += subtree[node] + 1
+            checked_below[p] += checked_below[node] + ((checked[node >> 3] >> (node & 7)) & 1)
+        self._subtree = subtree
+        self._checked_below = checked_below
+
+    def _propagate(self, node, size_delta, checked_delta):
+        # node 부터 상위 폴더로 올라가며 개수를 고치고, 하위가 모두 체크됐는지에 따라 폴더 체크 비트를 맞춤
+        subtree, checked_below = self._subtree, self._checked_below
+        while node > ROOT:
+            subtree[node] += size_delta
+            checked_below[node] += checked_delta
+            # 비어 있는 폴더는 사용자가 체크한 상태를 그대로 둠
+            if subtree[node] and self._set_bit(node, checked_below[node] == subtree[node]):
+                checked_delta += 1 if self.is_checked(node) else -1
+            elif not size_delta and not checked_delta:
+                return
+            node = self._parent[node]
+        subtree[ROOT] += size_delta
+        checked_below[ROOT] += checked_delta
+
+    def set_checked(self, node, checked):
+        # 노드를 체크/해제. 폴더면 하위 전체를 한 번에 바꾸고, 상위 폴더 상태는 조상 경로만 따라 올라가며 갱신
+        self._ensure_counts()
+        checked = bool(checked)
+        subtree, checked_below = self._subtree, self._checked_below
+        delta = 0
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if self._set_bit(n, checked):
+                delta += 1 if checked else -1
+            checked_below[n] = subtree[n] if checked else 0
+            children = self._children.get(n)
+            if children:
+                stack.extend(children)
+        # 자기 자신의 비트 변화는 부모의 체크 수에만 들어감
+        self._propagate(self._parent[node], 0, delta)
+
+    def check_state(self, node):
+        # 0: 해제, 1: 일부 체크된 폴더, 2: 체크 (Qt.CheckState 값과 같음)
+        if self.is_checked(node):
+            return 2
+        if self._subtree is not None and self._checked_below[node]:
+            return 1
+        return 0
+
+    def checked_count(self):
+        # 체크된 노드 수 (폴더 포함)
+        return self._checked_below[ROOT] if self._subtree is not None else 0
+
+    def checked_nodes(self):
+        # 체크된 항목의 최상위 노드들 (폴더가 통째로 체크됐으면 폴더 하나만). 체크가 있는 폴더만 내려감
+        result = []
+        if self._subtree is None:
+            return result
+        checked_below = self._checked_below
+        stack = list(reversed(self._children[ROOT]))
+        while stack:
+            node = stack.pop()
+            if self.is_checked(node):
+                result.append(node)
+            elif checked_below[node]:
+                stack.extend(reversed(self._children.get(node, ())))
+        return result
+
+    def checked_paths(self):
+        return [self.path_of(node) for node in self.checked_nodes()]
@@ -0,0 +1,196 @@
+import json
+import os
+import time
+
+from git import Repo, GitCommandError, InvalidGitRepositoryError, NoSuchPathError
+
+import tracing
+
+# 쉬는 동안 원격 브랜치 미리 받기 (Qt 비의존)
+# git maintenance 의 prefetch 처럼 refs/prefetch/remotes/<원격>/ 아래로만 받으므로
+# origin/main 같은 원격 추적 브랜치와 작업 폴더는 그대로 둠
+# 다운로드 때는 막 받아 둔 ref 를 원격 추적 브랜치로 옮기고 병합만 하면 되어 네트워크를 기다리지 않음
+# (작업 폴더를 덮어쓰는 동기화는 오래된 내용으로 reset 하지 않도록 항상 원격에서 받음)
+# GUI 가 앞에 있는 동안은 간격을 FOREGROUND_MAX_INTERVAL 로 묶어 다운로드 때 MAX_AGE 안에 받은 ref 가 있게 함
+# 뒤에 있을 때(와 auto_push --prefetch)는 MAX_INTERVAL 까지 늘어나 대개 너무 오래되므로 다운로드는 pull 하지만,
+# 객체는 이미 받아 두었으므로 pull 이 새로 받는 양은 적음
+
+REMOTE = 'origin'
+NAMESPACE = 'refs/prefetch/remotes'
+# 마지막으로 미리 받은 시각 기록 ({원격 이름: time.time()}, .git 아래)
+STAMP_FILE = 'gitcontrol-prefetch.json'
+# 이보다 오래전에 미리 받은 내용은 다운로드 때 쓰지 않고 원격에서 다시 받음 (초)
+MAX_AGE = 3 * 60
+# 미리 받기 간격 (초): 새 커밋이 있으면 가장 짧게, 없거나 실패하면 두 배씩
+MIN_INTERVAL = 60
+MAX_INTERVAL = 30 * 60
+# 앱이 앞에 있을 때의 간격 상한 (미뤄지거나 받는 데 걸리는 시간만큼 MAX_AGE 보다 여유를 둠)
+FOREGROUND_MAX_INTERVAL = MAX_AGE - MIN_INTERVAL
+
+
+def prefix(remote=REMOTE):
+    return f'{NAMESPACE}/{remote}/'
+
+
+def _refs(repo, pattern):
+    # {ref 이름: 커밋 sha}
+    refs = {}
+    for line in repo.git.for_each_ref('--format=%(refname) %(objectname)', pattern).splitlines():
+        name, _, sha = line.rpartition(' ')
+        refs[name] = sha
+    return refs
+
+
+def _has_ref(repo, ref):
+    try:
+        repo.git.rev_parse('--verify', '--quiet', ref)
+        return True
+    except GitCommandError:
+        return False
+
+
+def _stamp_path(repo):
+    return os.path.join(repo.git_dir, STAMP_FILE)
+
+
+def _read_stamps(repo):
+    try:
+        with open(_stamp_path(repo), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def last_prefetch(repo, remote=REMOTE):
+    # 마지막으로 미리 받은 시각 (time.time(), 없으면 None)
+    return _read_stamps(repo).get(remote)
+
+
+def prefetch(repo, runner=None, remote=REMOTE):
+    # 원격 브랜치를 refs/prefetch/remotes/<원격>/ 로 받음. 바뀐 브랜치가 있으면 True
+    # --refmap= : 설정된 fetch refspec 으로 원격 추적 브랜치를 덩달아 갱신하지 않음
+    before = _refs(repo, prefix(remote))
+    args = ['--prune', '--no-tags', '--no-write-fetch-head', '--refmap=', remote, f'+refs/heads/*:{prefix(remote)}*']
+    with tracing.span('prefetch', remote=remote):
+        if runner is not None:
+            runner.run(repo, 'fetch', *args)
+        else:
+            repo.git.fetch(*args)
+    stamps = _read_stamps(repo)
+    stamps[remote] = time.time()
+    path = _stamp_path(repo)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(stamps, f)
+    os.replace(path + '.tmp', path)
+    return _refs(repo, prefix(remote)) != before
+
+
+def upstream(repo):
+    # 현재 브랜치가 따라가는 (원격 이름, 브랜치 이름). 없으면 None
+    if not repo.head.is_valid() or repo.head.is_detached:
+        return None
+    tracking = repo.active_branch.tracking_branch()
+    if tracking is None:
+        return None
+    return tracking.remote_name, tracking.remote_head
+
+
+def remote_ref(repo, remote, branch):
+    # 원격 브랜치의 가장 최근 로컬 사본: 미리 받은 ref 에만 있는 커밋이 있으면 그것, 아니면 원격 추적 브랜치
+    # (미리 받은 뒤에 직접 fetch 했으면 원격 추적 브랜치가 더 최근)
+    tracking = f'refs/remotes/{remote}/{branch}'
+    fetched = prefix(remote) + branch
+    if not _has_ref(repo, fetched):
+        return tracking
+    if not _has_ref(repo, tracking):
+        return fetched
+    return fetched if int(repo.git.rev_list('--count', f'{tracking}..{fetched}')) else tracking
+
+
+def ahead_behind(repo):
+    # 현재 브랜치가 원격 브랜치보다 (앞선 커밋 수, 뒤처진 커밋 수). 로컬 ref 만 보고 네트워크는 쓰지 않음. 모르면 None
+    target = upstream(repo)
+    if target is None:
+        return None
+    try:
+        output = repo.git.rev_list('--left-right', '--count', f'HEAD...{remote_ref(repo, *target)}')
+    except GitCommandError:
+        return None
+    ahead, behind = output.split()
+    return int(ahead), int(behind)
+
+
+def adopt(repo, max_age=MAX_AGE):
+    # 다운로드 직전: 현재 브랜치가 따라가는 브랜치를 max_age 초 안에 미리 받아 두었으면
+    # 원격 추적 브랜치를 그 ref 로 옮기고 (미리 받은 ref, 받은 시각) 반환 (fetch 없이 병합만 하면 됨). 아니면 None
+    target = upstream(repo)
+    if target is None:
+        return None
+    remote, branch = target
+    stamp = last_prefetch(repo, remote)
+    if stamp is None or time.time() - stamp > max_age:
+        return None
+    fetched = prefix(remote) + branch
+    if not _has_ref(repo, fetched):
+        return None
+    if remote_ref(repo, remote, branch) == fetched:
+        repo.git.update_ref('-m', 'gitcontrol: prefetch', f'refs/remotes/{remote}/{branch}', fetched)
+    return fetched, stamp
+
+
+class Prefetcher:
+    """저장소 하나를 쉬는 동안 미리 받는 실행기 (새 커밋이 있으면 간격을 가장 짧게, 없거나 실패하면 두 배씩)"""
+
+    def __init__(self, repo_path, remote=REMOTE, min_interval=MIN_INTERVAL, max_interval=MAX_INTERVAL):
+        self.repo_path = repo_path
+        self.remote = remote
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.next_run = 0.0
+        self.error = None
+        self._repo = None
+
+    def repo(self):
+        # 저장소는 처음 한 번만 열고 주기마다 재사용
+        if self._repo is None:
+            self._repo = Repo(self.repo_path)
+        return self._repo
+
+    def set_max_interval(self, max_interval):
+        # 간격 상한을 바꿈. 이미 더 길게 잡혀 있던 다음 실행은 새 상한 안으로 당김
+        self.max_interval = max_interval
+        if self.interval > max_interval:
+            self.interval = max_interval
+            self.next_run = min(self.next_run, time.monotonic() + max_interval)
+
+    def delay(self):
+        # 다음 미리 받기까지 남은 시간 (초)
+        return max(0.0, self.next_run - time.monotonic())
+
+    def due(self):
+        return self.delay() == 0.0
+
+    def run(self, runner=None):
+        # 미리 받기 한 번. 바뀐 원격 브랜치가 있으면 True (실패하면 self.error 에 기록)
+        changed = False
+        try:
+            changed = prefetch(self.repo(), runner, self.remote)
+            self.error = None
+        except (GitCommandError, InvalidGitRepositoryError, NoSuchPathError, OSError) as e:
+            self.error = str(e)
+        self.interval = self.min_interval if changed else min(self.max_interval, self.interval * 2)
+        self.next_run = time.monotonic() + self.interval
+        return changed
+
+    def ahead_behind(self):
+        try:
+            return ahead_behind(self.repo())
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            return None
+
+    def last_prefetch(self):
+        try:
+            return last_prefetch(self.repo(), self.remote)
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            return None
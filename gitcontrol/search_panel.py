@@ -0,0 +1,160 @@
+import time
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox, QLabel, QListView
+
+# 한 번에 검색하는 시간 (이 시간 안에 찾은 만큼 먼저 보여주고, 나머지는 다음 이벤트 루프에서 이어서 찾음)
+FRAME_BUDGET = 0.008
+MAX_RESULTS = 5000
+
+
+class SearchResultModel(QAbstractListModel):
+    """검색 결과 경로 목록 (뒤에 행을 붙이기만 하므로 이미 보이는 행은 다시 그리지 않음)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths = []
+
+    def clear(self):
+        self.beginResetModel()
+        self._paths = []
+        self.endResetModel()
+
+    def append(self, paths):
+        if not paths:
+            return
+        start = len(self._paths)
+        self.beginInsertRows(QModelIndex(), start, start + len(paths) - 1)
+        self._paths.extend(paths)
+        self.endInsertRows()
+
+    def path(self, index):
+        return self._paths[index.row()]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._paths[index.row()]
+        return None
+
+
+class SearchPanel(QWidget):
+    """파일 트리 위의 검색창 (부분 일치 / 글롭 / 퍼지). 검색어가 있으면 트리 대신 결과 목록을 보여줌"""
+    # 결과를 고르면 (상대경로)
+    path_activated = pyqtSignal(str)
+    # 검색 중이면 True (트리를 숨기고 결과 목록 표시)
+    active_changed = pyqtSignal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._index = None
+        self._results = None
+        self._count = 0
+        self._active = False
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText('파일 검색 (예: main, *.py, src/**/*.js)')
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self._restart)
+        self.search_input.returnPressed.connect(self._activate_first)
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(['일치', '퍼지'])
+        self.mode_combo.setToolTip('일치: 부분 문자열 (*, ?, [ ] 가 있으면 글롭)\n퍼지: 글자가 순서대로 들어 있으면 일치')
+        self.mode_combo.currentIndexChanged.connect(self._restart)
+        self.count_label = QLabel('')
+        self.count_label.setStyleSheet('color: #555; font-size: 11px;')
+        self.result_model = SearchResultModel(self)
+        self.result_view = QListView()
+        self.result_view.setModel(self.result_model)
+        self.result_view.setUniformItemSizes(True)
+        self.result_view.activated.connect(lambda index: self._activate(self.result_model.path(index)))
+        self.result_view.hide()
+        # 남은 검색은 이벤트 루프가 비었을 때 조금씩 이어서 실행
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._pull)
+        row = QHBoxLayout()
+        row.setContentsMargins(0, 0, 0, 0)
+        row.addWidget(self.search_input)
+        row.addWidget(self.mode_combo)
+        row.addWidget(self.count_label)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(row)
+        layout.addWidget(self.result_view)
+
+    def set_index(self, index):
+        # 새 스캔의 색인으로 교체 (검색 중이면 같은 검색어로 다시 찾음)
+        self._index = index
+        if self._active:
+            self._restart()
+
+    def update_paths(self, added=(), removed=()):
+        # 감시/Git 작업으로 바뀐 경로만 색인에 반영
+        if self._index is None:
+            return
+        self._index.update(added, removed)
+        if self._active:
+            self._restart()
+
+    def _set_active(self, active):
+        if active != self._active:
+            self._active = active
+            self.result_view.setVisible(active)
+            self.active_changed.emit(active)
+
+    def _restart(self):
+        self._timer.stop()
+        self.result_model.clear()
+        self._count = 0
+        query = self.search_input.text().strip()
+        self._set_active(bool(query))
+        if not query:
+            self._results = None
+            self.count_label.setText('')
+            return
+        if self._index is None:
+            self._results = None
+            self.count_label.setText('색인 만드는 중...')
+            return
+        self._results = self._index.search_blocks(query, fuzzy=self.mode_combo.currentIndex() == 1)
+        self._pull()
+
+    def _pull(self):
+        # FRAME_BUDGET 동안 찾은 결과를 한 번에 붙이고, 남았으면 다음 이벤트 루프에서 이어서
+        if self._results is None:
+            self._timer.stop()
+            return
+        deadline = time.perf_counter() + FRAME_BUDGET
+        found = []
+        done = True
+        for paths in self._results:
+            found.extend(paths)
+            if self._count + len(found) >= MAX_RESULTS:
+                del found[MAX_RESULTS - self._count:]
+                break
+            if time.perf_counter() > deadline:
+                done = False
+                break
+        self.result_model.append(found)
+        self._count += len(found)
+        if done:
+            self._results = None
+            self._timer.stop()
+            suffix = ' 이상' if self._count >= MAX_RESULTS else ''
+            self.count_label.setText(f'{self._count}개{suffix}')
+        else:
+            self.count_label.setText(f'{self._count}개 찾는 중...')
+            self._timer.start()
+
+    def _activate_first(self):
+        if self.result_model.rowCount():
+            self._activate(self.result_model.path(self.result_model.index(0)))
+
+    def _activate(self, path):
+        # 검색을 닫고 트리에서 해당 항목으로 이동
+        self.search_input.clear()
+        self.path_activated.emit(path)
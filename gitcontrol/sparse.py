@@ -0,0 +1,145 @@
+import os
+
+from git import Repo, GitCommandError, InvalidGitRepositoryError, NoSuchPathError
+
+# 부분 클론(blob 필터) + sparse-checkout(cone) 모드. Qt 비의존
+# 큰 저장소에서 폴더 몇 개만 받을 때: 커밋/트리만 받고, 파일 내용(blob)은 cone 에 든 폴더를 체크아웃할 때
+# git 이 promisor 원격에서 그 폴더 것만 한 번에 받아 옴 (cone 밖의 파일은 받지도 작업 폴더에 쓰지도 않음)
+# 로컬 bare 저장소로 시험할 때는 file:// 주소를 쓰고, 그 저장소에 uploadpack.allowFilter=true 가 있어야 함
+
+BLOB_FILTER = 'blob:none'
+REMOTE = 'origin'
+
+
+def open_repo(path):
+    # Git 저장소면 Repo, 아니면 None
+    try:
+        return Repo(path)
+    except (InvalidGitRepositoryError, NoSuchPathError):
+        return None
+
+
+def is_sparse(repo):
+    # sparse-checkout 설정은 config.worktree 에 들어가기도 하므로 git config 로 확인
+    try:
+        return repo.git.config('--bool', 'core.sparseCheckout') == 'true'
+    except GitCommandError:
+        return False
+
+
+def normalize_cone(folders):
+    # cone 폴더 목록 정리: 중복/다른 폴더 아래 폴더는 빼고 ''(최상위)도 뺌 (최상위 파일은 cone 에 항상 들어감)
+    result = []
+    for folder in sorted({folder.replace('\\', '/').strip('/') for folder in folders}):
+        if folder and not (result and folder.startswith(result[-1] + '/')):
+            result.append(folder)
+    return result
+
+
+def current_cone(repo):
+    # 지금 cone 에 든 폴더 목록 (sparse 모드가 아니면 None)
+    if not is_sparse(repo):
+        return None
+    return [line for line in repo.git(c='core.quotePath=false').sparse_checkout('list').splitlines() if line]
+
+
+def enable_partial(repo, remote=REMOTE):
+    # 원격을 promisor 로 지정: 이후 fetch 는 blob 을 받지 않고, 없는 blob 은 체크아웃할 때 그때그때 받음
+    repo.git.config(f'remote.{remote}.promisor', 'true')
+    repo.git.config(f'remote.{remote}.partialclonefilter', BLOB_FILTER)
+
+
+def set_cone(repo, folders):
+    # cone 을 folders 로 맞춤 (처음이면 sparse-checkout 을 켬). 바뀌었으면 True
+    # 새로 들어온 폴더의 blob 은 이때 받아 오고, 빠진 폴더의 (수정하지 않은) 파일은 작업 폴더에서 지워짐
+    folders = normalize_cone(folders)
+    if current_cone(repo) == folders:
+        return False
+    repo.git.sparse_checkout('set', '--cone', '--', *folders)
+    return True
+
+
+def add_to_cone(repo, folders):
+    # 지금 cone 에 폴더를 더함 (sparse 모드가 아니면 모든 파일이 이미 있으므로 그대로)
+    cone = current_cone(repo)
+    if cone is None:
+        return False
+    return set_cone(repo, cone + list(folders))
+
+
+def partial_clone(url, path, runner, remote=REMOTE):
+    # 빈 폴더에 부분 클론: 커밋/트리만 받고 체크아웃은 하지 않음 (download 가 cone 을 정한 뒤 체크아웃)
+    if os.path.isdir(path) and os.listdir(path):
+        raise ValueError(f'부분 클론은 빈 폴더에만 할 수 있습니다: {path}')
+    repo = Repo.init(path)
+    repo.git.remote('add', remote, url)
+    enable_partial(repo, remote)
+    # 체크아웃 전에 켜 두어야 cone 밖의 파일을 한 번도 쓰지 않음 (처음 cone 은 최상위 파일만)
+    repo.git.sparse_checkout('init', '--cone')
+    runner.run(repo, 'fetch', f'--filter={BLOB_FILTER}', remote)
+    return repo
+
+
+def default_branch(repo, remote=REMOTE):
+    # 원격의 기본 브랜치 이름 (알 수 없으면 main)
+    try:
+        repo.git.remote('set-head', remote, '--auto')
+        return repo.git.symbolic_ref(f'refs/remotes/{remote}/HEAD').rpartition('/')[2]
+    except GitCommandError:
+        return 'main'
+
+
+def download(repo, runner, folders=None, remote=REMOTE):
+    # 부분 클론 모드로 받음: 이후 fetch 는 blob 없이, folders 가 있으면 cone 을 그 폴더들로 맞춤
+    # (folders 가 없으면 지금 cone 그대로. 전체를 받아 둔 저장소도 폴더를 고르기 전에는 지우지 않음)
+    enable_partial(repo, remote)
+    if folders:
+        set_cone(repo, folders)
+    if not repo.head.is_valid():
+        # 부분 클론 직후: 기본 브랜치를 체크아웃하면서 cone 안의 blob 만 받음
+        branch = default_branch(repo, remote)
+        runner.check()
+        repo.git.checkout('-b', branch, '--track', f'{remote}/{branch}')
+    else:
+        runner.run(repo, 'pull', remote)
+    cone = current_cone(repo)
+    if cone is None:
+        return 'GIT → 내컴퓨터 다운로드 완료! (전체 체크아웃, 이후 받기는 blob 없이)'
+    return f'GIT → 내컴퓨터 부분 다운로드 완료! (폴더 {len(cone)}개: {", ".join(cone) or "최상위 파일만"})'
+
+
+def _target(repo, remote):
+    # 현재 브랜치가 따라가는 원격 브랜치 (없으면 원격 기본 브랜치)
+    branch = repo.active_branch.tracking_branch() if repo.head.is_valid() and not repo.head.is_detached else None
+    return branch.name if branch is not None else f'{remote}/{default_branch(repo, remote)}'
+
+
+def dirty_paths(repo, paths):
+    # paths 아래에서 커밋하지 않은 변경(스테이징 포함)이 있는 tracked 파일 = checkout 으로 덮어쓰면 사라지는 파일
+    # 추적 안 된 파일은 checkout 이 건드리지 않으므로 보지 않음
+    output = repo.git(c='core.quotePath=false').status('--porcelain', '-z', '--untracked-files=no', '--no-renames',
+                                                       '--', *paths)
+    return [record[3:] for record in output.split('\0') if record]
+
+
+def download_folders(repo, runner, paths, overwrite=False, remote=REMOTE):
+    # 폴더/파일을 원격 최신 내용으로 받음 (git checkout origin/<브랜치> -- 경로)
+    # sparse 모드면 cone 에 더해서 그 폴더의 blob 만 받음
+    # checkout 은 로컬 변경을 묻지 않고 덮어쓰므로, overwrite 가 아니면 변경이 있는 파일이 있을 때 받지 않음
+    if not overwrite:
+        dirty = dirty_paths(repo, paths)
+        if dirty:
+            preview = ', '.join(dirty[:5]) + (f' 외 {len(dirty) - 5}개' if len(dirty) > 5 else '')
+            return f'폴더 다운로드 취소: 커밋하지 않은 변경이 있는 파일 {len(dirty)}개를 덮어쓰게 됩니다 ({preview})'
+    runner.run(repo, 'fetch', remote)
+    runner.check()
+    target = _target(repo, remote)
+    # 아직 받지 않은 폴더는 작업 폴더에 없으므로 폴더인지는 원격 트리에서 확인
+    folders = []
+    for line in repo.git.ls_tree('-z', target, '--', *paths).split('\0'):
+        if line:
+            info, _, path = line.partition('\t')
+            folders.append(path if info.split()[1] == 'tree' else path.rpartition('/')[0])
+    add_to_cone(repo, folders)
+    repo.git.checkout(target, '--', *paths)
+    return f'폴더 다운로드 완료! ({len(paths)}개, {target})'
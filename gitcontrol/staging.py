@@ -0,0 +1,50 @@
+import os
+import tempfile
+
+import sparse
+import tracing
+from git_status import stream_status, STAGED, MODIFIED, UNTRACKED, CONFLICT
+
+# 변경된 경로만 스테이징 (git add . 대신). Qt 비의존
+
+# git add 한 번에 넘기는 경로 수
+BATCH_SIZE = 20000
+
+
+def collect_changes(repo):
+    # porcelain status 한 번으로 스테이징할 경로 목록을 구함 (무시된 파일 제외)
+    # 추적 안 된 폴더는 'dir/' 하나로 받아서 폴더째 추가
+    paths = []
+    staged = False
+    for path, flags, _orig_path in stream_status(repo, untracked='normal', ignored='no'):
+        if flags & (MODIFIED | UNTRACKED | CONFLICT):
+            paths.append(path)
+        elif flags & STAGED:
+            staged = True
+    return paths, staged
+
+
+def stage_paths(repo, paths, batch_size=BATCH_SIZE):
+    # 경로 목록을 NUL 구분 파일로 넘겨 git add --pathspec-from-file 로 묶어서 스테이징
+    # 파일명에 *, ? 가 있어도 패턴으로 해석되지 않도록 --literal-pathspecs 사용
+    # sparse-checkout 저장소면 cone 밖에 새로 만든 파일도 추가되도록 --sparse (없으면 git add 가 실패함)
+    options = ['--sparse'] if sparse.is_sparse(repo) else []
+    for start in range(0, len(paths), batch_size):
+        batch = paths[start:start + batch_size]
+        fd, list_path = tempfile.mkstemp(prefix='gitcontrol-add-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(b'\0'.join(p.encode('utf-8', 'surrogateescape') for p in batch))
+            repo.git(literal_pathspecs=True).add(*options, f'--pathspec-from-file={list_path}', '--pathspec-file-nul')
+        finally:
+            os.remove(list_path)
+
+
+def stage_changes(repo):
+    # 바뀐 파일만 스테이징. 커밋할 내용이 있으면 True
+    with tracing.span('status'):
+        paths, staged = collect_changes(repo)
+    tracing.count('staged paths', len(paths))
+    if paths:
+        stage_paths(repo, paths)
+    return bool(paths) or staged
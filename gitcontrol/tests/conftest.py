@@ -0,0 +1,35 @@
+# gitcontrol 모듈은 서로를 같은 폴더 모듈로 불러오므로 (import gitignore 등) 그 폴더를 경로에 추가
+# 여기 테스트는 Qt 와 네트워크 없이 실행됨: python -m pytest -q gitcontrol/tests
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def clones(tmp_path, monkeypatch):
+    # 로컬 bare 원격 + 클론 두 개 (네트워크 없음). 사용자 설정이 끼어들지 않도록 HOME 을 비우고 작성자를 환경 변수로
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    monkeypatch.setenv('XDG_CONFIG_HOME', str(tmp_path / 'config'))
+    for role in ('AUTHOR', 'COMMITTER'):
+        monkeypatch.setenv(f'GIT_{role}_NAME', 'test')
+        monkeypatch.setenv(f'GIT_{role}_EMAIL', 'test@example.com')
+    origin = tmp_path / 'origin.git'
+    subprocess.run(['git', 'init', '-q', '--bare', '-b', 'main', str(origin)], check=True)
+    seed = tmp_path / 'seed'
+    subprocess.run(['git', 'clone', '-q', str(origin), str(seed)], check=True, capture_output=True)
+    for rel_path in ('a.txt', 'dir/b.txt', 'dir/c.txt'):
+        path = seed / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel_path)
+    subprocess.run(['git', 'add', '-A'], cwd=seed, check=True)
+    subprocess.run(['git', 'commit', '-q', '-m', 'init'], cwd=seed, check=True)
+    subprocess.run(['git', 'push', '-q', 'origin', 'HEAD:main'], cwd=seed, check=True, capture_output=True)
+    work = []
+    for name in ('one', 'two'):
+        subprocess.run(['git', 'clone', '-q', str(origin), str(tmp_path / name)], check=True, capture_output=True)
+        work.append(tmp_path / name)
+    return work
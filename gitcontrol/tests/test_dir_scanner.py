@@ -0,0 +1,57 @@
+import os
+import time
+
+import dir_scanner
+from dir_scanner import list_dir, scan_tree
+
+
+def make_tree(root, paths):
+    for rel_path in paths:
+        path = os.path.join(root, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(rel_path)
+
+
+def test_list_dir_sorts_and_skips_git(tmp_path):
+    make_tree(tmp_path, ['b.txt', 'a.txt', 'sub/c.txt', '.git/HEAD'])
+    assert list_dir(str(tmp_path), '') == ('', ['sub'], ['a.txt', 'b.txt'])
+
+
+def test_scan_tree_lists_parents_before_children(tmp_path):
+    make_tree(tmp_path, ['a/b/c/d.txt', 'a/e.txt', 'f.txt'])
+    listings = [listing for batch in scan_tree(str(tmp_path), batch_interval=0) for listing in batch]
+    order = [rel_dir for rel_dir, _dirs, _files in listings]
+    assert sorted(order) == ['', 'a', 'a/b', 'a/b/c']
+    assert order.index('a') < order.index('a/b') < order.index('a/b/c')
+
+
+def test_scan_tree_does_not_spin_on_slow_dirs(tmp_path, monkeypatch):
+    # 폴더 하나 읽는 데 0.3 초 걸리는 느린 드라이브: 기다리는 동안 wait() 를 헛돌리지 않아야 함
+    make_tree(tmp_path, ['a/x.txt', 'b/y.txt', 'c/z.txt'])
+    calls = []
+    real_wait = dir_scanner.wait
+
+    def slow_list_dir(*args):
+        time.sleep(0.3)
+        return list_dir(*args)
+
+    def counting_wait(*args, **kwargs):
+        calls.append(kwargs.get('timeout'))
+        return real_wait(*args, **kwargs)
+
+    monkeypatch.setattr(dir_scanner, 'list_dir', slow_list_dir)
+    monkeypatch.setattr(dir_scanner, 'wait', counting_wait)
+    cpu = time.process_time()
+    batches = list(scan_tree(str(tmp_path), batch_interval=0.05))
+    cpu = time.process_time() - cpu
+    assert sorted(rel_dir for batch in batches for rel_dir, _, _ in batch) == ['', 'a', 'b', 'c']
+    # 0.6 초 동안 batch_interval(0.05 초) 마다 한 번 정도만 깸
+    assert len(calls) < 40
+    assert cpu < 0.2
+
+
+def test_scan_tree_stops_when_cancelled(tmp_path):
+    make_tree(tmp_path, [f'd{i}/f.txt' for i in range(20)])
+    batches = list(scan_tree(str(tmp_path), cancelled=lambda: True))
+    assert batches == []
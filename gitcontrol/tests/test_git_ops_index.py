@@ -0,0 +1,99 @@
+import pytest
+from git import GitCommandError, Repo
+
+import git_ops
+from git_ops import RemoteRunner, index_changes, index_tree, run_operation
+
+
+def test_index_changes_reports_added_and_removed(clones):
+    one = clones[0]
+    repo = Repo(one)
+    before = index_tree(repo)
+    (one / 'new file.txt').write_text('x')
+    (one / '한글.txt').write_text('y')
+    (one / 'dir' / 'c.txt').write_text('modified')
+    repo.git.add('-A')
+    repo.git.rm('-q', 'dir/b.txt')
+    added, removed = index_changes(repo, before)
+    # 내용만 바뀐 파일은 목록에 없음
+    assert sorted(added) == ['new file.txt', '한글.txt']
+    assert removed == ['dir/b.txt']
+    assert index_changes(repo, index_tree(repo)) == ([], [])
+
+
+def test_upload_then_download_returns_the_delta(clones):
+    one, two = clones
+    (one / 'dir' / 'b.txt').unlink()
+    (one / 'dir' / 'd.txt').write_text('d')
+    (one / 'a.txt').write_text('changed')
+    message, added, removed = run_operation(Repo(one), 'upload', RemoteRunner())
+    assert '완료' in message
+    assert (added, removed) == (['dir/d.txt'], ['dir/b.txt'])
+    # 다른 클론에서 받으면 같은 변경이 보임
+    message, added, removed = run_operation(Repo(two), 'download', RemoteRunner())
+    assert (added, removed) == (['dir/d.txt'], ['dir/b.txt'])
+    assert (two / 'a.txt').read_text() == 'changed'
+
+
+def test_upload_without_changes_does_not_push(clones):
+    one = clones[0]
+    message, added, removed = run_operation(Repo(one), 'upload', RemoteRunner())
+    assert '올릴 변경이 없습니다' in message
+    assert (added, removed) == ([], [])
+
+
+def test_read_only_and_untracked_operations_skip_the_comparison(clones, monkeypatch):
+    one = clones[0]
+
+    def fail(*args):
+        raise AssertionError('index was compared')
+
+    monkeypatch.setattr(git_ops, 'index_tree', fail)
+    monkeypatch.setattr(git_ops, 'tracked_paths', fail)
+    assert run_operation(Repo(one), 'fetch', RemoteRunner())[1:] == ([], [])
+    (one / 'e.txt').write_text('e')
+    message, added, removed = run_operation(Repo(one), 'upload', RemoteRunner(), track_changes=False)
+    assert '완료' in message
+    assert (added, removed) == ([], [])
+
+
+def test_falls_back_to_full_sets_when_index_has_conflicts(clones, monkeypatch):
+    one = clones[0]
+
+    # write-tree 가 실패하는 충돌 상태를 흉내 냄
+    monkeypatch.setattr(git_ops, 'index_tree', lambda repo: None)
+    (one / 'f.txt').write_text('f')
+    (one / 'a.txt').unlink()
+    message, added, removed = run_operation(Repo(one), 'upload', RemoteRunner())
+    assert (added, removed) == (['f.txt'], ['a.txt'])
+
+
+def test_index_tree_is_none_during_a_conflict(clones):
+    one, two = clones
+    for clone, text in ((one, 'one'), (two, 'two')):
+        (clone / 'a.txt').write_text(text)
+    run_operation(Repo(one), 'upload', RemoteRunner())
+    repo = Repo(two)
+    repo.git.commit('-q', '-am', 'two')
+    repo.git.fetch('-q')
+    with pytest.raises(GitCommandError):
+        repo.git.merge('origin/main')
+    assert index_tree(repo) is None
+
+
+def test_download_folders_keeps_uncommitted_changes_unless_overwrite(clones):
+    one, two = clones
+    (one / 'dir' / 'b.txt').write_text('remote')
+    run_operation(Repo(one), 'upload', RemoteRunner())
+    (two / 'dir' / 'b.txt').write_text('local edit')
+    message, _, _ = run_operation(Repo(two), 'download_folders', RemoteRunner(), paths=['dir'])
+    assert '취소' in message and 'dir/b.txt' in message
+    assert (two / 'dir' / 'b.txt').read_text() == 'local edit'
+    run_operation(Repo(two), 'download_folders', RemoteRunner(), paths=['dir'], overwrite=True)
+    assert (two / 'dir' / 'b.txt').read_text() == 'remote'
+    # 로컬 변경이 없으면 확인 없이 받음
+    (one / 'a.txt').write_text('remote a')
+    run_operation(Repo(one), 'upload', RemoteRunner())
+    message, _, _ = run_operation(Repo(two), 'download_folders', RemoteRunner(), paths=['a.txt'])
+    assert '완료' in message
+    assert (two / 'a.txt').read_text() == 'remote a'
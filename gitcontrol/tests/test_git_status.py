@@ -0,0 +1,101 @@
+import io
+import subprocess
+
+from git import Repo
+
+from git_status import (ADDED, CONFLICT, DELETED, IGNORED, MODIFIED, RENAMED, STAGED, UNTRACKED,
+                        iter_records, parse_records, stream_status, xy_flags)
+
+# git status --porcelain=v2 -z 출력 예 (이름에 공백/줄바꿈이 있어도 NUL 로만 나뉨)
+OUTPUT = (b'# branch.oid 0123456789abcdef0123456789abcdef01234567\0'
+          b'# branch.head main\0'
+          b'1 .M N... 100644 100644 100644 aaaa bbbb src/a b.txt\0'
+          b'1 A. N... 000000 100644 100644 0000 cccc new\nline.txt\0'
+          b'1 D. N... 100644 000000 000000 dddd 0000 gone.txt\0'
+          b'2 R. N... 100644 100644 100644 eeee eeee R100 docs/new name.md\0docs/old name.md\0'
+          b'u UU N... 100644 100644 100644 100644 1111 2222 3333 merge.txt\0'
+          b'? notes/todo.txt\0'
+          b'? untracked dir/\0'
+          b'! build/\0')
+
+EXPECTED = [('src/a b.txt', MODIFIED, None),
+            ('new\nline.txt', STAGED | ADDED, None),
+            ('gone.txt', STAGED | DELETED, None),
+            ('docs/new name.md', STAGED | RENAMED, 'docs/old name.md'),
+            ('merge.txt', CONFLICT, None),
+            ('notes/todo.txt', UNTRACKED, None),
+            ('untracked dir/', UNTRACKED, None),
+            ('build/', IGNORED, None)]
+
+
+def git(cwd, *args):
+    subprocess.run(['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+                   cwd=cwd, check=True, capture_output=True)
+
+
+def test_xy_flags():
+    assert xy_flags('..') == 0
+    assert xy_flags('M.') == STAGED
+    assert xy_flags('.M') == MODIFIED
+    assert xy_flags('MM') == STAGED | MODIFIED
+    assert xy_flags('A.') == STAGED | ADDED
+    assert xy_flags('.D') == MODIFIED | DELETED
+    assert xy_flags('C.') == STAGED | RENAMED
+
+
+def test_parse_records():
+    records = OUTPUT.split(b'\0')
+    assert list(parse_records(records)) == EXPECTED
+
+
+def test_parse_records_keeps_undecodable_names():
+    [(path, flags, _)] = parse_records([b'? caf\xe9.txt'])
+    assert flags == UNTRACKED
+    assert path.encode('utf-8', 'surrogateescape') == b'caf\xe9.txt'
+
+
+def test_iter_records_across_chunk_boundaries():
+    whole = OUTPUT.split(b'\0')[:-1]
+    for chunk_size in (1, 2, 3, 7, 64, len(OUTPUT)):
+        assert list(iter_records(io.BytesIO(OUTPUT), chunk_size)) == whole, chunk_size
+    # 마지막 레코드 뒤에 NUL 이 없어도 돌려줌
+    assert list(iter_records(io.BytesIO(b'? a\0? b'), 2)) == [b'? a', b'? b']
+    assert list(iter_records(io.BytesIO(b''))) == []
+
+
+def test_iter_records_stops_when_cancelled():
+    calls = []
+
+    def cancelled():
+        calls.append(1)
+        return len(calls) > 2
+
+    # 두 번 읽는 동안 레코드가 끝나지 않았고 세 번째 확인에서 멈춤
+    assert list(iter_records(io.BytesIO(OUTPUT), 4, cancelled)) == []
+    assert len(calls) == 3
+
+
+def test_stream_status_on_real_repo(tmp_path):
+    git(tmp_path, 'init', '-q')
+    (tmp_path / '.gitignore').write_text('*.log\n')
+    (tmp_path / 'keep.txt').write_text('keep')
+    (tmp_path / 'old name.txt').write_text('rename me')
+    (tmp_path / 'gone.txt').write_text('bye')
+    git(tmp_path, 'add', '-A')
+    git(tmp_path, 'commit', '-q', '-m', 'init')
+    (tmp_path / 'keep.txt').write_text('changed')
+    (tmp_path / 'gone.txt').unlink()
+    git(tmp_path, 'mv', 'old name.txt', 'new name.txt')
+    (tmp_path / 'dir').mkdir()
+    (tmp_path / 'dir' / 'x.txt').write_text('x')
+    (tmp_path / 'debug.log').write_text('log')
+    result = {path: (flags, orig) for path, flags, orig in stream_status(Repo(tmp_path))}
+    assert result == {'keep.txt': (MODIFIED, None),
+                      'gone.txt': (MODIFIED | DELETED, None),
+                      'new name.txt': (STAGED | RENAMED, 'old name.txt'),
+                      'dir/x.txt': (UNTRACKED, None),
+                      'debug.log': (IGNORED, None)}
+    # untracked='normal' 이면 추적 안 된 폴더는 하나로 묶임
+    result = {path: flags for path, flags, _ in stream_status(Repo(tmp_path), untracked='normal', ignored='no')}
+    assert result['dir/'] == UNTRACKED
+    assert 'debug.log' not in result
@@ -0,0 +1,125 @@
+import os
+import subprocess
+
+import pytest
+
+from gitignore import IgnoreRules, compile_rules, parse
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    # 사용자 전역 설정(core.excludesFile)이 끼어들지 않도록 HOME/XDG_CONFIG_HOME 을 비워 둠
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    monkeypatch.setenv('XDG_CONFIG_HOME', str(tmp_path / 'config'))
+    root = tmp_path / 'repo'
+    (root / '.git' / 'info').mkdir(parents=True)
+    return root
+
+
+def write(root, rel_path, text):
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_parse_skips_comments_and_handles_escapes():
+    rules = parse('# comment\n\n\\#hash\n\\!bang\ntrail\\ \nspace   \n!neg\ndir/\n')
+    assert [(negate, dir_only) for _, negate, dir_only, _ in rules] == [
+        (False, False), (False, False), (False, False), (False, False), (True, False), (False, True)]
+    ruleset = compile_rules('\\#hash\n\\!bang\ntrail\\ \nspace   \n')
+    assert ruleset.match('#hash') and ruleset.match('!bang')
+    assert ruleset.match('trail ') and not ruleset.match('trail')
+    assert ruleset.match('space') and not ruleset.match('space   ')
+
+
+def test_later_rule_wins_within_a_file():
+    ruleset = compile_rules('*.log\n!keep.log\n')
+    assert ruleset.match('x.log') is True
+    assert ruleset.match('keep.log') is False
+    assert ruleset.match('a/b/keep.log') is False
+    assert ruleset.match('x.txt') is None
+    # 순서를 바꾸면 뒤의 *.log 가 이김
+    assert compile_rules('!keep.log\n*.log\n').match('keep.log') is True
+
+
+def test_name_rules_match_any_level_and_anchored_rules_do_not():
+    ruleset = compile_rules('build\n/root.txt\ndocs/*.md\n')
+    assert ruleset.match('build') and ruleset.match('a/b/build')
+    assert ruleset.match('root.txt') and ruleset.match('a/root.txt') is None
+    assert ruleset.match('docs/x.md') and ruleset.match('docs/a/x.md') is None
+    assert ruleset.match('a/docs/x.md') is None
+
+
+def test_double_star_and_wildcards():
+    ruleset = compile_rules('**/cache\nlogs/**\na/**/z.tmp\nf?o\n[ab]*.bin\n')
+    assert ruleset.match('cache') and ruleset.match('x/y/cache')
+    assert ruleset.match('logs/a/b') and ruleset.match('logs') is None
+    assert ruleset.match('a/z.tmp') and ruleset.match('a/b/c/z.tmp')
+    assert ruleset.match('foo') and ruleset.match('fo/o') is None
+    assert ruleset.match('b1.bin') and ruleset.match('c1.bin') is None
+
+
+def test_dir_only_rules_skip_files():
+    ruleset = compile_rules('out/\n')
+    assert ruleset.match('out', is_dir=True) is True
+    assert ruleset.match('out', is_dir=False) is None
+
+
+def test_nested_gitignore_takes_precedence_over_parent(repo):
+    write(repo, '.gitignore', '*.log\n')
+    write(repo, 'sub/.gitignore', '!keep.log\n')
+    rules = IgnoreRules(str(repo))
+    assert rules.is_ignored('a.log')
+    assert rules.is_ignored('other/keep.log')
+    assert not rules.is_ignored('sub/keep.log')
+    assert rules.is_ignored('sub/drop.log')
+
+
+def test_gitignore_takes_precedence_over_info_exclude(repo):
+    write(repo, '.git/info/exclude', '*.tmp\nlocal.txt\n')
+    write(repo, '.gitignore', '!keep.tmp\n')
+    rules = IgnoreRules(str(repo))
+    assert rules.is_ignored('x.tmp')
+    assert rules.is_ignored('local.txt')
+    assert not rules.is_ignored('keep.tmp')
+
+
+def test_negation_cannot_reinclude_inside_ignored_folder(repo):
+    write(repo, '.gitignore', 'vendor/\n!vendor/keep.txt\n')
+    rules = IgnoreRules(str(repo))
+    assert rules.is_ignored('vendor', is_dir=True)
+    assert rules.is_ignored('vendor/keep.txt')
+    assert rules.filter_paths(['vendor/', 'src/a.py', 'vendor/keep.txt']) == ['src/a.py']
+
+
+def test_stale_after_gitignore_changes(repo):
+    write(repo, '.gitignore', '*.log\n')
+    rules = IgnoreRules(str(repo))
+    rules.load_dir('')
+    assert not rules.is_stale('')
+    write(repo, '.gitignore', '*.log\n*.tmp\n')
+    os.utime(repo / '.gitignore', ns=(1, 1))
+    assert rules.is_stale('')
+
+
+def test_agrees_with_git_check_ignore(repo):
+    write(repo, '.gitignore', '*.log\n!keep.log\nbuild/\n/root.txt\ndocs/**/*.tmp\n**/cache\na?c\n'
+                              '[ab]*.bin\nsub/x*\n')
+    write(repo, 'sub/.gitignore', 'inner\n!inner.txt\n*.txt\n!keep.txt\n')
+    files = ['x.log', 'keep.log', 'd/keep.log', 'root.txt', 'd/root.txt', 'docs/a/b/c.tmp', 'docs/c.tmp',
+             'abc', 'd/abc', 'a.bin', 'd/b1.bin', 'c.bin', 'sub/xy', 'sub/d/xy', 'sub/inner', 'sub/a.txt',
+             'sub/keep.txt', 'other.txt', 'a/b/c/deep.log']
+    dirs = ['build', 'd/build', 'cache', 'a/cache', 'sub/d']
+    for rel_path in files:
+        write(repo, rel_path, '')
+    for rel_dir in dirs:
+        (repo / rel_dir).mkdir(parents=True, exist_ok=True)
+    subprocess.run(['git', 'init', '-q', str(repo)], check=True)
+    rules = IgnoreRules(str(repo))
+    paths = files + [rel_dir + '/' for rel_dir in dirs]
+    result = subprocess.run(['git', 'check-ignore', '--stdin'], cwd=repo, input='\n'.join(paths),
+                            capture_output=True, text=True)
+    expected = set(result.stdout.splitlines())
+    for path in paths:
+        is_dir = path.endswith('/')
+        assert rules.is_ignored(path.rstrip('/'), is_dir) == (path in expected), path
@@ -0,0 +1,105 @@
+import re
+
+from path_index import BLOCK, PathIndex, fuzzy_to_regex, glob_to_regex, literal_runs
+
+PATHS = ['README.md', 'docs/guide.md', 'docs/api/index.md', 'src/git_gui.py', 'src/git_ops.py',
+         'src/gitignore.py', 'src/tests/test_ops.py', 'assets/Logo.PNG']
+
+
+def many_paths():
+    # 블록 여러 개에 걸치도록 BLOCK 의 몇 배 되는 경로
+    return [f'dir{d}/sub{s}/file{d}_{s}.{ext}' for d in range(20) for s in range(20) for ext in ('py', 'txt')]
+
+
+def brute_force(paths, query, fuzzy=False):
+    query = query.lower()
+    if fuzzy:
+        matcher = fuzzy_to_regex(query).match
+    elif any(c in query for c in '*?['):
+        matcher = glob_to_regex(query).match
+    else:
+        matcher = re.compile(re.escape(query)).search
+    return sorted(path for path in paths if matcher(path.lower()))
+
+
+def test_plain_search_is_case_insensitive_substring():
+    index = PathIndex(PATHS)
+    assert index.search('git') == ['src/git_gui.py', 'src/git_ops.py', 'src/gitignore.py']
+    assert index.search('LOGO') == ['assets/Logo.PNG']
+    assert index.search('  ') == []
+    assert index.search('nothing-like-this') == []
+
+
+def test_glob_search():
+    index = PathIndex(PATHS)
+    assert index.search('*.md') == ['README.md', 'docs/api/index.md', 'docs/guide.md']
+    assert index.search('/docs/*.md') == ['docs/guide.md']
+    assert index.search('docs/**/index.md') == ['docs/api/index.md']
+    assert index.search('src/git_?ui.py') == ['src/git_gui.py']
+    assert index.search('test_[!x]*') == ['src/tests/test_ops.py']
+
+
+def test_fuzzy_search():
+    index = PathIndex(PATHS)
+    assert index.search('ggu', fuzzy=True) == ['src/git_gui.py']
+    assert index.search('gops', fuzzy=True) == ['src/git_ops.py']
+    assert index.search('tstop', fuzzy=True) == ['src/tests/test_ops.py']
+    assert index.search('zz', fuzzy=True) == []
+
+
+def test_literal_runs():
+    assert literal_runs('a*b?c[xy]d', True) == ['a', 'b', 'c', 'd']
+    assert literal_runs('/docs/**/x', True) == ['docs/', '/x']
+    assert literal_runs('plain', False) == ['plain']
+
+
+def test_search_matches_brute_force_across_blocks():
+    paths = many_paths()
+    assert len(paths) > 4 * BLOCK
+    index = PathIndex(paths)
+    for query, fuzzy in [('file3_1', False), ('sub19', False), ('.txt', False), ('*7_7.py', False),
+                         ('/dir1*/sub2/*', False), ('d1s2f', True), ('f99', True), ('x', False)]:
+        assert index.search(query, fuzzy) == brute_force(paths, query, fuzzy), query
+
+
+def test_search_limit():
+    index = PathIndex(many_paths())
+    assert index.search('.py', limit=5) == brute_force(many_paths(), '.py')[:5]
+
+
+def test_update_removes_path_and_subtree():
+    paths = many_paths()
+    index = PathIndex(paths)
+    index.update(removed=['dir1', 'dir2/sub3/file2_3.py'])
+    left = [path for path in paths if not path.startswith('dir1/') and path != 'dir2/sub3/file2_3.py']
+    assert len(index) == len(left)
+    assert index.search('dir1/') == []
+    assert index.search('file2_3') == ['dir2/sub3/file2_3.txt']
+    # 'dir1' 을 지워도 이름이 'dir1' 로 시작하는 다른 폴더(dir10 ...)는 남음
+    assert index.search('dir10/sub0/file10_0.py') == ['dir10/sub0/file10_0.py']
+    assert index.search('file', limit=None) == sorted(left)
+
+
+def test_update_adds_and_readds_paths():
+    index = PathIndex(PATHS)
+    index.update(added=['new/git_new.py', 'a.py', 'a.py'])
+    assert len(index) == len(PATHS) + 2
+    assert index.search('git_') == ['src/git_gui.py', 'src/git_ops.py', 'new/git_new.py']
+    # 원래 색인에 있던 경로를 지웠다가 다시 추가하면 표시만 풀림
+    index.update(removed=['src/git_gui.py'])
+    assert index.search('git_gui') == []
+    index.update(added=['src/git_gui.py'])
+    assert index.search('git_gui') == ['src/git_gui.py']
+    assert len(index) == len(PATHS) + 2
+    # 새로 추가한 경로도 폴더째 지울 수 있음
+    index.update(removed=['new'])
+    assert index.search('git_new') == []
+    assert len(index) == len(PATHS) + 1
+
+
+def test_empty_index():
+    index = PathIndex()
+    assert len(index) == 0
+    assert index.search('a') == []
+    index.update(added=['a.txt'])
+    assert index.search('a') == ['a.txt']
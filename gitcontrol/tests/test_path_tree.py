@@ -0,0 +1,141 @@
+import random
+
+from path_tree import ROOT, PathTree
+
+FILES = ['a/b/c1.txt', 'a/b/c2.txt', 'a/d.txt', 'e/f.txt', 'g.txt']
+
+
+def build(paths=FILES):
+    tree = PathTree()
+    for path in paths:
+        tree.add_file(path)
+    tree.finish_build()
+    return tree
+
+
+def expected_state(tree, node):
+    # 체크 비트와 하위 노드를 직접 훑어서 구한 3상태 (비교용)
+    if tree.is_checked(node):
+        return 2
+    stack = list(tree.children(node))
+    while stack:
+        n = stack.pop()
+        if tree.is_checked(n):
+            return 1
+        stack.extend(tree.children(n))
+    return 0
+
+
+def live_nodes(tree):
+    result, stack = [], list(tree.children(ROOT))
+    while stack:
+        node = stack.pop()
+        result.append(node)
+        stack.extend(tree.children(node))
+    return result
+
+
+def assert_consistent(tree):
+    nodes = live_nodes(tree)
+    assert tree.checked_count() == sum(tree.is_checked(node) for node in nodes)
+    for node in nodes:
+        assert tree.check_state(node) == expected_state(tree, node), tree.path_of(node)
+        # 하위가 있는 폴더는 하위가 모두 체크됐을 때만 체크
+        children = tree.children(node)
+        if children:
+            assert tree.is_checked(node) == all(tree.is_checked(child) for child in children)
+
+
+def test_nothing_checked_initially():
+    tree = build()
+    assert tree.checked_count() == 0
+    assert tree.checked_nodes() == []
+    assert tree.check_state(tree.find('a')) == 0
+
+
+def test_checking_a_file_makes_parents_partial():
+    tree = build()
+    tree.set_checked(tree.find('a/b/c1.txt'), True)
+    assert tree.check_state(tree.find('a/b/c1.txt')) == 2
+    assert tree.check_state(tree.find('a/b')) == 1
+    assert tree.check_state(tree.find('a')) == 1
+    assert tree.check_state(tree.find('e')) == 0
+    assert tree.checked_count() == 1
+    assert tree.checked_paths() == ['a/b/c1.txt']
+
+
+def test_checking_all_children_checks_the_folder():
+    tree = build()
+    tree.set_checked(tree.find('a/b/c1.txt'), True)
+    tree.set_checked(tree.find('a/b/c2.txt'), True)
+    assert tree.check_state(tree.find('a/b')) == 2
+    assert tree.check_state(tree.find('a')) == 1
+    # c1, c2, a/b
+    assert tree.checked_count() == 3
+    assert tree.checked_paths() == ['a/b']
+    tree.set_checked(tree.find('a/d.txt'), True)
+    assert tree.check_state(tree.find('a')) == 2
+    assert tree.checked_paths() == ['a']
+    assert tree.checked_count() == 5
+    assert_consistent(tree)
+
+
+def test_checking_a_folder_checks_its_subtree():
+    tree = build()
+    tree.set_checked(tree.find('a'), True)
+    assert tree.checked_count() == 5
+    assert tree.checked_paths() == ['a']
+    tree.set_checked(tree.find('a/b/c2.txt'), False)
+    assert tree.check_state(tree.find('a')) == 1
+    assert tree.check_state(tree.find('a/b')) == 1
+    assert sorted(tree.checked_paths()) == ['a/b/c1.txt', 'a/d.txt']
+    assert tree.checked_count() == 2
+    assert_consistent(tree)
+
+
+def test_remove_nodes_updates_counts():
+    tree = build()
+    tree.set_checked(tree.find('a/b/c1.txt'), True)
+    tree.set_checked(tree.find('e'), True)
+    # 체크 안 된 형제를 지우면 폴더가 모두 체크된 상태가 됨
+    tree.remove_nodes([tree.find('a/b/c2.txt')])
+    assert tree.check_state(tree.find('a/b')) == 2
+    assert sorted(tree.checked_paths()) == ['a/b', 'e']
+    # 체크된 폴더를 지우면 체크 수에서 빠짐
+    tree.remove_nodes([tree.find('e'), tree.find('e/f.txt')])
+    assert tree.find('e') is None
+    assert tree.checked_paths() == ['a/b']
+    assert tree.checked_count() == 2
+    assert_consistent(tree)
+
+
+def test_new_child_inherits_folder_check():
+    tree = build()
+    tree.set_checked(tree.find('e'), True)
+    # 체크된 폴더 아래에 생긴 항목은 체크 상태를 물려받음
+    node = tree.add_child(tree.find('e'), 'new.txt')
+    assert tree.is_checked(node)
+    assert tree.check_state(tree.find('e')) == 2
+    assert tree.checked_count() == 3
+    # 일부만 체크된 폴더 아래에 생긴 항목은 해제 상태로 생김
+    tree.set_checked(tree.find('a/b/c1.txt'), True)
+    node = tree.add_child(tree.find('a/b'), 'c3.txt')
+    assert not tree.is_checked(node)
+    assert tree.check_state(tree.find('a/b')) == 1
+    assert_consistent(tree)
+
+
+def test_random_operations_stay_consistent():
+    rng = random.Random(7)
+    paths = [f'd{i}/s{j}/f{k}.txt' for i in range(4) for j in range(3) for k in range(3)]
+    tree = build(paths)
+    for step in range(200):
+        nodes = live_nodes(tree)
+        if not nodes:
+            break
+        node = rng.choice(nodes)
+        if step % 10 == 9:
+            tree.remove_nodes([node])
+        else:
+            tree.set_checked(node, rng.random() < 0.6)
+        assert_consistent(tree)
@@ -0,0 +1,62 @@
+import json
+import time
+
+from git import Repo
+
+import prefetch
+from git_ops import RemoteRunner, run_operation
+from prefetch import FOREGROUND_MAX_INTERVAL, MAX_AGE, MAX_INTERVAL, MIN_INTERVAL, Prefetcher
+
+
+def test_foreground_interval_stays_within_max_age():
+    assert MIN_INTERVAL <= FOREGROUND_MAX_INTERVAL < MAX_AGE
+
+
+def test_interval_backs_off_up_to_the_cap(monkeypatch):
+    changed = []
+    monkeypatch.setattr(prefetch, 'prefetch', lambda repo, runner, remote: changed.pop(0))
+    prefetcher = Prefetcher('unused', max_interval=FOREGROUND_MAX_INTERVAL)
+    prefetcher._repo = object()
+    changed.extend([False] * 5)
+    intervals = []
+    for _ in range(5):
+        prefetcher.run()
+        intervals.append(prefetcher.interval)
+    assert intervals == [min(FOREGROUND_MAX_INTERVAL, MIN_INTERVAL * 2 ** (i + 1)) for i in range(5)]
+    # 새 커밋이 있으면 가장 짧게
+    changed.append(True)
+    prefetcher.run()
+    assert prefetcher.interval == MIN_INTERVAL
+
+
+def test_set_max_interval_pulls_in_the_next_run():
+    prefetcher = Prefetcher('unused')
+    prefetcher.interval = MAX_INTERVAL
+    prefetcher.next_run = time.monotonic() + MAX_INTERVAL
+    prefetcher.set_max_interval(FOREGROUND_MAX_INTERVAL)
+    assert prefetcher.interval == FOREGROUND_MAX_INTERVAL
+    assert prefetcher.delay() <= FOREGROUND_MAX_INTERVAL
+    # 상한을 늘릴 때는 다음 실행을 미루지 않음
+    prefetcher.set_max_interval(MAX_INTERVAL)
+    assert prefetcher.interval == FOREGROUND_MAX_INTERVAL
+    assert prefetcher.delay() <= FOREGROUND_MAX_INTERVAL
+
+
+def test_download_merges_a_recent_prefetch_and_pulls_after_max_age(clones):
+    one, two = clones
+    (one / 'a.txt').write_text('first')
+    run_operation(Repo(one), 'upload', RemoteRunner())
+    repo = Repo(two)
+    assert prefetch.prefetch(repo) is True
+    message, _, _ = run_operation(repo, 'download', RemoteRunner())
+    assert 'fetch 생략' in message
+    assert (two / 'a.txt').read_text() == 'first'
+    # MAX_AGE 보다 오래전에 받은 것은 쓰지 않고 pull
+    (one / 'a.txt').write_text('second')
+    run_operation(Repo(one), 'upload', RemoteRunner())
+    prefetch.prefetch(repo)
+    stamp_path = two / '.git' / prefetch.STAMP_FILE
+    stamp_path.write_text(json.dumps({'origin': time.time() - MAX_AGE - 1}))
+    message, _, _ = run_operation(repo, 'download', RemoteRunner())
+    assert 'fetch 생략' not in message
+    assert (two / 'a.txt').read_text() == 'second'
@@ -0,0 +1,85 @@
+from PyQt5.QtCore import QTimer, pyqtSignal
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QCheckBox, QPushButton, QLabel, QTreeWidget, QTreeWidgetItem,
+    QFileDialog
+)
+
+import tracing
+
+# 켜 두었을 때 표를 다시 그리는 간격 (ms)
+REFRESH_INTERVAL = 1000
+
+
+class TimingPanel(QWidget):
+    """작업 시간 측정 패널 (구간별 횟수/합계/최대 시간, 카운터, Chrome trace 내보내기)"""
+    # 상태 표시줄에 보여줄 메시지
+    message = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.enable_check = QCheckBox('시간 측정')
+        self.enable_check.setToolTip('켜 두면 파일 목록 읽기, ls_files, 트리 만들기, add/commit/fetch/push 등의\n'
+                                     '걸린 시간과 전송량을 모읍니다. 내보낸 파일은 chrome://tracing 에서 열 수 있습니다.')
+        self.enable_check.setChecked(tracing.enabled())
+        self.enable_check.toggled.connect(self._on_toggled)
+        self.export_button = QPushButton('내보내기')
+        self.export_button.setMaximumWidth(80)
+        self.export_button.clicked.connect(self.export)
+        self.clear_button = QPushButton('지우기')
+        self.clear_button.setMaximumWidth(60)
+        self.clear_button.clicked.connect(self.clear)
+        self.counter_label = QLabel('')
+        self.counter_label.setStyleSheet('color: #555; font-size: 11px;')
+        self.table = QTreeWidget()
+        self.table.setRootIsDecorated(False)
+        self.table.setHeaderLabels(['구간', '횟수', '합계(ms)', '평균(ms)', '최대(ms)'])
+        self.table.setMaximumHeight(140)
+        self.table.setVisible(tracing.enabled())
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_INTERVAL)
+        self._timer.timeout.connect(self.refresh)
+        if tracing.enabled():
+            self._timer.start()
+        row = QHBoxLayout()
+        row.setContentsMargins(0, 0, 0, 0)
+        row.addWidget(self.enable_check)
+        row.addWidget(self.counter_label, 1)
+        row.addWidget(self.export_button)
+        row.addWidget(self.clear_button)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(row)
+        layout.addWidget(self.table)
+
+    def _on_toggled(self, on):
+        tracing.enable(on)
+        self.table.setVisible(on)
+        if on:
+            self._timer.start()
+        else:
+            self._timer.stop()
+        self.refresh()
+
+    def refresh(self):
+        # 합계 시간이 큰 구간부터
+        self.table.clear()
+        for name, calls, total, longest in tracing.summary():
+            self.table.addTopLevelItem(QTreeWidgetItem(
+                [name, str(calls), f'{total:.1f}', f'{total / calls:.1f}', f'{longest:.1f}']))
+        self.counter_label.setText('  '.join(f'{name}: {value:,}' for name, value in sorted(tracing.counters().items())))
+
+    def clear(self):
+        tracing.clear()
+        self.refresh()
+
+    def export(self):
+        path, _ = QFileDialog.getSaveFileName(self, 'Chrome trace 로 내보내기', 'gitcontrol-trace.json',
+                                              'Chrome trace (*.json)')
+        if not path:
+            return
+        try:
+            count = tracing.export_chrome(path)
+        except OSError as e:
+            self.message.emit(f'내보내기 실패: {e}')
+            return
+        self.message.emit(f'시간 측정 기록 {count}개를 저장했습니다: {path}')
@@ -0,0 +1,147 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# 작업 시간 측정: 이름 붙인 구간(span)과 누적 카운터(바이트 수, 객체 수 등). Qt 비의존
+# 꺼져 있으면 span() 은 미리 만들어 둔 빈 구간을 돌려주고 count() 는 바로 끝나므로 거의 비용이 없음
+# 켜면 최근 MAX_EVENTS 개 구간을 모아 두었다가 Chrome trace-event JSON 으로 내보냄
+# (chrome://tracing 또는 https://ui.perfetto.dev 에서 열기)
+# 환경 변수 GITCONTROL_TRACE=1 이면 시작할 때부터 켬
+
+MAX_EVENTS = 100000
+
+_enabled = os.environ.get('GITCONTROL_TRACE', '') not in ('', '0')
+_lock = threading.Lock()
+# (이름, 스레드 id, 시작 ns, 길이 ns, 인자 dict) - 오래된 것부터 버림
+_spans = deque(maxlen=MAX_EVENTS)
+# (이름, 시각 ns, 누적 값)
+_samples = deque(maxlen=MAX_EVENTS)
+_counters = {}
+_thread_names = {}
+_origin = time.perf_counter_ns()
+
+
+def enabled():
+    return _enabled
+
+
+def enable(on=True):
+    global _enabled
+    _enabled = on
+
+
+def clear():
+    with _lock:
+        _spans.clear()
+        _samples.clear()
+        _counters.clear()
+
+
+class _NullSpan:
+    """측정이 꺼져 있을 때 돌려주는 아무것도 하지 않는 구간"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """측정 중인 구간 하나 (with 블록이 끝날 때 기록)"""
+    __slots__ = ('name', 'args', '_start')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        thread = threading.current_thread()
+        with _lock:
+            _thread_names.setdefault(thread.ident, thread.name)
+            _spans.append((self.name, thread.ident, self._start, end - self._start, self.args))
+        return False
+
+    def set(self, **args):
+        # 구간 도중에 알게 된 값 (파일 수 등)을 인자로 덧붙임
+        self.args.update(args)
+
+
+def span(name, **args):
+    # with tracing.span('walk', root=path) as s: ... s.set(files=n)
+    if not _enabled:
+        return _NULL_SPAN
+    return Span(name, args)
+
+
+def count(name, value=1):
+    # 누적 카운터에 더함 (bytes, objects 등)
+    if not _enabled or not value:
+        return
+    with _lock:
+        total = _counters[name] = _counters.get(name, 0) + value
+        _samples.append((name, time.perf_counter_ns(), total))
+
+
+def counters():
+    with _lock:
+        return dict(_counters)
+
+
+def summary():
+    # 이름별 [이름, 횟수, 합계 ms, 최대 ms] (합계가 큰 순)
+    totals = {}
+    with _lock:
+        spans = list(_spans)
+    for name, _tid, _start, duration, _args in spans:
+        row = totals.get(name)
+        if row is None:
+            row = totals[name] = [name, 0, 0.0, 0.0]
+        row[1] += 1
+        row[2] += duration / 1e6
+        row[3] = max(row[3], duration / 1e6)
+    return sorted(totals.values(), key=lambda row: -row[2])
+
+
+def chrome_trace():
+    # Chrome trace-event 형식 dict (구간은 'X', 카운터는 'C', 스레드 이름은 'M' 이벤트)
+    pid = os.getpid()
+    with _lock:
+        spans = list(_spans)
+        samples = list(_samples)
+        thread_names = dict(_thread_names)
+    events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+              for tid, name in thread_names.items()]
+    for name, tid, start, duration, args in spans:
+        events.append({'name': name, 'cat': 'gitcontrol', 'ph': 'X', 'pid': pid, 'tid': tid,
+                       'ts': (start - _origin) / 1000, 'dur': duration / 1000,
+                       'args': {key: value if isinstance(value, (int, float, bool)) else str(value)
+                                for key, value in args.items()}})
+    for name, at, total in samples:
+        events.append({'name': name, 'ph': 'C', 'pid': pid, 'ts': (at - _origin) / 1000, 'args': {name: total}})
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def export_chrome(path):
+    # 모아 둔 구간/카운터를 JSON 파일로 저장. 저장한 이벤트 수를 돌려줌
+    trace = chrome_trace()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(trace, f, ensure_ascii=False)
+    return len(trace['traceEvents'])
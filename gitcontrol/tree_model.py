@@ -0,0 +1,307 @@
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor
+
+from path_tree import PathTree, ROOT
+
+
+class PathTreeModel(QAbstractItemModel):
+    """PathTree를 QTreeView에 보여주는 모델 (화면에 보이는 행만 Qt가 요청)"""
+    checked_changed = pyqtSignal()
+    # 지연 로딩으로 폴더 하나를 새로 읽었을 때 (폴더 상대경로)
+    dir_loaded = pyqtSignal(str)
+
+    def __init__(self, header='폴더/파일', status_header=None, status_label=None, parent=None):
+        super().__init__(parent)
+        self._header = header
+        # 상태 열: status_label(상태 바이트) → (표시 문자열, 색상). 없으면 이름 열만 표시
+        self._status_header = status_header
+        self._status_label = status_label
+        self._tree = PathTree()
+        # 지연 로딩: 폴더 상대경로 → (하위 폴더 목록, 파일 목록) 을 돌려주는 함수
+        self._loader = None
+        # 체크 변경 알림은 이벤트 루프로 돌아갈 때 한 번만 (연달아 바뀌어도 checked_changed 는 한 번)
+        self._checked_timer = QTimer(self)
+        self._checked_timer.setSingleShot(True)
+        self._checked_timer.setInterval(0)
+        self._checked_timer.timeout.connect(self.checked_changed)
+
+    def tree(self):
+        return self._tree
+
+    def set_tree(self, tree, loader=None, keep_checked=False):
+        # 스캔 결과(완성된 PathTree)를 한 번에 교체. keep_checked면 체크된 경로를 새 트리로 옮김
+        # (통째로 체크된 폴더는 경로 하나로 옮겨지고, 새 트리에서 하위 전체가 체크됨)
+        if keep_checked:
+            for path in self._tree.checked_paths():
+                node = tree.find(path)
+                if node is not None:
+                    tree.set_checked(node, True)
+        self.beginResetModel()
+        self._tree = tree
+        self._loader = loader
+        self.endResetModel()
+
+    def clear(self):
+        self.set_tree(PathTree())
+
+    def node(self, index):
+        return index.internalId() if index.isValid() else ROOT
+
+    def index_of(self, node):
+        if node == ROOT:
+            return QModelIndex()
+        return self.createIndex(self._tree.row(node), 0, node)
+
+    def rel_path(self, index):
+        return self._tree.path_of(self.node(index))
+
+    def is_dir(self, index):
+        return self._tree.is_dir(self.node(index))
+
+    def checked_paths(self):
+        return self._tree.checked_paths()
+
+    def index_for_path(self, rel_path):
+        # 상대경로의 모델 인덱스 (지연 로딩이면 상위 폴더를 차례로 불러옴). 없으면 잘못된 인덱스
+        tree = self._tree
+        node = ROOT
+        for name in rel_path.split('/'):
+            if not tree.is_loaded(node):
+                self.fetchMore(self.index_of(node))
+            node = tree.find_child(node, name)
+            if node is None:
+                return QModelIndex()
+        return self.index_of(node)
+
+    def _notify_checked(self):
+        self._checked_timer.start()
+
+    # ---- 증분 갱신 (전체 재구성 없이 바뀐 항목만 반영) ----
+    def _ensure_dir(self, rel_path):
+        # 폴더 노드를 찾거나 상위부터 만들어 행 삽입을 알림. 아직 읽지 않은 폴더 아래면 None
+        tree = self._tree
+        node = tree.dir_node(rel_path)
+        if node is not None:
+            return node
+        parent_path, _, name = rel_path.rpartition('/')
+        parent = self._ensure_dir(parent_path) if parent_path else ROOT
+        if parent is None or not tree.is_loaded(parent):
+            return None
+        row = len(tree.children(parent))
+        self.beginInsertRows(self.index_of(parent), row, row)
+        node = tree.add_child(parent, name, is_dir=True)
+        self.endInsertRows()
+        return node
+
+    def add_path(self, rel_path, is_dir=False, loaded=True):
+        # 항목 하나 추가. 부모 폴더를 아직 읽지 않았으면(지연 로딩) 펼칠 때 읽히므로 건너뜀
+        tree = self._tree
+        parent_path, _, name = rel_path.rpartition('/')
+        parent = self._ensure_dir(parent_path) if parent_path else ROOT
+        if parent is None or not tree.is_loaded(parent) or tree.find_child(parent, name) is not None:
+            return None
+        row = len(tree.children(parent))
+        self.beginInsertRows(self.index_of(parent), row, row)
+        node = tree.add_child(parent, name, is_dir=is_dir, loaded=loaded)
+        self.endInsertRows()
+        return node
+
+    def remove_path(self, rel_path, prune_empty=False):
+        # 항목 하나(폴더면 하위 포함) 제거. prune_empty면 비게 된 상위 폴더도 제거 (Git 트리용)
+        tree = self._tree
+        parent_path, _, name = rel_path.rpartition('/')
+        parent = tree.dir_node(parent_path)
+        node = tree.find_child(parent, name) if parent is not None else None
+        if node is None:
+            return
+        was_checked = tree.is_checked(node)
+        row = tree.row(node)
+        self.beginRemoveRows(self.index_of(parent), row, row)
+        tree.remove(node)
+        self.endRemoveRows()
+        if prune_empty and parent != ROOT and not tree.children(parent):
+            self.remove_path(parent_path, prune_empty=True)
+        if was_checked:
+            self._notify_checked()
+
+    def remove_paths(self, rel_paths, prune_empty=False):
+        # 여러 항목을 한 번에 제거 (일괄 삭제/이동 후). 행 제거 알림을 항목마다 보내지 않고
+        # 트리를 한 번 고친 뒤 레이아웃 변경 한 번으로 알림. 사라진 항목의 영구 인덱스는 무효로 바꿈
+        tree = self._tree
+        by_parent = {}
+        for rel_path in rel_paths:
+            parent_path, _, name = rel_path.rpartition('/')
+            by_parent.setdefault(parent_path, []).append(name)
+        nodes = []
+        for parent_path, names in by_parent.items():
+            parent = tree.dir_node(parent_path)
+            if parent is None:
+                continue
+            # 폴더마다 이름 → 노드 사전을 한 번만 만듦 (find_child 는 항목마다 형제 전체를 훑음)
+            children = {tree.name(child): child for child in tree.children(parent)}
+            nodes.extend(children[name] for name in names if name in children)
+        if not nodes:
+            return
+        checked_before = tree.checked_count()
+        self.layoutAboutToBeChanged.emit()
+        tree.remove_nodes(nodes)
+        if prune_empty:
+            # 비게 된 상위 폴더도 제거 (Git 트리용). 한 단계씩 위로
+            parents = {tree.parent(node) for node in nodes}
+            while parents:
+                empty = [p for p in parents if p != ROOT and not tree.is_removed(p) and not tree.children(p)]
+                tree.remove_nodes(empty)
+                parents = {tree.parent(p) for p in empty}
+        old = self.persistentIndexList()
+        new = [QModelIndex() if tree.is_removed(index.internalId())
+               else self.createIndex(tree.row(index.internalId()), index.column(), index.internalId())
+               for index in old]
+        self.changePersistentIndexList(old, new)
+        self.layoutChanged.emit()
+        if tree.checked_count() != checked_before:
+            self._notify_checked()
+
+    def add_files(self, rel_paths):
+        # 여러 파일을 폴더별로 묶어서 추가 (폴더마다 행 삽입 알림 한 번). 아직 읽지 않은 폴더 아래는 건너뜀
+        tree = self._tree
+        by_parent = {}
+        for rel_path in rel_paths:
+            parent_path, _, name = rel_path.rpartition('/')
+            by_parent.setdefault(parent_path, []).append(name)
+        for parent_path in sorted(by_parent):
+            parent = self._ensure_dir(parent_path) if parent_path else ROOT
+            if parent is None or not tree.is_loaded(parent):
+                continue
+            existing = {tree.name(child) for child in tree.children(parent)}
+            names = [name for name in dict.fromkeys(by_parent[parent_path]) if name not in existing]
+            if not names:
+                continue
+            start = len(tree.children(parent))
+            self.beginInsertRows(self.index_of(parent), start, start + len(names) - 1)
+            tree.add_children(parent, (), names)
+            self.endInsertRows()
+
+    def add_listings(self, listings):
+        # 스캔 중에 읽힌 폴더들을 차례로 채움 (폴더마다 행 삽입 알림 한 번). 상위 폴더 항목이 먼저 와야 함
+        tree = self._tree
+        for rel_dir, dirs, files in listings:
+            node = tree.dir_node(rel_dir)
+            if node is None:
+                continue
+            count = len(dirs) + len(files)
+            if not count:
+                tree.add_children(node, (), ())
+                continue
+            start = len(tree.children(node))
+            self.beginInsertRows(self.index_of(node), start, start + count - 1)
+            tree.add_children(node, dirs, files)
+            self.endInsertRows()
+
+    def child_entries(self, rel_path):
+        # 폴더의 현재 자식 목록 {이름: 폴더 여부}. 없거나 아직 읽지 않은 폴더면 None
+        tree = self._tree
+        node = tree.dir_node(rel_path)
+        if node is None or not tree.is_loaded(node):
+            return None
+        return {tree.name(child): tree.is_dir(child) for child in tree.children(node)}
+
+    # ---- QAbstractItemModel ----
+    def index(self, row, column, parent=QModelIndex()):
+        children = self._tree.children(self.node(parent))
+        if 0 <= row < len(children) and 0 <= column < self.columnCount():
+            return self.createIndex(row, column, children[row])
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        return self.index_of(self._tree.parent(index.internalId()))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self._tree.children(self.node(parent)))
+
+    def columnCount(self, parent=QModelIndex()):
+        return 2 if self._status_label is not None else 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node(parent)
+        if not self._tree.is_dir(node):
+            return False
+        return not self._tree.is_loaded(node) or bool(self._tree.children(node))
+
+    def canFetchMore(self, parent):
+        node = self.node(parent)
+        return self._tree.is_dir(node) and not self._tree.is_loaded(node)
+
+    def fetchMore(self, parent):
+        # 폴더를 펼칠 때 한 단계만 불러와서 추가
+        node = self.node(parent)
+        if self._tree.is_loaded(node) or self._loader is None:
+            return
+        rel_path = self._tree.path_of(node)
+        dirs, files = self._loader(rel_path)
+        count = len(dirs) + len(files)
+        if count:
+            start = len(self._tree.children(node))
+            self.beginInsertRows(parent, start, start + count - 1)
+            self._tree.add_children(node, dirs, files)
+            self.endInsertRows()
+        else:
+            self._tree.add_children(node, (), ())
+        self.dir_loaded.emit(rel_path)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalId()
+        if index.column() == 1:
+            status = self._tree.status(node)
+            if not status or role not in (Qt.DisplayRole, Qt.ForegroundRole):
+                return None
+            text, color = self._status_label(status)
+            return text if role == Qt.DisplayRole else QColor(color)
+        if role == Qt.DisplayRole:
+            return self._tree.name(node)
+        if role == Qt.CheckStateRole:
+            return Qt.CheckState(self._tree.check_state(node))
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid() or index.column() > 0:
+            return False
+        tree = self._tree
+        node = index.internalId()
+        # 일부 체크된 폴더를 누르면 하위 전체 체크
+        tree.set_checked(node, value != Qt.Unchecked)
+        roles = [Qt.CheckStateRole]
+        self.dataChanged.emit(index, index, roles)
+        # 상위 폴더는 조상 경로만, 하위는 자식이 있는 폴더마다 한 범위씩 알림
+        parent = tree.parent(node)
+        while parent > ROOT:
+            ancestor = self.index_of(parent)
+            self.dataChanged.emit(ancestor, ancestor, roles)
+            parent = tree.parent(parent)
+        stack = [node]
+        while stack:
+            children = tree.children(stack.pop())
+            if not children:
+                continue
+            self.dataChanged.emit(self.createIndex(0, 0, children[0]),
+                                  self.createIndex(len(children) - 1, 0, children[-1]), roles)
+            stack.extend(child for child in children if tree.is_dir(child))
+        self._notify_checked()
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() > 0:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._header if section == 0 else self._status_header
+        return None